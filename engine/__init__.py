@@ -5,9 +5,14 @@ Python初学者向けローグライク演習フレームワーク
 
 from enum import Enum
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, FrozenSet
 from datetime import datetime
 
+from .trace import get_tracer, DEBUG
+from .line_of_sight import get_board_cache
+
+_trace = get_tracer(__name__)
+
 class Direction(Enum):
     """プレイヤーと敵の向き"""
     NORTH = "N"  # 北（上）
@@ -99,6 +104,27 @@ class TurnPhase(Enum):
     PLAYER = "player"         # プレイヤーターン
     ENEMY = "enemy"           # 敵ターン
 
+# エンティティごとの版数を保持する属性名（スナップショットの記録対象外）
+STATE_VERSION_ATTR = "_state_version"
+
+class _Versioned:
+    """変更のたびに版数が進むエンティティ（キャラクター・アイテム）の共通部分
+    
+    属性の代入を横取りせず、移動・ダメージ・取得などの変更箇所が mark_changed() を呼ぶ。
+    盤上の状態全体の版数は GameState.version が別に持つ。
+    """
+    
+    _state_version = 0
+    
+    @property
+    def state_version(self) -> int:
+        """このエンティティの版数（変更されるたびに増える）"""
+        return self._state_version
+    
+    def mark_changed(self) -> None:
+        """属性を変更したことを記録"""
+        self._state_version += 1
+
 @dataclass
 class RageState:
     """怒りモード状態 - v1.2.8特殊条件付きステージ"""
@@ -142,8 +168,18 @@ class Position:
         """他の位置との距離を計算"""
         return ((self.x - other.x) ** 2 + (self.y - other.y) ** 2) ** 0.5
 
+@dataclass(frozen=True)
+class VisionCone:
+    """敵の視野範囲（描画用の順序付きセル列と判定用の集合）"""
+    cells: Tuple[Position, ...]
+    cell_set: FrozenSet[Position]
+
+# 壁判定なし（board=None）の視野範囲キャッシュ: (位置, 向き, 視野範囲) -> VisionCone
+MAX_VISION_CONES = 4096
+_OPEN_VISION_CONES: Dict[Tuple[Position, Direction, int], VisionCone] = {}
+
 @dataclass
-class Character:
+class Character(_Versioned):
     """キャラクター（プレイヤー・敵共通）"""
     position: Position
     direction: Direction
@@ -176,6 +212,7 @@ class Character:
             return 0
         actual_damage = min(damage, self.hp)
         self.hp -= actual_damage
+        self.mark_changed()
 
         # 攻撃を受けた場合の反応処理
         if actual_damage > 0 and attacker_position is not None:
@@ -215,12 +252,14 @@ class Character:
             return 0
         actual_heal = min(amount, self.max_hp - self.hp)
         self.hp += actual_heal
+        self.mark_changed()
         return actual_heal
 
     def add_disposed_item(self, item_id: str):
         """アイテムを処分済みリストに追加（重複チェック付き）"""
         if item_id not in self.disposed_items:
             self.disposed_items.append(item_id)
+            self.mark_changed()
 
     def hp_percentage(self) -> float:
         """HP割合を返す"""
@@ -244,6 +283,7 @@ class Character:
 
         # スタミナ減少（最小0）
         self.stamina = max(0, self.stamina - amount)
+        self.mark_changed()
 
         # スタミナ枯渇時は即死
         if self.stamina <= 0:
@@ -268,6 +308,7 @@ class Character:
         # 回復量を計算（max_staminaを超えない）
         actual_recovery = min(amount, self.max_stamina - self.stamina)
         self.stamina += actual_recovery
+        self.mark_changed()
 
         return actual_recovery
 
@@ -348,22 +389,40 @@ class Enemy(Character):
     
     def can_see_player(self, player_position: Position, board=None) -> bool:
         """プレイヤーを視野範囲内で視認できるかどうか（get_vision_cellsと完全に同じ基準を使用）"""
-        vision_cells = self.get_vision_cells(board=board)
-        result = player_position in vision_cells
+        cone = self.get_vision_cone(board=board)
+        result = player_position in cone.cell_set
 
         # デバッグログ: 背後接敵問題調査用
-        if hasattr(self, 'id') and self.id == "guard_1":
-            print(f"🔍 [DEBUG] 敵{self.id} 視界判定:")
-            print(f"   敵位置: [{self.position.x},{self.position.y}] 向き: {self.direction.value}")
-            print(f"   プレイヤー位置: [{player_position.x},{player_position.y}]")
-            print(f"   vision_range: {self.vision_range}")
-            print(f"   視界セル: {[(cell.x, cell.y) for cell in vision_cells]}")
-            print(f"   検出結果: {result}")
+        if _trace.is_enabled(DEBUG) and getattr(self, 'id', None) == "guard_1":
+            _trace.debug("🔍 [DEBUG] 敵%s 視界判定: 敵位置[%s,%s] 向き:%s プレイヤー位置[%s,%s] "
+                         "vision_range:%s 視界セル:%s 検出結果:%s",
+                         self.id, self.position.x, self.position.y, self.direction.value,
+                         player_position.x, player_position.y, self.vision_range,
+                         [(cell.x, cell.y) for cell in cone.cells], result)
 
         return result
     
     def get_vision_cells(self, board=None) -> List[Position]:
         """視野範囲内のセル一覧を取得（壁による視線遮蔽を考慮）"""
+        return list(self.get_vision_cone(board=board).cells)
+    
+    def get_vision_cone(self, board=None) -> "VisionCone":
+        """視野範囲を取得（位置・向き・視野範囲・ボード単位でキャッシュ）
+        
+        ボードごとのキャッシュはボードの視線キャッシュと同じ寿命で、ボードが差し替えられると作り直される。
+        """
+        cones = get_board_cache(board).cones if board is not None else _OPEN_VISION_CONES
+        key = (self.position, self.direction, self.vision_range)
+        cone = cones.get(key)
+        if cone is None:
+            cone = self._compute_vision_cone(board)
+            if len(cones) >= MAX_VISION_CONES:
+                cones.clear()
+            cones[key] = cone
+        return cone
+    
+    def _compute_vision_cone(self, board=None) -> "VisionCone":
+        """視野範囲を計算"""
         cells = []
         
         for distance in range(1, self.vision_range + 1):
@@ -386,50 +445,13 @@ class Enemy(Character):
                     if has_los:
                         cells.append(target_pos)
         
-        return cells
+        return VisionCone(tuple(cells), frozenset(cells))
     
     def _has_line_of_sight(self, target_pos: Position, board) -> bool:
-        """指定位置への視線が遮られていないかチェック"""
-        # 簡易的な視線判定：直線上に壁があるかチェック
-        start_x, start_y = self.position.x, self.position.y
-        end_x, end_y = target_pos.x, target_pos.y
-        
-        # ブレゼンハムアルゴリズムの簡易版で視線をトレース
-        dx = abs(end_x - start_x)
-        dy = abs(end_y - start_y)
-        
-        x, y = start_x, start_y
-        step_x = 1 if start_x < end_x else -1
-        step_y = 1 if start_y < end_y else -1
-        
-        if dx > dy:
-            err = dx / 2.0
-            while x != end_x:
-                x += step_x
-                err -= dy
-                if err < 0:
-                    y += step_y
-                    err += dx
-                # 中間点が壁かチェック（目標地点は除く）
-                if x != end_x or y != end_y:
-                    check_pos = Position(x, y)
-                    if check_pos in board.walls:
-                        return False
-        else:
-            err = dy / 2.0
-            while y != end_y:
-                y += step_y
-                err -= dx
-                if err < 0:
-                    x += step_x
-                    err += dy
-                # 中間点が壁かチェック（目標地点は除く）
-                if x != end_x or y != end_y:
-                    check_pos = Position(x, y)
-                    if check_pos in board.walls:
-                        return False
-        
-        return True
+        """指定位置への視線が遮られていないかチェック（ボード単位でキャッシュ）"""
+        return get_board_cache(board).has_line_of_sight(
+            self.position.x, self.position.y, target_pos.x, target_pos.y
+        )
     
     def get_next_patrol_position(self) -> Optional[Position]:
         """次の巡回位置を取得"""
@@ -444,6 +466,7 @@ class Enemy(Character):
         """巡回インデックスを進める"""
         if self.patrol_path:
             self.current_patrol_index = (self.current_patrol_index + 1) % len(self.patrol_path)
+            self.mark_changed()
 
     def _initialize_patrol_index(self) -> None:
         """現在位置に基づいて正しい patrol_index を設定"""
@@ -469,7 +492,7 @@ class Enemy(Character):
         self.current_patrol_index = closest_index
 
 @dataclass
-class Item:
+class Item(_Versioned):
     """アイテム"""
     id: str
     item_type: str
@@ -500,6 +523,11 @@ class Item:
         if not isinstance(self.effect, dict):
             raise ValueError("効果は辞書形式である必要があります")
 
+# セル種別フラグ（Board.cell_gridの1バイト値, ビット和で重複を表現）
+CELL_EMPTY = 0
+CELL_WALL = 1
+CELL_FORBIDDEN = 2
+
 @dataclass
 class Board:
     """ゲームボード"""
@@ -507,11 +535,40 @@ class Board:
     height: int
     walls: List[Position]
     forbidden_cells: List[Position]
+    # セル種別グリッド（1セル1バイト, インデックス = y * width + x）
+    # StageLoaderで構築済みのものを渡せば再構築を省略できる
+    cell_grid: Optional[bytes] = field(default=None, repr=False, compare=False)
+    # 視線判定キャッシュ（line_of_sight.get_board_cacheが初回参照時に作成）
+    _los_cache: Optional[Any] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """バリデーション"""
         if self.width <= 0 or self.height <= 0:
             raise ValueError("ボードサイズは1以上である必要があります")
+        if (not isinstance(self.cell_grid, (bytes, bytearray))
+                or len(self.cell_grid) != self.width * self.height):
+            self.cell_grid = Board.build_cell_grid(
+                self.width, self.height, self.walls, self.forbidden_cells
+            )
+    
+    @staticmethod
+    def build_cell_grid(width: int, height: int, walls: List[Position],
+                        forbidden_cells: List[Position]) -> bytes:
+        """壁・移動禁止マスのリストからセル種別グリッドを構築"""
+        grid = bytearray(width * height)
+        for pos in walls:
+            if 0 <= pos.x < width and 0 <= pos.y < height:
+                grid[pos.y * width + pos.x] |= CELL_WALL
+        for pos in forbidden_cells:
+            if 0 <= pos.x < width and 0 <= pos.y < height:
+                grid[pos.y * width + pos.x] |= CELL_FORBIDDEN
+        return bytes(grid)
+    
+    def get_cell(self, pos) -> int:
+        """指定座標のセル種別フラグを取得（範囲外はCELL_EMPTY）"""
+        if 0 <= pos.x < self.width and 0 <= pos.y < self.height:
+            return self.cell_grid[pos.y * self.width + pos.x]
+        return CELL_EMPTY
     
     def is_valid_position(self, pos):
         """有効な座標かチェック"""
@@ -519,17 +576,111 @@ class Board:
     
     def is_wall(self, pos):
         """壁かどうかチェック"""
+        if 0 <= pos.x < self.width and 0 <= pos.y < self.height:
+            return bool(self.cell_grid[pos.y * self.width + pos.x] & CELL_WALL)
+        # 範囲外の座標はリストで判定（従来互換）
         return pos in self.walls
     
     def is_forbidden(self, pos):
         """移動不可マスかどうかチェック"""
+        if 0 <= pos.x < self.width and 0 <= pos.y < self.height:
+            return bool(self.cell_grid[pos.y * self.width + pos.x] & CELL_FORBIDDEN)
         return pos in self.forbidden_cells
     
     def is_passable(self, pos):
         """通行可能かチェック"""
-        return (self.is_valid_position(pos) and 
-                not self.is_wall(pos) and 
-                not self.is_forbidden(pos))
+        if 0 <= pos.x < self.width and 0 <= pos.y < self.height:
+            return self.cell_grid[pos.y * self.width + pos.x] == CELL_EMPTY
+        return False
+
+class SpatialIndex:
+    """座標→敵・アイテムの索引（GameStateの「このマスに何があるか」照会用）
+    
+    GameStateごとに持ち、GameStateの move_enemy / remove_enemy / remove_item が旧座標の削除と
+    新座標の登録だけで差分更新する。同じマスに複数のエンティティがいる場合は先に登録されたものを返し、
+    2体目以降は ``stacked_*`` に退避しておく（先頭が抜けたら繰り上げ）。
+    敵・アイテムのリストが直接編集された場合（構成キーの不一致）だけ次の照会時に作り直す。
+    """
+    
+    __slots__ = ("key", "enemies", "items", "stacked_enemies", "stacked_items")
+    
+    def __init__(self):
+        self.key = None
+        self.enemies: Dict[Position, "Enemy"] = {}
+        self.items: Dict[Position, "Item"] = {}
+        self.stacked_enemies: Dict[Position, List["Enemy"]] = {}
+        self.stacked_items: Dict[Position, List["Item"]] = {}
+    
+    @staticmethod
+    def key_for(enemies: List["Enemy"], items: List["Item"]) -> Tuple[int, int, int, int]:
+        return (id(enemies), len(enemies), id(items), len(items))
+    
+    @staticmethod
+    def enemy_cells(enemy: "Enemy"):
+        """敵の占有セル（1x1の敵はリストを作らない）"""
+        if enemy.enemy_type in _SINGLE_CELL_ENEMY_TYPES:
+            return (enemy.position,)
+        return enemy.get_occupied_positions()
+    
+    @staticmethod
+    def _insert(primary: Dict[Position, Any], stacked: Dict[Position, List[Any]], pos: Position, entity: Any) -> None:
+        if primary.setdefault(pos, entity) is not entity:
+            stacked.setdefault(pos, []).append(entity)
+    
+    @staticmethod
+    def _discard(primary: Dict[Position, Any], stacked: Dict[Position, List[Any]], pos: Position, entity: Any) -> None:
+        others = stacked.get(pos)
+        if primary.get(pos) is entity:
+            if others:
+                primary[pos] = others.pop(0)
+                if not others:
+                    del stacked[pos]
+            else:
+                del primary[pos]
+        elif others:
+            for i, other in enumerate(others):
+                if other is entity:
+                    del others[i]
+                    break
+            if not others:
+                del stacked[pos]
+    
+    def add_enemy(self, enemy: "Enemy") -> None:
+        for pos in SpatialIndex.enemy_cells(enemy):
+            SpatialIndex._insert(self.enemies, self.stacked_enemies, pos, enemy)
+    
+    def discard_enemy(self, enemy: "Enemy") -> None:
+        for pos in SpatialIndex.enemy_cells(enemy):
+            SpatialIndex._discard(self.enemies, self.stacked_enemies, pos, enemy)
+    
+    def add_item(self, item: "Item") -> None:
+        SpatialIndex._insert(self.items, self.stacked_items, item.position, item)
+    
+    def discard_item(self, item: "Item") -> None:
+        SpatialIndex._discard(self.items, self.stacked_items, item.position, item)
+    
+    def rebuild(self, enemies: List["Enemy"], items: List["Item"]) -> None:
+        """リスト順で先に見つかったエンティティを優先して索引を作り直す"""
+        self.enemies = {}
+        self.items = {}
+        self.stacked_enemies = {}
+        self.stacked_items = {}
+        for enemy in enemies:
+            self.add_enemy(enemy)
+        for item in items:
+            self.add_item(item)
+        self.key = SpatialIndex.key_for(enemies, items)
+
+# 1マスだけを占有する敵種別
+_SINGLE_CELL_ENEMY_TYPES = frozenset((EnemyType.NORMAL, EnemyType.GOBLIN, EnemyType.ORC))
+
+def _remove_identical(entities: List[Any], entity: Any) -> None:
+    """リストから同一オブジェクトを取り除く（dataclassの値比較で別のエンティティを消さないため）"""
+    for i, other in enumerate(entities):
+        if other is entity:
+            del entities[i]
+            return
+    raise ValueError(f"{entity!r} is not in list")
 
 @dataclass
 class GameState:
@@ -545,6 +696,10 @@ class GameState:
     stage_id: Optional[str] = None  # ステージ識別用
     victory_conditions: Optional[List[Dict[str, str]]] = None  # 勝利条件リスト
     constraints: Dict[str, bool] = field(default_factory=dict)  # v1.2.12: ステージ制約条件
+    # 座標→敵・アイテムの索引（move_enemy/remove_enemy/remove_itemが差分更新）
+    _spatial_index: SpatialIndex = field(default_factory=SpatialIndex, init=False, repr=False, compare=False)
+    # 状態の版数（移動・ダメージ・取得・ターン経過・状態変化の各処理が進める）
+    _version: int = field(default=0, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """バリデーション"""
@@ -553,6 +708,27 @@ class GameState:
         if self.turn_count < 0:
             raise ValueError("ターン数は0以上である必要があります")
     
+    @property
+    def version(self) -> int:
+        """この状態の版数（前回から何も変わっていなければ同じ値を返す）
+        
+        移動・ダメージ・アイテム取得・ターン経過・状態変化を行う処理が mark_changed() などで進める。
+        属性を直接書き換えた場合は mark_changed() を呼ぶこと。
+        """
+        return self._version
+    
+    def mark_changed(self, *entities) -> None:
+        """状態（と指定したエンティティ）が変化したことを記録"""
+        self._version += 1
+        for entity in entities:
+            entity.mark_changed()
+    
+    def set_status(self, status: GameStatus) -> None:
+        """ゲーム状態を変更"""
+        if self.status != status:
+            self.status = status
+            self._version += 1
+    
     def is_game_over(self):
         """ゲーム終了判定"""
         return self.status != GameStatus.PLAYING
@@ -560,6 +736,7 @@ class GameState:
     def increment_turn(self):
         """ターン数を増加"""
         self.turn_count += 1
+        self._version += 1
         if self.turn_count >= self.max_turns:
             self.status = GameStatus.TIMEOUT
     
@@ -641,17 +818,46 @@ class GameState:
 
     def get_item_at(self, pos):
         """指定座標のアイテムを取得"""
-        for item in self.items:
-            if item.position == pos:
-                return item
-        return None
+        return self._get_spatial_index().items.get(pos)
     
     def get_enemy_at(self, pos):
-        """指定座標の敵を取得"""
-        for enemy in self.enemies:
-            if pos in enemy.get_occupied_positions():
-                return enemy
-        return None
+        """指定座標の敵を取得（大型敵は占有する全マスで見つかる）"""
+        return self._get_spatial_index().enemies.get(pos)
+    
+    def move_enemy(self, enemy: Enemy, position: Position) -> None:
+        """敵を移動（空間インデックスは旧座標の削除と新座標の登録だけで更新）"""
+        index = self._get_spatial_index()
+        index.discard_enemy(enemy)
+        enemy.position = position
+        index.add_enemy(enemy)
+        self.mark_changed(enemy)
+    
+    def remove_enemy(self, enemy: Enemy) -> None:
+        """敵を盤上から取り除く（撃破・消滅）"""
+        index = self._get_spatial_index()
+        _remove_identical(self.enemies, enemy)
+        index.discard_enemy(enemy)
+        index.key = SpatialIndex.key_for(self.enemies, self.items)
+        self._version += 1
+    
+    def remove_item(self, item: Item) -> None:
+        """アイテムを盤上から取り除く（取得・処分）"""
+        index = self._get_spatial_index()
+        _remove_identical(self.items, item)
+        index.discard_item(item)
+        index.key = SpatialIndex.key_for(self.enemies, self.items)
+        self._version += 1
+    
+    def reindex(self) -> None:
+        """敵・アイテムの位置や構成をまとめて書き換えた後に索引を作り直す"""
+        self._spatial_index.rebuild(self.enemies, self.items)
+        self._version += 1
+    
+    def _get_spatial_index(self) -> SpatialIndex:
+        index = self._spatial_index
+        if index.key != SpatialIndex.key_for(self.enemies, self.items):
+            index.rebuild(self.enemies, self.items)
+        return index
 
 @dataclass
 class Stage:
@@ -675,6 +881,7 @@ class Stage:
     player_stamina: Optional[int] = None  # v1.2.13: ステージ固有のスタミナ
     player_max_stamina: Optional[int] = None  # v1.2.13: ステージ固有の最大スタミナ
     victory_conditions: Optional[List[Dict[str, str]]] = None  # 勝利条件リスト
+    cell_grid: Optional[bytes] = field(default=None, repr=False, compare=False)  # Board用セル種別グリッド
     
     def __post_init__(self):
         """バリデーション"""
@@ -986,6 +1193,7 @@ class SpeedDegradationError(Enhanced7StageSpeedControlError):
 __all__ = [
     "Direction", "GameStatus", "ItemType", "EnemyType", "ExecutionMode",
     "Position", "Character", "Enemy", "Item", "Board",
+    "CELL_EMPTY", "CELL_WALL", "CELL_FORBIDDEN",
     "GameState", "Stage", "LogEntry", "ExecutionState", "ActionHistoryEntry",
     # 🆕 v1.2.1: 新規データモデル
     "ExecutionStateDetail", "PauseRequest", "ResetResult", "StepResult", "ActionBoundary",
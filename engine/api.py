@@ -19,7 +19,7 @@ from .educational_errors import handle_educational_error, ErrorHandler
 from .quality_assurance import QualityAssuranceManager, generate_quality_report
 from .progress_analytics import ProgressAnalyzer, analyze_student_progress
 from .educational_feedback import (
-    EducationalFeedbackGenerator, AdaptiveHintSystem, 
+    EducationalFeedbackGenerator, AdaptiveHintSystem, InfiniteLoopDetector,
     generate_educational_feedback, detect_infinite_loop
 )
 from .data_uploader import initialize_data_uploader, get_data_uploader
@@ -31,9 +31,13 @@ from .commands import (
 from .action_history_tracker import ActionHistoryTracker, ActionTrackingError
 from .execution_controller import ExecutionController
 from .session_log_manager import SessionLogManager
+from .spilling_history import SpillingHistory
 
 logger = logging.getLogger(__name__)
 
+# API呼び出し履歴をメモリに保持する件数（超えた分は一時ファイルへ退避）
+CALL_HISTORY_MEMORY_LIMIT = 1000
+
 
 class APIUsageError(Exception):
     """API使用エラー"""
@@ -52,7 +56,11 @@ class APILayer:
         self.renderer_type = renderer_type
         self.current_stage_id: Optional[str] = None
         self.allowed_apis: List[str] = []
-        self.call_history: List[Dict[str, Any]] = []
+        # 直近分のみメモリに保持し、古い呼び出しは一時ファイルへ退避（長時間実行でもメモリ一定）
+        self.call_history: SpillingHistory = SpillingHistory(CALL_HISTORY_MEMORY_LIMIT)
+        # 無限ループ検出: API呼び出しごとに逐次判定し、最初に検出した結果を保持
+        self.loop_detector = InfiniteLoopDetector()
+        self.loop_info: Optional[Dict[str, Any]] = None
         self._lock = threading.Lock()
         self.auto_render = True  # 自動レンダリングフラグ
         
@@ -171,7 +179,8 @@ class APILayer:
                 width=stage.board_size[0],
                 height=stage.board_size[1],
                 walls=stage.walls,
-                forbidden_cells=stage.forbidden_cells
+                forbidden_cells=stage.forbidden_cells,
+                cell_grid=stage.cell_grid
             )
             
             # ゲーム初期化
@@ -203,6 +212,8 @@ class APILayer:
                 self.allowed_apis.append("get_stamina")
 
             self.call_history.clear()
+            self.loop_detector.reset()
+            self.loop_info = None
             
             # 進捗管理: ステージ挑戦開始
             if self.progression_manager and self.student_id:
@@ -246,6 +257,8 @@ class APILayer:
                 "timestamp": current_time.isoformat(),
                 "turn": self.game_manager.get_turn_count() if self.game_manager else 0
             })
+            if self.loop_info is None:
+                self.loop_info = self.loop_detector.add_action(api_name, None, current_time)
             
             # 進捗管理: アクション記録
             if self.progression_manager:
@@ -286,14 +299,13 @@ class APILayer:
                 mode_value in ['stepping', 'paused']  # STEPPINGまたはPAUSEDモード（Step後にPAUSEDになるため）
             )
             
-            # solve()関数実行中の判定（スレッド名で判定）
-            import threading
-            current_thread = threading.current_thread()
-            is_solve_thread = current_thread.name.startswith('Thread-') and current_thread != threading.main_thread()
+            # solve()関数実行中の判定（ExecutionControllerのsolve()実行コンテキストで判定）
+            is_in_solve_context = getattr(self.execution_controller, 'is_in_solve_context', None)
+            in_solve = callable(is_in_solve_context) and is_in_solve_context() is True
             
             should_skip_loop_check = (
                 recent_step_execution or  # Step実行関連
-                is_solve_thread  # solve()スレッド実行中
+                in_solve  # solve()実行中
             )
             
             if len(self.call_history) >= 10 and not should_skip_loop_check:
@@ -358,9 +370,7 @@ class APILayer:
             logger.info(f"🔍 最終チェック: 無限ループ検出スキップ (step_active={is_step_active}, mode={mode_value})")
             return
         
-        from .educational_feedback import detect_infinite_loop
-        
-        loop_info = detect_infinite_loop(self.call_history)
+        loop_info = self.loop_info
         if loop_info:
             print(f"\n⚠️ 無限ループの可能性が検出されました!")
             print(f"パターン: {loop_info.get('pattern', 'N/A')}")
@@ -376,6 +386,11 @@ class APILayer:
     
     def _render_current_state(self) -> None:
         """現在の状態をレンダリング"""
+        # 最高速モード中はアクションごとに描画せず、GUIループの描画に任せる
+        is_max_speed_running = getattr(self.execution_controller, 'is_max_speed_running', None)
+        if callable(is_max_speed_running) and is_max_speed_running() is True:
+            return
+        
         if self.renderer and self.game_manager:
             game_state = self.game_manager.get_current_state()
             if game_state:
@@ -1698,7 +1713,7 @@ def initialize_api(renderer_type: str = "cui", enable_progression: bool = True,
     """グローバルAPIを指定されたレンダラータイプで初期化
     
     Args:
-        renderer_type: "cui" または "gui"
+        renderer_type: "cui"、"gui" または "headless"
         enable_progression: 進捗管理を有効にするか
         enable_session_logging: セッションログを有効にするか
         student_id: 学生ID（指定された場合は自動設定）
@@ -2215,13 +2230,11 @@ def detect_learning_patterns() -> List[str]:
     Returns:
         List[str]: 検出されたパターンのリスト
     """
-    from .educational_feedback import detect_infinite_loop
-    
     api_history = _global_api.call_history
     patterns = []
     
-    # 無限ループ検出
-    loop_info = detect_infinite_loop(api_history)
+    # 無限ループ検出（API呼び出しごとに逐次判定済みの結果）
+    loop_info = _global_api.loop_info
     if loop_info:
         patterns.append(f"無限ループパターン: {loop_info.get('type', 'unknown')}")
     
@@ -4,8 +4,9 @@
 """
 
 from abc import ABC, abstractmethod
+from collections import deque
 from dataclasses import dataclass
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Deque, Dict, List, Tuple
 from enum import Enum
 import logging
 
@@ -137,6 +138,7 @@ class TurnLeftCommand(Command):
         
         # 実際に回転を実行
         game_state.player.direction = new_direction
+        game_state.mark_changed(game_state.player)
         
         result = ExecutionResult(
             result=CommandResult.SUCCESS,
@@ -157,6 +159,7 @@ class TurnLeftCommand(Command):
             return False
         
         game_state.player.direction = game_state.player.direction.turn_right()
+        game_state.mark_changed(game_state.player)
         self.executed = False
         return True
     
@@ -178,6 +181,7 @@ class TurnRightCommand(Command):
         
         # 実際に回転を実行
         game_state.player.direction = new_direction
+        game_state.mark_changed(game_state.player)
         
         result = ExecutionResult(
             result=CommandResult.SUCCESS,
@@ -198,6 +202,7 @@ class TurnRightCommand(Command):
             return False
         
         game_state.player.direction = game_state.player.direction.turn_left()
+        game_state.mark_changed(game_state.player)
         self.executed = False
         return True
     
@@ -236,6 +241,7 @@ class MoveCommand(Command):
             # 移動実行
             new_position = movement_result.target_position
             player.position = new_position
+            game_state.mark_changed(player)
             result = ExecutionResult(
                 result=CommandResult.SUCCESS,
                 message=f"({old_position.x}, {old_position.y})から({new_position.x}, {new_position.y})に移動しました",
@@ -254,6 +260,7 @@ class MoveCommand(Command):
         
         if self.result and self.result.old_position:
             game_state.player.position = self.result.old_position
+            game_state.mark_changed(game_state.player)
             self.executed = False
             return True
         return False
@@ -288,11 +295,12 @@ class AttackCommand(Command):
             # 攻撃実行
             damage = player.attack_power
             actual_damage = enemy.take_damage(damage, attacker_position=player.position)
+            game_state.mark_changed()
             
             defeated = not enemy.is_alive()
             if defeated:
                 # 敵を削除
-                game_state.enemies.remove(enemy)
+                game_state.remove_enemy(enemy)
             
             # カウンター攻撃処理は _process_enemy_turns で統一処理
             # AttackCommand での即座の反撃は無効化（重複攻撃を防ぐ）
@@ -361,7 +369,7 @@ class PickupCommand(Command):
             item = items_at_position[0]
 
             # アイテム取得実行
-            game_state.items.remove(item)
+            game_state.remove_item(item)
 
             # v1.2.12: アイテム効果を適用
             damage_taken = 0
@@ -393,6 +401,8 @@ class PickupCommand(Command):
                     player.attack_power += item.effect["attack"]
                 # 他の効果も必要に応じて実装
 
+            game_state.mark_changed(player)
+
             # メッセージ作成
             message = f"{item.name or item.id}を取得しました"
             if auto_equipped:
@@ -528,7 +538,7 @@ class DisposeCommand(Command):
             return result
 
         # アイテムを処分
-        game_state.items.remove(bomb_item)
+        game_state.remove_item(bomb_item)
         game_state.player.add_disposed_item(bomb_item.id)
 
         result = DisposeResult(
@@ -555,28 +565,82 @@ class DisposeCommand(Command):
         return "足元の爆弾アイテムを処分"
 
 
+# 取り消し履歴の既定の最大件数
+DEFAULT_UNDO_DEPTH = 10000
+
+# Commandオブジェクトのまま保持する直近の件数（これを超えた古い分はまとめて圧縮）
+LIVE_COMMAND_WINDOW = 64
+
+# 圧縮済みの取り消し記録: (説明, 実行前のプレイヤー位置・向き)。取り消し不可のコマンドは位置・向きがNone
+UndoSnapshot = Tuple[str, Optional[Tuple[Position, Direction]]]
+
+
 class CommandInvoker:
-    """コマンド実行管理クラス"""
-    
-    def __init__(self):
-        self.history: list[Command] = []
+    """コマンド実行管理クラス
+    
+    直近 LIVE_COMMAND_WINDOW 件（max_depth がそれより小さければ max_depth 件）はCommandオブジェクトの
+    まま保持し、それより古いものはその件数ごとに「説明と実行前のプレイヤー位置・向き」だけの
+    スナップショットへ圧縮する（取り消し処理はいずれもプレイヤーの位置・向きを戻すものであるため）。
+    取り消し可能な件数は全体で max_depth 件までに制限され、1コマンドあたりの処理は履歴の長さによらず一定。
+    """
+    
+    def __init__(self, max_depth: int = DEFAULT_UNDO_DEPTH):
+        self.max_depth = max(max_depth, 0)
+        self._window = max(min(LIVE_COMMAND_WINDOW, self.max_depth), 1)
+        self.history: List[Command] = []
+        self._poses: List[Tuple[Position, Direction]] = []  # historyと並行する実行前の位置・向き
         self.current_index = -1
+        self._snapshots: Deque[UndoSnapshot] = deque()
     
     def execute_command(self, command: Command, game_state: GameState) -> ExecutionResult:
         """コマンドを実行し、履歴に追加"""
+        pose = (game_state.player.position, game_state.player.direction)
         result = command.execute(game_state)
         
-        # 履歴に追加（現在位置以降を削除してから追加）
-        self.history = self.history[:self.current_index + 1]
+        # 履歴に追加（取り消し済みの現在位置以降をその場で切り詰めてから追加）
+        del self.history[self.current_index + 1:]
+        del self._poses[self.current_index + 1:]
         self.history.append(command)
+        self._poses.append(pose)
         self.current_index += 1
         
+        if len(self.history) >= self._window * 2:
+            self._compact()
+        self._trim()
+        
         return result
     
+    def _trim(self) -> None:
+        """取り消し可能な件数が max_depth を超えた分を古いものから破棄"""
+        excess = len(self._snapshots) + len(self.history) - self.max_depth
+        while excess > 0 and self._snapshots:
+            self._snapshots.popleft()
+            excess -= 1
+        if excess > 0:
+            del self.history[:excess]
+            del self._poses[:excess]
+            self.current_index -= excess
+    
+    def _compact(self) -> None:
+        """古いCommandを取り消し用スナップショットへ圧縮"""
+        count = self._window
+        for command, pose in zip(self.history[:count], self._poses[:count]):
+            self._snapshots.append((command.get_description(), pose if command.can_undo() else None))
+        del self.history[:count]
+        del self._poses[:count]
+        self.current_index -= count
+    
     def undo_last_command(self, game_state: GameState) -> bool:
         """最後のコマンドを取り消し"""
         if self.current_index < 0:
-            return False
+            # 圧縮済みの記録から位置・向きを復元
+            if not self._snapshots or self._snapshots[-1][1] is None:
+                return False
+            _, (position, direction) = self._snapshots.pop()
+            game_state.player.position = position
+            game_state.player.direction = direction
+            game_state.mark_changed(game_state.player)
+            return True
         
         command = self.history[self.current_index]
         if command.can_undo():
@@ -589,16 +653,20 @@ class CommandInvoker:
     def can_undo(self) -> bool:
         """取り消し可能かチェック"""
         if self.current_index < 0:
-            return False
+            return bool(self._snapshots) and self._snapshots[-1][1] is not None
         return self.history[self.current_index].can_undo()
     
     def get_history(self) -> list[str]:
-        """実行履歴を取得"""
-        return [cmd.get_description() for cmd in self.history[:self.current_index + 1]]
+        """実行履歴を取得（取り消し履歴の上限を超えた古いものは含まない）"""
+        descriptions = [description for description, _ in self._snapshots]
+        descriptions.extend(cmd.get_description() for cmd in self.history[:self.current_index + 1])
+        return descriptions
     
     def clear_history(self) -> None:
         """履歴をクリア"""
         self.history.clear()
+        self._poses.clear()
+        self._snapshots.clear()
         self.current_index = -1
 
 
@@ -139,7 +139,11 @@ class StudentProfile:
 
 
 class InfiniteLoopDetector:
-    """無限ループ検出器"""
+    """無限ループ検出器
+    
+    アクションを1件ずつ追加するたびに判定する。周期ごとの「L個前と同じアクションが続いている長さ」と
+    直近の実行間隔を逐次更新するため、1件あたりの判定コストは履歴の長さに依存しない。
+    """
     
     def __init__(self, max_history: int = 20, detection_threshold: int = 8):
         self.max_history = max_history
@@ -147,6 +151,13 @@ class InfiniteLoopDetector:
         self.action_history: deque = deque(maxlen=max_history)
         self.position_history: deque = deque(maxlen=max_history)
         self.pattern_cache: Dict[str, int] = {}
+        # 判定対象の周期長（直近detection_threshold件に3回以上収まるもの）
+        self.cycle_lengths = [length for length in range(2, detection_threshold // 2)
+                              if length * 3 <= detection_threshold and length < max_history]
+        # 周期長 -> 末尾から連続して action[k] == action[k - L] が成り立つ件数
+        self.cycle_runs: Dict[int, int] = {length: 0 for length in self.cycle_lengths}
+        # 直近アクション間の実行間隔（秒）
+        self.intervals: deque = deque(maxlen=9)
     
     def add_action(self, action: str, position: Optional[Tuple[int, int]] = None,
                    timestamp: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
@@ -154,7 +165,16 @@ class InfiniteLoopDetector:
         if timestamp is None:
             timestamp = datetime.now()
         
-        self.action_history.append({
+        history = self.action_history
+        for length in self.cycle_lengths:
+            if len(history) >= length and history[-length]['action'] == action:
+                self.cycle_runs[length] += 1
+            else:
+                self.cycle_runs[length] = 0
+        if history:
+            self.intervals.append((timestamp - history[-1]['timestamp']).total_seconds())
+        
+        history.append({
             'action': action,
             'position': position,
             'timestamp': timestamp
@@ -171,16 +191,13 @@ class InfiniteLoopDetector:
         if len(self.action_history) < self.detection_threshold:
             return None
         
-        # アクションシーケンスパターンの検出
-        action_sequence = [entry['action'] for entry in list(self.action_history)[-self.detection_threshold:]]
-        
-        # 循環パターンをチェック
-        for cycle_length in range(2, self.detection_threshold // 2):
-            if self._check_cycle(action_sequence, cycle_length):
+        # 循環パターンをチェック（直近3周期分が同じ並びなら検出）
+        for cycle_length in self.cycle_lengths:
+            if self.cycle_runs[cycle_length] >= cycle_length * 2:
                 return {
                     'type': 'action_cycle',
                     'cycle_length': cycle_length,
-                    'pattern': action_sequence[-cycle_length:],
+                    'pattern': [entry['action'] for entry in list(self.action_history)[-cycle_length:]],
                     'confidence': 0.9
                 }
         
@@ -193,23 +210,6 @@ class InfiniteLoopDetector:
         # 時間ベースのパターンをチェック
         return self._detect_time_based_patterns()
     
-    def _check_cycle(self, sequence: List[str], cycle_length: int) -> bool:
-        """指定された長さの循環パターンをチェック"""
-        if len(sequence) < cycle_length * 3:
-            return False
-        
-        pattern = sequence[-cycle_length:]
-        
-        # パターンが少なくとも3回繰り返されているかチェック
-        repetitions = 0
-        for i in range(len(sequence) - cycle_length, -1, -cycle_length):
-            if i >= 0 and sequence[i:i + cycle_length] == pattern:
-                repetitions += 1
-            else:
-                break
-        
-        return repetitions >= 3
-    
     def _detect_position_cycle(self) -> Optional[Dict[str, Any]]:
         """位置の循環パターンを検出"""
         if len(set(self.position_history)) <= 3:
@@ -230,14 +230,8 @@ class InfiniteLoopDetector:
         if len(self.action_history) < 10:
             return None
         
-        recent_actions = list(self.action_history)[-10:]
-        time_intervals = []
-        
-        for i in range(1, len(recent_actions)):
-            prev_time = recent_actions[i-1]['timestamp']
-            curr_time = recent_actions[i]['timestamp']
-            interval = (curr_time - prev_time).total_seconds()
-            time_intervals.append(interval)
+        # 直近10件のアクション間の9区間
+        time_intervals = list(self.intervals)
         
         # 非常に短い間隔での連続アクション（可能な無限ループ）
         if len(time_intervals) >= 5:
@@ -256,6 +250,8 @@ class InfiniteLoopDetector:
         self.action_history.clear()
         self.position_history.clear()
         self.pattern_cache.clear()
+        self.cycle_runs = {length: 0 for length in self.cycle_lengths}
+        self.intervals.clear()
 
 
 class LearningPatternAnalyzer:
@@ -10,6 +10,9 @@ from enum import Enum
 from typing import List, Dict, Optional, Tuple, Any
 from dataclasses import dataclass
 from . import Enemy, EnemyType, Position, Direction, EnemyMode, RageState
+from .trace import get_tracer
+
+_trace = get_tracer(__name__)
 
 
 class BehaviorPattern(Enum):
@@ -110,6 +113,7 @@ class AdvancedEnemy(Enemy):
     
     def update_state(self, player_position: Position, board) -> None:
         """状態更新"""
+        self.mark_changed()
         # スタン状態の処理
         if self.stun_duration > 0:
             self.current_state = EnemyState.STUNNED
@@ -230,6 +234,7 @@ class AdvancedEnemy(Enemy):
             # 到達したら次のポイントへ
             if self.position == current_target:
                 self.patrol_index = (self.patrol_index + 1) % len(self.ai_config.patrol_points)
+                self.mark_changed()
                 current_target = self.ai_config.patrol_points[self.patrol_index]
             
             # 巡回ポイントに向かって移動
@@ -323,29 +328,6 @@ class AdvancedEnemy(Enemy):
         return {"type": "none", "direction": None, "target": None}
     
     
-    def _has_line_of_sight(self, target: Position, board) -> bool:
-        """視線が通っているか確認"""
-        # Bresenham's line algorithm の簡単な実装
-        dx = abs(target.x - self.position.x)
-        dy = abs(target.y - self.position.y)
-        
-        if dx == 0 and dy == 0:
-            return True
-        
-        steps = max(dx, dy)
-        x_step = (target.x - self.position.x) / steps
-        y_step = (target.y - self.position.y) / steps
-        
-        for i in range(1, steps):
-            check_x = int(self.position.x + x_step * i)
-            check_y = int(self.position.y + y_step * i)
-            check_pos = Position(check_x, check_y)
-            
-            if board.is_wall(check_pos):
-                return False
-        
-        return True
-    
     def _find_next_position_to_target(self, target: Position, board) -> Optional[Position]:
         """目標への最適な次のポジションを見つける"""
         # 簡単なA*アルゴリズム実装
@@ -392,18 +374,18 @@ class AdvancedEnemy(Enemy):
     
     def execute_action(self, action: Dict[str, Any], board) -> bool:
         """行動実行"""
-        print(f"🔧 DEBUG execute_action: 敵[{self.position.x},{self.position.y}]{self.direction.value} アクション={action}")
+        _trace.debug("🔧 DEBUG execute_action: 敵[%s,%s]%s アクション=%s", self.position.x, self.position.y, self.direction.value, action)
 
         if action["type"] == "move" and action["direction"]:
             new_position = self.position.move(action["direction"])
             if board.is_passable(new_position):
-                old_pos = f"[{self.position.x},{self.position.y}]"
+                old_pos = self.position
                 old_dir = self.direction.value
                 self.position = new_position
-                new_pos = f"[{self.position.x},{self.position.y}]"
+                self.mark_changed()
                 # 🔧 移動時は方向変更を行わない（1ターン1アクション制限）
                 # self.direction = action["direction"]
-                print(f"🔧 DEBUG move実行: {old_pos}{old_dir} → {new_pos}{self.direction.value}")
+                _trace.debug("🔧 DEBUG move実行: [%s,%s]%s → [%s,%s]%s", old_pos.x, old_pos.y, old_dir, new_position.x, new_position.y, self.direction.value)
                 return True
 
         elif action["type"] == "turn":
@@ -411,14 +393,16 @@ class AdvancedEnemy(Enemy):
             if action["direction"]:
                 old_dir = self.direction.value
                 self.direction = action["direction"]
-                print(f"🔧 DEBUG turn実行: [{self.position.x},{self.position.y}] {old_dir} → {self.direction.value}")
+                self.mark_changed()
+                _trace.debug("🔧 DEBUG turn実行: [%s,%s] %s → %s", self.position.x, self.position.y, old_dir, self.direction.value)
                 return True
 
         elif action["type"] == "attack":
             if action["direction"]:
                 old_dir = self.direction.value
                 self.direction = action["direction"]
-                print(f"🔧 DEBUG attack実行: [{self.position.x},{self.position.y}] {old_dir} → {self.direction.value}")
+                self.mark_changed()
+                _trace.debug("🔧 DEBUG attack実行: [%s,%s] %s → %s", self.position.x, self.position.y, old_dir, self.direction.value)
             return True
 
         return False
@@ -462,6 +446,7 @@ class AdvancedEnemy(Enemy):
     def apply_stun(self, duration: int) -> None:
         """スタン効果適用"""
         self.stun_duration = duration
+        self.mark_changed()
     
     def get_next_patrol_position(self) -> Optional[Position]:
         """次の巡回位置を取得"""
@@ -477,12 +462,12 @@ class AdvancedEnemy(Enemy):
         """巡回インデックスを進める"""
         if self.patrol_path:
             self.current_patrol_index = (self.current_patrol_index + 1) % len(self.patrol_path)
+            self.mark_changed()
     
     def detect_player(self, player_position: Position) -> bool:
         """プレイヤー検出（get_vision_cellsと同じ方向視界ロジック）"""
         # 基底クラスのget_vision_cellsロジックを使用
-        vision_cells = self.get_vision_cells(board=None)  # 壁判定なしの視界取得
-        return player_position in vision_cells
+        return player_position in self.get_vision_cone(board=None).cell_set  # 壁判定なしの視界
     
     def get_status_info(self) -> Dict[str, Any]:
         """状態情報取得"""
@@ -529,6 +514,7 @@ class AdvancedEnemy(Enemy):
         # 怒り値増加（攻撃を受けたため）
         self.anger_level = min(1.0, self.anger_level + 0.3)
         self.current_state = EnemyState.ATTACKING
+        self.mark_changed()
         
         return {
             "success": True,
@@ -539,6 +525,7 @@ class AdvancedEnemy(Enemy):
     
     def turn_to_player(self, player_position: Position):
         """プレイヤー方向に向きを変更"""
+        self.mark_changed()
         dx = player_position.x - self.position.x
         dy = player_position.y - self.position.y
         
@@ -721,6 +708,7 @@ class LargeEnemySystem:
             enemy.rage_state = RageState()
         
         enemy.enemy_mode = EnemyMode.CALM
+        enemy.mark_changed()
         
         # 怒りモード制御器作成
         self.rage_controllers[enemy_id] = RageModeController(enemy, self)
@@ -759,6 +747,7 @@ class LargeEnemySystem:
         enemy.rage_state.turns_in_rage = 0
         enemy.rage_state.area_attack_executed = False
         enemy.rage_state.transition_turn_count = 1  # 1ターン遷移期間
+        enemy.mark_changed()
     
     def reset_to_calm_mode(self, enemy_id: str) -> None:
         """範囲攻撃後の平常モード復帰"""
@@ -773,6 +762,7 @@ class LargeEnemySystem:
         enemy.rage_state.turns_in_rage = 0
         enemy.rage_state.area_attack_executed = False
         enemy.rage_state.transition_turn_count = 0
+        enemy.mark_changed()
     
     def get_enemy_mode(self, enemy_id: str) -> Optional[str]:
         """敵のモード取得"""
@@ -796,10 +786,12 @@ class LargeEnemySystem:
         if player_position in attack_range:
             damage = enemy.attack_power
             enemy.rage_state.area_attack_executed = True
+            enemy.mark_changed()
             return True, damage
         
         # プレイヤーが範囲外でも攻撃は実行される
         enemy.rage_state.area_attack_executed = True
+        enemy.mark_changed()
         return False, 0
     
     def get_area_attack_range(self, enemy_id: str) -> List[Position]:
@@ -843,6 +835,8 @@ class RageModeController:
     
     def update_rage_turn(self) -> None:
         """怒りモード1ターン遷移ロジック"""
+        self.enemy.mark_changed()
+        
         # 状態遷移中の処理
         if self.enemy.enemy_mode == EnemyMode.TRANSITIONING:
             self.enemy.rage_state.transition_turn_count -= 1
@@ -898,6 +892,7 @@ class SpecialEnemySystem:
         enemy.hp = 10000
         enemy.max_hp = 10000
         enemy.attack_power = 10000
+        enemy.mark_changed()
         
         # 特殊敵登録
         self.special_enemies[enemy_id] = enemy
@@ -921,6 +916,7 @@ class SpecialEnemySystem:
         enemy.enemy_mode = EnemyMode.HUNTING
         enemy.conditional_behavior.violation_detected = True
         enemy.conditional_behavior.hunting_target = target_position
+        enemy.mark_changed()
     
     def auto_eliminate(self, enemy_id: str) -> bool:
         """条件達成時特殊敵消去"""
@@ -933,6 +929,7 @@ class SpecialEnemySystem:
         if self._check_elimination_conditions(enemy):
             # 特殊敵を無力化（HP=0にする）
             enemy.hp = 0
+            enemy.mark_changed()
             return True
         
         return False
@@ -960,6 +957,7 @@ class SpecialEnemySystem:
         
         enemy = self.special_enemies[enemy_id]
         enemy.conditional_behavior.current_sequence = attack_sequence.copy()
+        enemy.mark_changed()
     
     def _check_elimination_conditions(self, enemy: Enemy) -> bool:
         """特殊敵消去条件チェック"""
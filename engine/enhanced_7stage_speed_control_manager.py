@@ -42,6 +42,7 @@ class UltraHighSpeedConfiguration:
     precision_tolerance_ms: float = 5.0
     last_changed: datetime = field(default_factory=datetime.now)
     is_realtime_change: bool = False
+    is_max_speed: bool = False  # 最高速モード（待機なし・描画はGUIループに集約）
     
     def __post_init__(self):
         """バリデーション"""
@@ -108,9 +109,11 @@ class Enhanced7StageSpeedControlManager:
             # 前の設定の実行時間記録
             self._record_speed_usage_time()
             
-            # 新しい設定適用
+            # 新しい設定適用（倍率を選んだ時点で最高速モードは解除）
             old_multiplier = self.config.current_multiplier
             sleep_interval = self.calculate_sleep_interval(multiplier)
+            if self.config.is_max_speed:
+                self._apply_max_speed_mode(False)
             
             self.config.current_multiplier = multiplier
             self.config.sleep_interval = sleep_interval
@@ -209,6 +212,38 @@ class Enhanced7StageSpeedControlManager:
             logger.error(f"❌ リアルタイム速度変更エラー: {e}")
             return False
     
+    def set_max_speed_mode(self, enabled: bool) -> bool:
+        """
+        最高速モード切替
+        
+        最高速モードではアクション間の待機を行わず、solve()スレッドは描画もしない。
+        画面はGUIループがディスプレイ更新ごとに最新状態を1回だけ描画する。
+        
+        Args:
+            enabled: Trueで有効化、Falseで現在の倍率に復帰
+            
+        Returns:
+            bool: 切替成功フラグ
+        """
+        try:
+            self._apply_max_speed_mode(enabled)
+            self.config.last_changed = datetime.now()
+            self.config.is_realtime_change = self.execution_controller.state.is_running
+            
+            if enabled:
+                logger.info("🏎️ 最高速モード有効化: 待機なし・描画はディスプレイ更新ごと")
+            else:
+                logger.info(f"✅ 最高速モード解除: x{self.config.current_multiplier}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"❌ 最高速モード切替エラー: {e}")
+            return False
+    
+    def is_max_speed_mode(self) -> bool:
+        """最高速モード判定"""
+        return self.config.is_max_speed
+    
     def reset_to_default_speed(self) -> None:
         """デフォルト速度（x1）にリセット"""
         logger.info("🔄 速度をデフォルト（x1）にリセット")
@@ -301,6 +336,12 @@ class Enhanced7StageSpeedControlManager:
         if deviation_ms > tolerance:
             logger.warning(f"⚠️ 精度要件未達成: {deviation_ms:.1f}ms > {tolerance}ms (x{self.config.current_multiplier})")
     
+    def _apply_max_speed_mode(self, enabled: bool) -> None:
+        """最高速モードの状態をExecutionControllerに反映"""
+        self.config.is_max_speed = enabled
+        if hasattr(self.execution_controller, 'set_max_speed_mode'):
+            self.execution_controller.set_max_speed_mode(enabled)
+    
     def _record_speed_usage_time(self) -> None:
         """現在の速度での使用時間を記録"""
         if self.current_speed_start_time:
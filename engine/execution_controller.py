@@ -6,10 +6,12 @@
 import threading
 import time
 import logging
+from contextlib import contextmanager
 from typing import Optional
 from datetime import datetime
 
 from . import ExecutionMode, ExecutionState, StepResult
+from .solve_runner import SolveInterrupted
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +27,9 @@ class ExecutionController:
         self.stop_requested = threading.Event()
         self._lock = threading.Lock()
         
+        # 状態変更の通知用条件変数（solve()スレッドはポーリングせずにここで待機する）
+        self._state_changed = threading.Condition()
+        
         # シンプルな制御フラグ
         self.single_step_requested = False
         self.pause_requested = False
@@ -38,6 +43,16 @@ class ExecutionController:
         # step実行中フラグ（無限ループ検出無効化用）
         self.is_step_execution_active = False
         
+        # 最高速モード（連続実行時に待機・描画を行わない）
+        self.max_speed_mode = False
+        
+        # 協調スケジューラ（CooperativeSolveRunner実行中のみ設定）とReset世代番号
+        self._scheduler = None
+        self.reset_generation = 0
+        
+        # solve()実行中のスレッドを示すフラグ（スレッドローカル）
+        self._solve_context = threading.local()
+        
         # 初期状態は一時停止
         self.pause_event.clear()
         self.step_event.clear()
@@ -47,6 +62,53 @@ class ExecutionController:
         
         logger.debug("ExecutionController (シンプル版) 初期化完了")
     
+    def notify_state_change(self) -> None:
+        """待機中のsolve()スレッドに状態変更を通知"""
+        with self._state_changed:
+            self._state_changed.notify_all()
+    
+    def attach_scheduler(self, scheduler) -> None:
+        """協調スケジューラを登録（solve()の待機はスケジューラ経由になる）"""
+        self._scheduler = scheduler
+    
+    def detach_scheduler(self, scheduler) -> None:
+        """協調スケジューラの登録解除"""
+        if self._scheduler is scheduler:
+            self._scheduler = None
+    
+    @contextmanager
+    def solve_context(self):
+        """このブロック内の呼び出しをsolve()実行中として扱う"""
+        self._solve_context.active = True
+        try:
+            yield
+        finally:
+            self._solve_context.active = False
+    
+    def is_in_solve_context(self) -> bool:
+        """現在のスレッドがsolve()を実行中か"""
+        return getattr(self._solve_context, 'active', False)
+    
+    def _cooperative_scheduler(self):
+        """現在のスレッドでsolve()を実行中の協調スケジューラ（なければNone）"""
+        scheduler = self._scheduler
+        if scheduler is not None and scheduler.owns_current_thread():
+            return scheduler
+        return None
+    
+    def _wait_for_state(self, predicate, timeout: Optional[float] = None) -> bool:
+        """状態が条件を満たすか停止要求が来るまでブロックして待機"""
+        scheduler = self._cooperative_scheduler()
+        if scheduler is not None:
+            # 協調実行: 待機中はスケジューラがGUIフレームを処理する
+            return scheduler.wait_until(
+                lambda: self.stop_requested.is_set() or predicate(), timeout
+            )
+        with self._state_changed:
+            return self._state_changed.wait_for(
+                lambda: self.stop_requested.is_set() or predicate(), timeout
+            )
+    
     def pause_before_solve(self) -> None:
         """solve()実行直前で自動的に停止"""
         with self._lock:
@@ -59,6 +121,7 @@ class ExecutionController:
             # リセット後の初期化
             self.single_step_requested = False
             self.pause_requested = False
+            self.notify_state_change()
             
         logger.info("🔄 solve()実行前で一時停止しました")
     
@@ -108,6 +171,7 @@ class ExecutionController:
                 
                 # ステップ実行許可（solve()の次の1アクションを実行させる）
                 self.step_event.set()
+                self.notify_state_change()
                 
                 # solve()実行中でない場合は、solve()実行を開始する必要がある
                 if not self.state.is_running:
@@ -179,6 +243,7 @@ class ExecutionController:
             
             # 初回ステップ実行要求を送信
             self.single_step_requested = True
+            self.notify_state_change()
             
         logger.info(f"🚀 まとめて実行開始（速度: {self.state.sleep_interval}秒間隔）")
     
@@ -189,6 +254,17 @@ class ExecutionController:
             self.state.sleep_interval = new_interval
             logger.info(f"⚡ ExecutionController sleep_interval更新: {old_interval}→{new_interval}秒")
     
+    def set_max_speed_mode(self, enabled: bool) -> None:
+        """最高速モード切替（待機中の連続実行にも即座に反映）"""
+        with self._lock:
+            self.max_speed_mode = enabled
+            self.notify_state_change()
+        logger.info("🏎️ 最高速モード: %s", "有効" if enabled else "無効")
+    
+    def is_max_speed_running(self) -> bool:
+        """最高速モードで連続実行中か（描画はGUIループに任せる）"""
+        return self.max_speed_mode and self.state.mode == ExecutionMode.CONTINUOUS
+    
     def pause_execution(self) -> None:
         """実行を一時停止"""
         with self._lock:
@@ -200,12 +276,14 @@ class ExecutionController:
                 self.state.mode = ExecutionMode.PAUSED
                 self.state.is_running = False
                 self.pause_event.clear()
+                self.notify_state_change()
                 logger.info("⏸️ 連続実行を次のアクション境界で一時停止しました")
             else:
                 # 即座に一時停止
                 self.state.mode = ExecutionMode.PAUSED
                 self.state.is_running = False
                 self.pause_event.clear()
+                self.notify_state_change()
                 # 一時停止では停止要求は設定しない（メインループ継続のため）
                 logger.info("⏸️ 実行を即座に一時停止しました")
     
@@ -214,109 +292,79 @@ class ExecutionController:
         with self._lock:
             self.stop_requested.set()
             self.state.is_running = False
+            self.notify_state_change()
             
         logger.info("⏹️ 実行停止がリクエストされました")
     
     def wait_for_action(self) -> None:
-        """アクション待機処理"""
-        # 停止要求の優先チェック
-        if self.stop_requested.is_set():
-            logger.debug("🔍 停止要求検出 - solve()スレッド終了")
-            import threading
-            current_thread = threading.current_thread()
-            if current_thread is not threading.main_thread():
-                # バックグラウンドスレッドの場合は例外を発生させて終了
-                logger.info(f"🔄 solve()スレッド {current_thread.name} を停止要求により終了")
-                raise RuntimeError("solve() execution stopped by reset")
-            else:
-                logger.info("🔍 停止要求をメインスレッドで検出 - 処理継続")
-            return
+        """アクション待機処理
 
-        current_mode = self.state.mode
+        待機は状態変更通知（条件変数）でブロックするため、一時停止中はCPUを消費しない。
+        """
+        scheduler = self._cooperative_scheduler()
+        if scheduler is not None:
+            # 協調実行: API呼び出しごとにスケジューラへ制御を戻す
+            scheduler.yield_point()
+        
+        while True:
+            # 停止要求の優先チェック
+            if self.stop_requested.is_set():
+                logger.debug("🔍 停止要求検出 - solve()スレッド終了")
+                current_thread = threading.current_thread()
+                if scheduler is not None or current_thread is not threading.main_thread():
+                    # solve()実行中の場合は例外を発生させて終了
+                    logger.info("🔄 solve() (%s) を停止要求により終了", current_thread.name)
+                    raise SolveInterrupted("stop")
+                logger.info("🔍 停止要求をメインスレッドで検出 - 処理継続")
+                return
 
-        # 🔧 アクション数上限チェック（早期ブロック）
-        if current_mode == ExecutionMode.STEPPING and self.current_step_actions_allowed <= 0:
-            logger.info(f"🚫 wait_for_action: アクション数上限に達しているため強制的にPAUSEDに遷移")
-            with self._lock:
-                self.state.mode = ExecutionMode.PAUSED
-                self.single_step_requested = False
-                self.step_execution_token.clear()
-            # PAUSED状態での待機処理へ再帰的に移行
-            self.wait_for_action()
-            return
+            current_mode = self.state.mode
+            logger.debug(
+                "🔍 wait_for_action: mode=%s, step_req=%s, pause_req=%s, actions_allowed=%s",
+                current_mode, self.single_step_requested, self.pause_requested,
+                self.current_step_actions_allowed
+            )
 
-        # ログ出力でデバッグ
-        import threading
-        thread_name = threading.current_thread().name
-        logger.info(f"🔍 wait_for_action呼び出し: mode={current_mode}, step_req={self.single_step_requested}, pause_req={self.pause_requested}, thread={thread_name}, actions_allowed={self.current_step_actions_allowed}")
-        
-        if current_mode == ExecutionMode.STEPPING:
-            # ステップモードではトークンベース制御
-            if self.step_execution_token.is_set():
-                # トークンを即座にクリア（1回限りの使用）
+            if current_mode == ExecutionMode.STEPPING:
                 with self._lock:
-                    self.step_execution_token.clear()
-                    self.current_step_actions_allowed -= 1
-                    logger.info(f"🔍 ステップモード: トークン使用→1APIコール許可 (actions_allowed={self.current_step_actions_allowed})")
-                    # アクション数が0になったら即座にPAUSEDに遷移
+                    # 🔧 アクション数上限チェック（早期ブロック）
                     if self.current_step_actions_allowed <= 0:
+                        logger.debug("🚫 wait_for_action: アクション数上限に達したためPAUSEDに遷移")
                         self.state.mode = ExecutionMode.PAUSED
                         self.single_step_requested = False
-                        logger.info(f"🔍 ステップモード: アクション数上限に達しました → PAUSEDに遷移")
+                        self.step_execution_token.clear()
+                        continue
+
+                    # ステップモードではトークンベース制御
+                    if self.step_execution_token.is_set():
+                        # トークンを即座にクリア（1回限りの使用）
+                        self.step_execution_token.clear()
+                        self.current_step_actions_allowed -= 1
+                        logger.debug("🔍 ステップモード: トークン使用→1APIコール許可 (actions_allowed=%s)",
+                                     self.current_step_actions_allowed)
+                        # アクション数が0になったら即座にPAUSEDに遷移
+                        # （敵ターン処理はAPI完了後に実行される）
+                        if self.current_step_actions_allowed <= 0:
+                            self.state.mode = ExecutionMode.PAUSED
+                            self.single_step_requested = False
+                        return  # APIコール実行を許可
 
-                        # 🚫 execution_controllerでの敵ターン処理を無効化
-                        # API完了後に敵ターン処理を実行するよう変更
-                return  # APIコール実行を許可
+                # トークンがない場合はステップ要求・モード変更まで待機
+                self._wait_for_state(
+                    lambda: self.step_execution_token.is_set() or self.state.mode != ExecutionMode.STEPPING
+                )
+            elif current_mode == ExecutionMode.CONTINUOUS:
+                if self._handle_continuous_mode():
+                    return
+            elif current_mode == ExecutionMode.PAUSED:
+                # PAUSED状態ではStep/Continue/Resetによるモード変更まで待機
+                logger.debug("🔍 PAUSED状態: 実行再開待機中")
+                self._wait_for_state(lambda: self.state.mode != ExecutionMode.PAUSED)
             else:
-                # トークンがない場合は待機（solve()スレッドを継続）
-                logger.debug("🔍 ステップモード: トークンなし→待機開始")
-                while not self.step_execution_token.is_set() and self.state.mode == ExecutionMode.STEPPING:
-                    time.sleep(0.001)  # CPU負荷軽減（1ms間隔）
-                    # 停止要求チェック
-                    if self.stop_requested.is_set():
-                        logger.debug("🔍 ステップモード待機中: 停止要求検出")
-                        break
-                    # モード変更チェック
-                    if self.state.mode != ExecutionMode.STEPPING:
-                        break
-                logger.debug("🔍 ステップモード: 待機終了")
-                # 待機後、再帰的にwait_for_action()を呼び出して再チェック
-                self.wait_for_action()
+                # その他の状態では短時間だけ停止要求を待つ
+                logger.debug("wait_for_action: 状態 %s で待機中", current_mode)
+                self._wait_for_state(lambda: False, timeout=0.01)
                 return
-        elif current_mode == ExecutionMode.CONTINUOUS:
-            self._handle_continuous_mode()
-        elif current_mode == ExecutionMode.PAUSED:
-            # PAUSED状態では長時間待機（solve()スレッドを継続）
-            logger.info(f"🔍 PAUSED状態: 実行再開待機中 (thread={thread_name}, actions_allowed={self.current_step_actions_allowed})")
-            while self.state.mode == ExecutionMode.PAUSED and not self.step_execution_token.is_set():
-                time.sleep(0.01)  # 10ms間隔でチェック（応答性向上）
-                # 停止要求チェック
-                if self.stop_requested.is_set():
-                    logger.debug("🔍 PAUSED状態待機中: 停止要求検出")
-                    break
-                # モード変更チェック（Resume等）
-                if self.state.mode != ExecutionMode.PAUSED:
-                    logger.info(f"🔍 PAUSED状態: モード変更検出 {self.state.mode}")
-                    break
-                # step実行トークンがセットされたらループを抜ける
-                if self.step_execution_token.is_set():
-                    logger.info(f"🔍 PAUSED状態: ステップトークン検出")
-                    break
-            # 待機後、再帰的にwait_for_action()を呼び出して再チェック
-            logger.info(f"🔍 PAUSED状態: 待機終了→再チェック")
-            self.wait_for_action()
-            return
-        elif self.stop_requested.is_set():
-            self._handle_stop_request()
-        else:
-            # その他の状態では短時間待機（停止要求チェック付き）
-            logger.debug(f"wait_for_action: 状態 {current_mode} で待機中")
-            start_wait = time.time()
-            while time.time() - start_wait < 0.01:
-                if self.stop_requested.is_set():
-                    logger.debug("🔍 その他状態での停止要求検出")
-                    break
-                time.sleep(0.001)
 
     def _trigger_delayed_enemy_turn_processing(self):
         """ステップ完了時の遅延敵ターン処理"""
@@ -334,26 +382,20 @@ class ExecutionController:
     def _handle_stepping_mode(self) -> None:
         """ステップモード処理（ネストループ対応版）"""
         # single_step_requestedフラグがセットされている場合のみ実行を許可
-        if self.single_step_requested:
-            logger.debug("🔍 ステップモード: 1アクション実行を許可")
-            # フラグはAPI実行完了後にクリアする（ここではクリアしない）
-            return  # APIアクションの実行を許可
-        else:
-            # フラグがセットされていない場合は待機
-            # ネストループの場合、内側のループが完了するまでこの状態が続く
+        # フラグはAPI実行完了後にクリアする（ここではクリアしない）
+        # ネストループの場合、内側のループが完了するまで待機が続く
+        if not self.single_step_requested:
             logger.debug("🔍 ステップモード: 次のステップ要求を待機中")
-            while not self.single_step_requested and self.state.mode == ExecutionMode.STEPPING:
-                time.sleep(0.001)  # CPU負荷軽減（1ms間隔）
-                # 停止要求チェック
-                if self.stop_requested.is_set():
-                    break
-                # プログラム終了チェック
-                if self.state.mode != ExecutionMode.STEPPING:
-                    break
-            return
-    
-    def _handle_continuous_mode(self) -> None:
-        """連続実行モード処理（v1.2.5: 7段階速度対応）"""
+            self._wait_for_state(
+                lambda: self.single_step_requested or self.state.mode != ExecutionMode.STEPPING
+            )
+    
+    def _handle_continuous_mode(self) -> bool:
+        """連続実行モード処理（v1.2.5: 7段階速度対応）
+
+        Returns:
+            bool: 次のアクションを実行してよい場合True、状態を再確認すべき場合False
+        """
         if self.pause_requested or self.stop_requested.is_set():
             # 一時停止要求の処理
             with self._lock:
@@ -362,37 +404,45 @@ class ExecutionController:
                 self.pause_event.clear()
                 self.stop_requested.clear()
                 self.pause_requested = False
+                self.notify_state_change()
                 
             logger.info("⏸️ アクション境界で一時停止しました")
-            return
+            return False
+        
+        if self.max_speed_mode:
+            # 最高速モード: 待機もイベント処理もせずに次のアクションへ
+            return True
         
         # v1.2.5: 7段階速度対応の高精度スリープ
         sleep_time = max(self.state.sleep_interval, 0.001)  # 最小1ms（x50対応）
         
         # 超高速モード（x10, x50）の高精度制御
-        if hasattr(self, '_ultra_high_speed_controller') and self._ultra_high_speed_controller:
-            if sleep_time <= 0.05:  # x10以上の場合
-                # 高精度スリープを使用
-                tolerance_ms = 1.0 if sleep_time <= 0.001 else 5.0
-                try:
-                    self._ultra_high_speed_controller.ultra_precise_sleep(sleep_time, tolerance_ms)
-                except Exception as e:
-                    logger.warning(f"⚠️ 高精度スリープ失敗、標準スリープを使用: {e}")
-                    time.sleep(sleep_time)
-            else:
+        ultra_controller = getattr(self, '_ultra_high_speed_controller', None)
+        if ultra_controller and sleep_time <= 0.05:  # x10以上の場合
+            # 高精度スリープを使用
+            tolerance_ms = 1.0 if sleep_time <= 0.001 else 5.0
+            try:
+                ultra_controller.ultra_precise_sleep(sleep_time, tolerance_ms)
+            except Exception as e:
+                logger.warning(f"⚠️ 高精度スリープ失敗、標準スリープを使用: {e}")
                 time.sleep(sleep_time)
-        else:
-            time.sleep(sleep_time)
+        elif self._wait_for_state(
+            lambda: (self.pause_requested or self.max_speed_mode
+                     or self.state.mode != ExecutionMode.CONTINUOUS),
+            timeout=sleep_time
+        ):
+            # 待機中の一時停止・停止要求・最高速モード切替は次のアクションを待たずに反映する
+            return False
         
         # GUI応答性確保のため、定期的にpygameイベントをチェック
         # ただし、バックグラウンドスレッドからは呼び出さない（メインスレッドエラー回避）
-        import threading
         if threading.current_thread() is threading.main_thread():
             import pygame
             try:
                 pygame.event.pump()  # イベントキューを処理
             except:
                 pass  # pygame初期化前はスキップ
+        return True
     
     def _handle_stop_request(self) -> None:
         """停止要求処理"""
@@ -400,39 +450,34 @@ class ExecutionController:
             self.state.mode = ExecutionMode.PAUSED
             self.state.is_running = False
             self.stop_requested.clear()
+            self.notify_state_change()
             
         logger.info("⏹️ 停止要求により一時停止しました")
     
     def _terminate_solve_threads(self) -> None:
         """solve()スレッドを完全に停止してリセット"""
-        import threading
-        import time
-        
         # 現在のスレッド一覧を取得
         active_threads = threading.enumerate()
         solve_threads = [t for t in active_threads if t.name.startswith('Thread-') and t != threading.main_thread()]
         
+        # 協調実行中はsolve()がスケジューラ経由で打ち切られるため、スレッドを待つ必要はない
+        if self._scheduler is not None:
+            solve_threads = []
+        
         logger.info(f"🔄 アクティブなsolve()スレッド数: {len(solve_threads)}")
         
         # まず停止要求を設定（実行中のsolve()に停止シグナルを送信）
         self.stop_requested.set()
+        self.notify_state_change()
         
-        # solve()スレッドが停止するまで少し待機
-        max_wait_time = 1.0  # 1秒まで待機
-        start_wait = time.time()
+        # solve()スレッドが停止するまで待機（最大1秒、終了次第すぐに戻る）
+        max_wait_time = 1.0
+        deadline = time.monotonic() + max_wait_time
         
-        while solve_threads and (time.time() - start_wait < max_wait_time):
-            # 生きているsolve()スレッドの確認
-            alive_threads = [t for t in solve_threads if t.is_alive()]
-            if not alive_threads:
-                break
-            
-            logger.info(f"🔄 solve()スレッド停止待機中: {len(alive_threads)}個のスレッドが実行中")
-            time.sleep(0.1)  # 100ms待機
-            
-            # スレッドリストを更新
-            active_threads = threading.enumerate()
-            solve_threads = [t for t in active_threads if t.name.startswith('Thread-') and t != threading.main_thread()]
+        for thread in solve_threads:
+            if thread is threading.current_thread():
+                continue
+            thread.join(max(0.0, deadline - time.monotonic()))
         
         # 最終確認
         final_threads = [t for t in solve_threads if t.is_alive()]
@@ -464,6 +509,7 @@ class ExecutionController:
             
         # reset完了後に停止要求をクリア（新しいsolve()実行のため）
         self.stop_requested.clear()
+        self.notify_state_change()
         logger.info("🔄 スレッド終了処理完了、新しいsolve()実行準備完了")
         
         logger.info("🔄 solve()スレッド状態をリセットしました")
@@ -478,8 +524,10 @@ class ExecutionController:
                 # Speed設定を保持
                 current_sleep_interval = self.state.sleep_interval if self.state else 1.0
                 
-                # solve()スレッドの停止要求を先に設定
+                # solve()スレッドの停止要求を先に設定（協調実行中のsolve()は世代番号の変化で打ち切られる）
+                self.reset_generation += 1
                 self.stop_requested.set()
+                self.notify_state_change()
                 
                 # ExecutionController状態リセット（Speed設定除く）
                 self.state = ExecutionState()
@@ -496,11 +544,7 @@ class ExecutionController:
                 
                 logger.info(f"🔄 ExecutionState リセット完了: mode={self.state.mode}, running={self.state.is_running}")
                 
-                # 少し待ってから停止要求をクリア（solve()スレッドが停止するまで）
-                import time
-                time.sleep(0.1)
-                
-                # solve()スレッド完全停止とリセット
+                # solve()スレッド完全停止とリセット（停止完了まで待機してから停止要求をクリア）
                 self._terminate_solve_threads()
                 
                 # solve()完了状態をリセット（重要：新しいsolve()実行を可能にする）
@@ -594,6 +638,7 @@ class ExecutionController:
             self.state.mode = ExecutionMode.COMPLETED
             self.state.is_running = False
             self.is_step_execution_active = False
+            self.notify_state_change()
             
         logger.info("🏁 solve()の実行が完了しました")
     
@@ -652,7 +697,8 @@ class ExecutionController:
                     'max_speed_used': metrics.max_speed_used,
                     'average_speed': metrics.average_speed_multiplier,
                     'realtime_changes': metrics.realtime_changes_count,
-                    'ultra_speed_usage': metrics.ultra_high_speed_usage
+                    'ultra_speed_usage': metrics.ultra_high_speed_usage,
+                    'max_speed_mode': self.max_speed_mode
                 }
             except Exception as e:
                 logger.error(f"❌ 7段階速度メトリクス取得エラー: {e}")
@@ -664,7 +710,8 @@ class ExecutionController:
             'max_speed_used': 1,
             'average_speed': 1.0,
             'realtime_changes': 0,
-            'ultra_speed_usage': {}
+            'ultra_speed_usage': {},
+            'max_speed_mode': self.max_speed_mode
         }
     
     def sync_speed_with_state_7stage(self) -> None:
@@ -6,6 +6,10 @@ GameStateManagerクラスの実装
 from typing import List, Optional, Any, Dict
 from . import GameState, Character, Enemy, Item, Board, Position, Direction, GameStatus
 from .commands import Command, ExecutionResult, CommandInvoker, CommandResult
+from .state_snapshots import StateTimeline
+from .trace import get_tracer, DEBUG, INFO
+
+_trace = get_tracer(__name__)
 
 
 class GameStateManager:
@@ -14,7 +18,8 @@ class GameStateManager:
     def __init__(self):
         self.current_state: Optional[GameState] = None
         self.command_invoker = CommandInvoker()
-        self.initial_state: Optional[GameState] = None
+        # ターンごとの差分スナップショット（リセット・取り消し・巻き戻し用）
+        self.timeline: Optional[StateTimeline] = None
         self.special_error_handler: Optional[SpecialErrorHandler] = None
         # v1.2.8: 2x3敵用交互怒りモード履歴管理
         self.rage_mode_history: List[Dict[str, Any]] = []
@@ -78,8 +83,8 @@ class GameStateManager:
         if stage_id:
             self.special_error_handler = SpecialErrorHandler(stage_id, error_config)
         
-        # 初期状態を保存（リセット用）
-        self.initial_state = self._copy_game_state(self.current_state)
+        # 初期状態をスナップショット0として記録（リセット用）
+        self.timeline = StateTimeline(self.current_state)
         
         # コマンド履歴をクリア
         self.command_invoker.clear_history()
@@ -143,6 +148,9 @@ class GameStateManager:
                     result.message += f"\n✨ {special_result['message']}"
                     # 影の王を即座に消滅させる
                     self._handle_special_enemy_elimination()
+
+        # このターンで変化したエンティティだけを記録
+        self.timeline.record(self.current_state)
         
         return result
     
@@ -157,30 +165,30 @@ class GameStateManager:
         # 🔧 ステップ実行モード時の敵ターン処理制御
         should_skip_enemy_turn = self._should_skip_enemy_turn_processing()
 
-        print(f"🔧 敵ターン処理判定: should_skip={should_skip_enemy_turn}")
+        _trace.debug("🔧 敵ターン処理判定: should_skip=%s", should_skip_enemy_turn)
 
         if should_skip_enemy_turn:
             # ステップ実行中は敵ターン処理をスキップ
-            print(f"🚫 敵ターン処理をスキップ（ステップ実行モード）")
+            _trace.debug("🚫 敵ターン処理をスキップ（ステップ実行モード）")
         else:
             # 敵のターン処理を実行
-            print(f"✅ 敵ターン処理を実行（通常モード）")
+            _trace.debug("✅ 敵ターン処理を実行（通常モード）")
             self._process_enemy_turns()
         
         # プレイヤー死亡判定
         if not self.current_state.player.is_alive():
-            self.current_state.status = GameStatus.FAILED
+            self.current_state.set_status(GameStatus.FAILED)
             return
         
         # v1.2.6: 勝利条件チェック（敵を倒してからゴール到達）
         if hasattr(self.current_state, 'check_victory_conditions'):
             if self.current_state.check_victory_conditions():
-                self.current_state.status = GameStatus.WON
+                self.current_state.set_status(GameStatus.WON)
                 return
         else:
             # フォールバック：従来のゴール到達判定
             if self.current_state.check_goal_reached():
-                self.current_state.status = GameStatus.WON
+                self.current_state.set_status(GameStatus.WON)
                 return
         
         # 敵が全滅した場合の処理（将来の拡張用）
@@ -189,7 +197,7 @@ class GameStateManager:
         if (not self.current_state.enemies and 
             self.current_state.goal_position is None and 
             self.current_state.turn_count > 0):
-            self.current_state.status = GameStatus.WON
+            self.current_state.set_status(GameStatus.WON)
 
     def _should_skip_enemy_turn_processing(self) -> bool:
         """ステップ実行モード時の敵ターン処理スキップ判定"""
@@ -198,7 +206,7 @@ class GameStateManager:
             from .api import _global_api
 
             if not hasattr(_global_api, 'execution_controller') or not _global_api.execution_controller:
-                print(f"🔍 敵ターンスキップ判定: ExecutionController不存在 → False")
+                _trace.debug("🔍 敵ターンスキップ判定: ExecutionController不存在 → False")
                 return False
 
             execution_controller = _global_api.execution_controller
@@ -207,7 +215,7 @@ class GameStateManager:
             is_step_active = getattr(execution_controller, 'is_step_execution_active', False)
             current_mode = getattr(execution_controller.state, 'mode', 'UNKNOWN')
 
-            print(f"🔍 敵ターンスキップ判定: is_step_active={is_step_active}, mode={current_mode}")
+            _trace.debug("🔍 敵ターンスキップ判定: is_step_active=%s, mode=%s", is_step_active, current_mode)
 
             # 🔧 ステップ実行でも敵ターン処理を実行（正しいターン制のため）
             # プレイヤーアクション完了後に敵ターンが実行される
@@ -215,7 +223,7 @@ class GameStateManager:
 
         except Exception as e:
             # エラー時は通常処理を続行
-            print(f"🔍 敵ターンスキップ判定エラー: {e} → False")
+            _trace.warning("🔍 敵ターンスキップ判定エラー: %s → False", e)
             return False
 
     def _process_enemy_turns(self):
@@ -226,7 +234,7 @@ class GameStateManager:
         player = self.current_state.player
         
         # デバッグ: stage_idを確認
-        print(f"🔧 _process_enemy_turns開始: stage_id={getattr(self.current_state, 'stage_id', 'None')}")
+        _trace.debug("🔧 _process_enemy_turns開始: stage_id=%s", getattr(self.current_state, 'stage_id', 'None'))
         
         # このターンで既に行動した敵を追跡するセット
         enemies_already_moved = set()
@@ -239,14 +247,14 @@ class GameStateManager:
             # Stage11/Stage12特別処理: stage11_special属性ベースでの判定
             if (hasattr(enemy, 'stage11_special') and enemy.stage11_special):
                 # stage11_special=trueの敵は特殊行動パターン
-                print(f"🔧 特殊敵処理開始: HP={enemy.hp}/{enemy.max_hp}")
+                _trace.debug("🔧 特殊敵処理開始: HP=%s/%s", enemy.hp, enemy.max_hp)
                 self._handle_stage11_enemy_behavior(enemy, player)
                 enemies_already_moved.add(id(enemy))  # 既に行動済みとしてマーク
                 continue
 
             # v1.2.8: 2x3敵特殊処理
             if (hasattr(enemy, 'enemy_type') and enemy.enemy_type.value == "special_2x3"):
-                print(f"🔧 2x3特殊敵処理開始: HP={enemy.hp}/{enemy.max_hp}")
+                _trace.debug("🔧 2x3特殊敵処理開始: HP=%s/%s", enemy.hp, enemy.max_hp)
                 self._handle_special_2x3_behavior(enemy, player)
                 enemies_already_moved.add(id(enemy))  # 既に行動済みとしてマーク
                 continue
@@ -271,7 +279,7 @@ class GameStateManager:
             can_see = enemy.can_see_player(player.position, self.current_state.board)
 
             # デバッグ: 視界判定の詳細ログ
-            print(f"🔍 DEBUG enemy_turn - 敵{enemy.position}→プレイヤー{player.position}: can_see={can_see}, alerted={enemy.alerted}")
+            _trace.debug("🔍 DEBUG enemy_turn - 敵%s→プレイヤー%s: can_see=%s, alerted=%s", enemy.position, player.position, can_see, enemy.alerted)
 
             # 重要な状態変化のみログ出力
 
@@ -283,10 +291,12 @@ class GameStateManager:
                 enemy.alert_cooldown = 10  # 10ターンの間追跡を続ける（持続性向上）
                 # 最後に見た位置を更新
                 enemy.last_seen_player = Position(player.position.x, player.position.y)
+                self.current_state.mark_changed(enemy)
             elif enemy.alert_cooldown > 0:
                 # 見失っても一定時間追跡を続ける
                 enemy.alert_cooldown -= 1
-                print(f"🔍 追跡中... クールダウン残り{enemy.alert_cooldown}ターン")
+                self.current_state.mark_changed(enemy)
+                _trace.debug("🔍 追跡中... クールダウン残り%sターン", enemy.alert_cooldown)
                 if enemy.alert_cooldown <= 0:
                     enemy.alerted = False
                     print(f"😴 警戒解除: 巡回モードに復帰")
@@ -304,17 +314,17 @@ class GameStateManager:
 
             # 🔧 既に行動済みの敵はスキップ（1ターン1アクション制御）
             if id(enemy) in enemies_already_moved:
-                print(f"🔧 既に行動済みの敵をスキップ: 敵{enemy.position}")
+                _trace.debug("🔧 既に行動済みの敵をスキップ: 敵%s", enemy.position)
                 continue
 
             # 🔧 警戒状態の敵処理
             if enemy.alerted:
-                print(f"🔧 警戒状態敵処理開始: 敵[{enemy.position.x},{enemy.position.y}] プレイヤー[{player.position.x},{player.position.y}]")
-                print(f"🔍 敵オブジェクト情報: type={type(enemy).__name__}")
+                _trace.debug("🔧 警戒状態敵処理開始: 敵[%s,%s] プレイヤー[%s,%s]", enemy.position.x, enemy.position.y, player.position.x, player.position.y)
+                _trace.debug("🔍 敵オブジェクト情報: type=%s", type(enemy).__name__)
 
                 # すべての敵に対して統一的な追跡行動を実行
                 # AdvancedEnemyシステムは複雑すぎるため、シンプルな追跡システムを使用
-                print(f"🔧 統一追跡システム使用: _simple_chase_behavior")
+                _trace.debug("🔧 統一追跡システム使用: _simple_chase_behavior")
                 self._simple_chase_behavior(enemy, player.position)
             
             # 非警戒状態では基本行動パターンを実行 - _execute_enemy_movementで処理済み
@@ -332,14 +342,14 @@ class GameStateManager:
             dy = player_pos.y - current_pos.y
             distance = abs(dx) + abs(dy)
 
-            print(f"🔧 知能追跡開始: 敵[{current_pos.x},{current_pos.y}] → プレイヤー[{player_pos.x},{player_pos.y}] 距離={distance}")
-            print(f"🔍 敵状態: direction={enemy.direction.value}, alerted={enemy.alerted}")
+            _trace.debug("🔧 知能追跡開始: 敵[%s,%s] → プレイヤー[%s,%s] 距離=%s", current_pos.x, current_pos.y, player_pos.x, player_pos.y, distance)
+            _trace.debug("🔍 敵状態: direction=%s, alerted=%s", enemy.direction.value, enemy.alerted)
 
             # 隣接している場合は攻撃
             if distance == 1:
-                print(f"🎯 攻撃範囲内: 攻撃処理開始")
+                _trace.debug("🎯 攻撃範囲内: 攻撃処理開始")
         except Exception as e:
-            print(f"❌ _simple_chase_behavior 初期化エラー: {e}")
+            _trace.warning("❌ _simple_chase_behavior 初期化エラー: %s", e)
             import traceback
             traceback.print_exc()
             return
@@ -353,33 +363,35 @@ class GameStateManager:
                 else:
                     required_direction = Direction.SOUTH if dy > 0 else Direction.NORTH
 
-                print(f"🎯 攻撃処理: current_dir={enemy.direction.value}, required_dir={required_direction.value}")
+                _trace.debug("🎯 攻撃処理: current_dir=%s, required_dir=%s", enemy.direction.value, required_direction.value)
 
                 if enemy.direction == required_direction:
                     # 攻撃実行
                     damage = enemy.attack_power
                     player = self.current_state.player
                     actual_damage = player.take_damage(damage)
+                    self.current_state.mark_changed()
                     print(f"💀 敵の攻撃！ {actual_damage}ダメージ (プレイヤーHP: {player.hp}/{player.max_hp})")
 
                     if not player.is_alive():
                         print(f"☠️ プレイヤー死亡！")
-                        self.current_state.status = GameStatus.FAILED
+                        self.current_state.set_status(GameStatus.FAILED)
                 else:
                     # 方向転換
                     enemy.direction = required_direction
-                    print(f"🔄 攻撃準備: 方向転換 → {required_direction.value}")
-                print(f"✅ 攻撃処理完了")
+                    self.current_state.mark_changed(enemy)
+                    _trace.debug("🔄 攻撃準備: 方向転換 → %s", required_direction.value)
+                _trace.debug("✅ 攻撃処理完了")
                 return
         except Exception as e:
-            print(f"❌ 攻撃処理エラー: {e}")
+            _trace.warning("❌ 攻撃処理エラー: %s", e)
             import traceback
             traceback.print_exc()
             return
 
         try:
             # 移動処理
-            print(f"🚶 移動処理開始: 距離={distance}")
+            _trace.debug("🚶 移動処理開始: 距離=%s", distance)
 
             # プレイヤーに向かう最適方向を決定（大きな差分を優先）
             target_directions = []
@@ -396,7 +408,8 @@ class GameStateManager:
             elif dy < 0:
                 target_directions.append(Direction.NORTH)
 
-            print(f"🎯 移動候補: {[d.value for d in target_directions]}")
+            if _trace.is_enabled(DEBUG):
+                _trace.debug("🎯 移動候補: %s", [d.value for d in target_directions])
 
             # より大きな軸差分を優先（効率的な追跡）
             if abs(dx) >= abs(dy):
@@ -409,25 +422,26 @@ class GameStateManager:
             # 優先順位で移動試行
             for direction in target_directions:
                 new_pos = self._get_new_position(current_pos, direction)
-                print(f"🔍 移動試行: {direction.value} → [{new_pos.x},{new_pos.y}]")
+                _trace.debug("🔍 移動試行: %s → [%s,%s]", direction.value, new_pos.x, new_pos.y)
 
                 # 有効な移動かチェック
                 if self._is_valid_move(new_pos, enemy):
                     if direction == enemy.direction:
                         # 同じ方向なら即座に移動
-                        enemy.position = new_pos
-                        print(f"🏃 知能追跡: 移動 [{current_pos.x},{current_pos.y}] → [{new_pos.x},{new_pos.y}]")
+                        self.current_state.move_enemy(enemy, new_pos)
+                        _trace.info("🏃 知能追跡: 移動 [%s,%s] → [%s,%s]", current_pos.x, current_pos.y, new_pos.x, new_pos.y)
                     else:
                         # 方向転換
                         enemy.direction = direction
-                        print(f"🔄 知能追跡: 方向転換 → {direction.value}")
-                    print(f"✅ 移動処理完了")
+                        self.current_state.mark_changed(enemy)
+                        _trace.debug("🔄 知能追跡: 方向転換 → %s", direction.value)
+                    _trace.debug("✅ 移動処理完了")
                     return
                 else:
-                    print(f"❌ 移動不可: {direction.value}")
+                    _trace.debug("❌ 移動不可: %s", direction.value)
 
             # 優先方向で移動できない場合は代替方向を試行
-            print(f"🔄 代替移動試行")
+            _trace.debug("🔄 代替移動試行")
             all_directions = [Direction.NORTH, Direction.SOUTH, Direction.EAST, Direction.WEST]
             for direction in all_directions:
                 if direction in target_directions:
@@ -441,18 +455,19 @@ class GameStateManager:
 
                     if new_distance <= current_distance:
                         if direction == enemy.direction:
-                            enemy.position = new_pos
-                            print(f"🏃 知能追跡: 代替移動 [{current_pos.x},{current_pos.y}] → [{new_pos.x},{new_pos.y}]")
+                            self.current_state.move_enemy(enemy, new_pos)
+                            _trace.info("🏃 知能追跡: 代替移動 [%s,%s] → [%s,%s]", current_pos.x, current_pos.y, new_pos.x, new_pos.y)
                         else:
                             enemy.direction = direction
-                            print(f"🔄 知能追跡: 代替方向転換 → {direction.value}")
-                        print(f"✅ 代替移動処理完了")
+                            self.current_state.mark_changed(enemy)
+                            _trace.debug("🔄 知能追跡: 代替方向転換 → %s", direction.value)
+                        _trace.debug("✅ 代替移動処理完了")
                         return
 
-            print(f"🚫 知能追跡: 全方向移動不可")
+            _trace.debug("🚫 知能追跡: 全方向移動不可")
 
         except Exception as e:
-            print(f"❌ 移動処理エラー: {e}")
+            _trace.warning("❌ 移動処理エラー: %s", e)
             import traceback
             traceback.print_exc()
 
@@ -519,22 +534,31 @@ class GameStateManager:
         
         success = self.command_invoker.undo_last_command(self.current_state)
         
-        if success:
-            # ゲーム状態を前の状態に戻す
-            if self.current_state.turn_count > 0:
-                self.current_state.turn_count -= 1
-            
-            # ゲーム終了状態をリセット（必要に応じて）
-            if self.current_state.status != GameStatus.PLAYING:
-                self.current_state.status = GameStatus.PLAYING
+        if success and len(self.timeline) > 1:
+            # 直前のターンのスナップショットへ戻す（敵・アイテム・ターン数・状態も含めて復元）
+            self.timeline.rewind(self.current_state, len(self.timeline) - 2)
         
         return success
     
+    def rewind_to_turn(self, turn: int) -> bool:
+        """指定ターン時点の状態へ巻き戻す（以降のコマンド履歴は破棄）"""
+        if self.current_state is None or self.timeline is None:
+            return False
+        
+        if self.timeline.rewind_to_turn(self.current_state, turn) is None:
+            return False
+        
+        self.command_invoker.clear_history()
+        return True
+    
     def _handle_stage11_enemy_behavior(self, enemy, player):
         """Stage11専用敵行動処理"""
+        # 状態管理用の属性を毎ターン更新する
+        self.current_state.mark_changed(enemy)
+        
         # HP50%チェック
         hp_ratio = enemy.hp / enemy.max_hp
-        print(f"🔧 Stage11敵行動: HP比率={hp_ratio:.2f}")
+        _trace.debug("🔧 Stage11敵行動: HP比率=%.2f", hp_ratio)
         
         # 敵の状態管理
         if not hasattr(enemy, 'stage11_state'):
@@ -567,11 +591,11 @@ class GameStateManager:
                 if hasattr(enemy, 'enemy_type') and enemy.enemy_type.value in ["large_2x2", "large_3x3"]:
                     enemy_id = getattr(enemy, 'id', f"{enemy.enemy_type.value}_{enemy.position.x}_{enemy.position.y}")
                     self.record_rage_mode_entry(enemy_id, enemy.enemy_type.value, self.current_state.turn_count)
-                    print(f"📊 怒りモード履歴記録: {enemy.enemy_type.value} (ターン{self.current_state.turn_count})")
+                    _trace.info("📊 怒りモード履歴記録: %s (ターン%s)", enemy.enemy_type.value, self.current_state.turn_count)
             else:
                 # HP50%以上または攻撃を受けていない：完全に無行動
                 enemy.alerted = False  # 平常モード
-                print(f"🟢 Stage11敵は平常モード - 行動せず (HP: {enemy.hp}/{enemy.max_hp})")
+                _trace.info("🟢 Stage11敵は平常モード - 行動せず (HP: %s/%s)", enemy.hp, enemy.max_hp)
         
         elif enemy.stage11_state == "rage_countdown_3":
             # 怒りモード1ターン目：カウントダウン3→2
@@ -611,6 +635,8 @@ class GameStateManager:
     
     def _handle_special_2x3_behavior(self, enemy, player):
         """special_2x3敵の行動処理（交互怒りモード監視）"""
+        self.current_state.mark_changed(enemy)
+        
         # 敵の状態管理
         if not hasattr(enemy, 'special_2x3_state'):
             enemy.special_2x3_state = "monitoring"  # "monitoring", "hunting", "eliminated"
@@ -629,7 +655,7 @@ class GameStateManager:
                     return
                 elif self.is_2x2_enemy_defeated():
                     # 2x2敵撃破により交互判定停止 → 待機モードに移行
-                    print(f"🔄 2x3敵は待機モード - 2x2敵撃破により交互判定を停止")
+                    _trace.debug("🔄 2x3敵は待機モード - 2x2敵撃破により交互判定を停止")
                     enemy.alerted = False
                     return
             
@@ -639,12 +665,12 @@ class GameStateManager:
                 enemy.special_2x3_state = "hunting"
                 enemy.alerted = True
                 print(f"🚨 2x3敵が追跡モードに移行！交互怒りモードパターン違反検出")
-                print(f"📊 期待: {self.get_next_expected_rage_type()}, 現在の履歴: {len(self.rage_mode_history)}件")
+                _trace.info("📊 期待: %s, 現在の履歴: %s件", self.get_next_expected_rage_type(), len(self.rage_mode_history))
                 return
             
             # 監視モード：基本的に無行動
             enemy.alerted = False
-            print(f"👁️ 2x3敵は監視モード - 交互怒りモードパターンを監視中")
+            _trace.info("👁️ 2x3敵は監視モード - 交互怒りモードパターンを監視中")
         
         elif enemy.special_2x3_state == "hunting":
             # 追跡モード：プレイヤーを追跡して即死攻撃
@@ -664,6 +690,7 @@ class GameStateManager:
             # 隣接している場合は即死攻撃（HPを0にして死亡状態にする）
             print(f"💀 2x3敵の即死攻撃！プレイヤーが倒されました")
             player.hp = 0
+            self.current_state.mark_changed(player)
             # 通常の死亡判定に任せる（既存のシステムを使用）
         else:
             # プレイヤーに向かって移動（簡単な追跡AI）
@@ -682,13 +709,13 @@ class GameStateManager:
             
             # 移動先が有効かチェック
             if (self.current_state.board.is_valid_position(new_pos) and 
-                new_pos not in self.current_state.board.walls and
+                not self.current_state.board.is_wall(new_pos) and
                 not self._is_position_occupied_by_enemy(new_pos, enemy)):
                 
-                enemy.position = new_pos
-                print(f"🏃 2x3敵がプレイヤーを追跡中: {new_pos.x}, {new_pos.y}")
+                self.current_state.move_enemy(enemy, new_pos)
+                _trace.info("🏃 2x3敵がプレイヤーを追跡中: %s, %s", new_pos.x, new_pos.y)
             else:
-                print(f"🚧 2x3敵の移動がブロックされました")
+                _trace.info("🚧 2x3敵の移動がブロックされました")
     
     def _is_position_occupied_by_enemy(self, position: Position, exclude_enemy) -> bool:
         """指定位置が他の敵によって占有されているかチェック"""
@@ -723,18 +750,21 @@ class GameStateManager:
         
         # 範囲攻撃描画メッセージ
         print(f"🔥 大型敵の範囲攻撃発動中！（{attack_range}マス範囲）")
-        print(f"🗂️ 敵占有位置: {[(pos.x, pos.y) for pos in enemy_positions]}")
-        print(f"💥 攻撃範囲座標: {[(pos.x, pos.y) for pos in sorted(attack_range_positions, key=lambda p: (p.y, p.x))]}")
-        print(f"💥 攻撃範囲: {len(attack_range_positions)}マス")
+        if _trace.is_enabled(DEBUG):
+            _trace.debug("🗂️ 敵占有位置: %s", [(pos.x, pos.y) for pos in enemy_positions])
+        if _trace.is_enabled(INFO):
+            _trace.info("💥 攻撃範囲座標: %s", [(pos.x, pos.y) for pos in sorted(attack_range_positions, key=lambda p: (p.y, p.x))])
+        _trace.info("💥 攻撃範囲: %sマス", len(attack_range_positions))
         
         # プレイヤーが攻撃範囲内にいるかチェック
         if player.position in attack_range_positions:
             print(f"💥 大型敵の範囲攻撃！ プレイヤーに{player.hp}ダメージ（即死攻撃）")
             player.take_damage(player.hp)  # 現在HPと同じダメージで即死
+            self.current_state.mark_changed()
             
             if not player.is_alive():
                 print(f"☠️ プレイヤー死亡！")
-                self.current_state.status = GameStatus.FAILED
+                self.current_state.set_status(GameStatus.FAILED)
         else:
             print(f"💨 大型敵の範囲攻撃をかわしました")
             
@@ -782,14 +812,14 @@ class GameStateManager:
         
         # 逆順でリストから削除（インデックスのずれを防ぐ）
         for i in reversed(enemies_to_remove):
-            del self.current_state.enemies[i]
+            self.current_state.remove_enemy(self.current_state.enemies[i])
     
     def reset_game(self) -> bool:
         """ゲームをリセット"""
-        if self.initial_state is None:
+        if self.current_state is None or self.timeline is None:
             return False
         
-        self.current_state = self._copy_game_state(self.initial_state)
+        self.timeline.rewind(self.current_state, 0)
         self.command_invoker.clear_history()
         
         # v1.2.8: 怒りモード履歴をクリア
@@ -811,6 +841,7 @@ class GameStateManager:
                 
                 # 警戒状態をリセット
                 enemy.alerted = False
+                self.current_state.mark_changed(enemy)
         
         # 特殊エラーハンドラーもリセット
         if self.special_error_handler:
@@ -842,81 +873,6 @@ class GameStateManager:
             return 0
         return max(0, self.current_state.max_turns - self.current_state.turn_count)
     
-    def _copy_game_state(self, state: GameState) -> GameState:
-        """ゲーム状態の深いコピーを作成"""
-        # プレイヤーのコピー
-        player_copy = Character(
-            position=Position(state.player.position.x, state.player.position.y),
-            direction=state.player.direction,
-            hp=state.player.hp,
-            max_hp=state.player.max_hp,
-            attack_power=state.player.attack_power
-        )
-        
-        # 敵のコピー
-        enemies_copy = []
-        for enemy in state.enemies:
-            # patrol_pathのコピー
-            patrol_path_copy = []
-            if enemy.patrol_path:
-                for pos in enemy.patrol_path:
-                    patrol_path_copy.append(Position(pos.x, pos.y))
-            
-            enemy_copy = Enemy(
-                position=Position(enemy.position.x, enemy.position.y),
-                direction=enemy.direction,
-                hp=enemy.hp,
-                max_hp=enemy.max_hp,
-                attack_power=enemy.attack_power,
-                enemy_type=enemy.enemy_type,
-                behavior_pattern=enemy.behavior_pattern,
-                is_angry=enemy.is_angry,
-                vision_range=enemy.vision_range,
-                alerted=enemy.alerted,
-                patrol_path=patrol_path_copy,
-                current_patrol_index=enemy.current_patrol_index,
-                alert_cooldown=enemy.alert_cooldown
-            )
-            
-            # v1.2.8: 拡張属性をコピー
-            if hasattr(enemy, 'stage11_special'):
-                enemy_copy.stage11_special = enemy.stage11_special
-            if hasattr(enemy, 'area_attack_range'):
-                enemy_copy.area_attack_range = enemy.area_attack_range
-                
-            enemies_copy.append(enemy_copy)
-        
-        # アイテムのコピー
-        items_copy = []
-        for item in state.items:
-            item_copy = Item(
-                id=item.id,  # v1.2.12: Required id parameter
-                position=Position(item.position.x, item.position.y),
-                item_type=item.item_type,
-                name=item.name,
-                effect=item.effect.copy(),
-                auto_equip=item.auto_equip,
-                damage=item.damage  # v1.2.12: For bomb items
-            )
-            items_copy.append(item_copy)
-        
-        # ゴール位置のコピー
-        goal_copy = None
-        if state.goal_position:
-            goal_copy = Position(state.goal_position.x, state.goal_position.y)
-        
-        return GameState(
-            player=player_copy,
-            enemies=enemies_copy,
-            items=items_copy,
-            board=state.board,  # ボードは不変なのでそのまま
-            turn_count=state.turn_count,
-            max_turns=state.max_turns,
-            status=state.status,
-            goal_position=goal_copy,
-            stage_id=state.stage_id  # ステージIDもコピー
-        )
-    
     def record_rage_mode_entry(self, enemy_id: str, enemy_type: str, turn: int) -> None:
         """怒りモード突入を記録（2x3敵用交互判定）"""
         self.rage_mode_history.append({
@@ -992,12 +948,12 @@ class GameStateManager:
             if (hasattr(enemy, 'enemy_type') and 
                 enemy.enemy_type.value == "special_2x3"):
                 enemies_to_remove.append(i)
-                print(f"🗑️ 2x3敵をインデックス {i} から削除")
+                _trace.info("🗑️ 2x3敵をインデックス %s から削除", i)
         
         # 逆順で削除（インデックスのずれを防ぐ）
         for i in reversed(enemies_to_remove):
-            del self.current_state.enemies[i]
-            print(f"✅ 2x3敵削除完了: インデックス {i}")
+            self.current_state.remove_enemy(self.current_state.enemies[i])
+            _trace.debug("✅ 2x3敵削除完了: インデックス %s", i)
     
     def _has_special_2x3_enemy_alive(self) -> bool:
         """special_2x3敵が生存しているかチェック"""
@@ -1053,18 +1009,19 @@ class GameStateManager:
 
     def _execute_enemy_movement(self, enemy, player):
         """敵の移動処理のみ実行（視界判定は後で実行）"""
-        print(f"🌀 敵は非警戒状態: 巡回モード")
-        print(f"🔍 Debug - behavior_pattern: '{enemy.behavior_pattern}' (type: {type(enemy.behavior_pattern)})")
-        print(f"🔍 Debug - patrol_path: {enemy.patrol_path} (type: {type(enemy.patrol_path)}, len: {len(enemy.patrol_path) if enemy.patrol_path else 'None'})")
-        print(f"🔍 Debug - current_position: {enemy.position}")
-        print(f"🔍 Debug - patrol条件チェック: pattern=='patrol'? {enemy.behavior_pattern == 'patrol'}, patrol_path存在? {bool(enemy.patrol_path)}")
+        _trace.debug("🌀 敵は非警戒状態: 巡回モード")
+        _trace.debug("🔍 Debug - behavior_pattern: '%s' (type: %s)", enemy.behavior_pattern, type(enemy.behavior_pattern))
+        _trace.debug("🔍 Debug - patrol_path: %s (type: %s, len: %s)", enemy.patrol_path, type(enemy.patrol_path), len(enemy.patrol_path) if enemy.patrol_path else 'None')
+        _trace.debug("🔍 Debug - current_position: %s", enemy.position)
+        _trace.debug("🔍 Debug - patrol条件チェック: pattern=='patrol'? %s, patrol_path存在? %s", enemy.behavior_pattern == 'patrol', bool(enemy.patrol_path))
         if enemy.patrol_path:
-            print(f"🔍 Debug - patrol_path内容: {[f'({p.x},{p.y})' if hasattr(p, 'x') else f'({p[0]},{p[1]})' for p in enemy.patrol_path]}")
-            print(f"🔍 Debug - current_patrol_index: {enemy.current_patrol_index}")
+            if _trace.is_enabled(DEBUG):
+                _trace.debug("🔍 Debug - patrol_path内容: %s", [f'({p.x},{p.y})' if hasattr(p, 'x') else f'({p[0]},{p[1]})' for p in enemy.patrol_path])
+            _trace.debug("🔍 Debug - current_patrol_index: %s", enemy.current_patrol_index)
             next_target = enemy.get_next_patrol_position()
-            print(f"🔍 Debug - get_next_patrol_position() 結果: {next_target}")
+            _trace.debug("🔍 Debug - get_next_patrol_position() 結果: %s", next_target)
             if next_target:
-                print(f"🔍 Debug - next_target座標: ({next_target.x},{next_target.y})")
+                _trace.debug("🔍 Debug - next_target座標: (%s,%s)", next_target.x, next_target.y)
 
         # patrol: 巡回処理
         if enemy.behavior_pattern == "patrol" and enemy.patrol_path:
@@ -1094,16 +1051,17 @@ class GameStateManager:
                         # 移動実行
                         next_pos = enemy.position.move(required_direction)
                         if self.current_state.board.is_passable(next_pos):
-                            enemy.position = next_pos
+                            self.current_state.move_enemy(enemy, next_pos)
                     else:
                         # 方向転換
                         enemy.direction = required_direction
+                        self.current_state.mark_changed(enemy)
 
     def _handle_alerted_enemy(self, enemy, player):
         """警戒状態の敵の処理 - 既存ロジックを使用"""
         # 既存の警戒状態処理を呼び出す（243行目以降のコード）
         distance = abs(player.position.x - enemy.position.x) + abs(player.position.y - enemy.position.y)
-        print(f"⚔️ 敵が積極的行動開始: 警戒={enemy.alerted} 距離={distance}")
+        _trace.debug("⚔️ 敵が積極的行動開始: 警戒=%s 距離=%s", enemy.alerted, distance)
 
         # 敵とプレイヤーの位置関係を計算
         dx = player.position.x - enemy.position.x
@@ -1112,7 +1070,7 @@ class GameStateManager:
 
         # 隣接している場合（距離1）の処理
         if distance == 1:
-            print(f"⚔️ 隣接判定: 敵[{enemy.position.x},{enemy.position.y}] → プレイヤー[{player.position.x},{player.position.y}]")
+            _trace.debug("⚔️ 隣接判定: 敵[%s,%s] → プレイヤー[%s,%s]", enemy.position.x, enemy.position.y, player.position.x, player.position.y)
 
             # 攻撃に必要な方向を計算
             if abs(dx) > abs(dy):
@@ -1126,38 +1084,43 @@ class GameStateManager:
                 if enemy.direction != enemy.target_direction:
                     next_direction = self._get_next_rotation_step(enemy.direction, enemy.target_direction)
                     turns_needed = self._calculate_rotation_turns(enemy.direction, enemy.target_direction)
-                    print(f"🔄 段階的方向転換: {enemy.direction.value} → {next_direction.value} (目標: {enemy.target_direction.value}, 残りターン数: {turns_needed})")
+                    _trace.debug("🔄 段階的方向転換: %s → %s (目標: %s, 残りターン数: %s)", enemy.direction.value, next_direction.value, enemy.target_direction.value, turns_needed)
                     enemy.direction = next_direction
+                    self.current_state.mark_changed(enemy)
                 else:
                     # 目標方向に到達したので、target_directionをクリア
-                    print(f"✅ 目標方向到達: {enemy.target_direction.value}")
+                    _trace.debug("✅ 目標方向到達: %s", enemy.target_direction.value)
                     enemy.target_direction = None
+                    self.current_state.mark_changed(enemy)
 
                     # 目標方向に到達したので攻撃を実行
                     damage = enemy.attack_power
                     actual_damage = player.take_damage(damage)
+                    self.current_state.mark_changed()
                     print(f"💀 敵の攻撃！ {actual_damage}ダメージ (プレイヤーHP: {player.hp}/{player.max_hp})")
 
                     if not player.is_alive():
                         print(f"☠️ プレイヤー死亡！")
-                        self.current_state.status = GameStatus.FAILED
+                        self.current_state.set_status(GameStatus.FAILED)
 
             # 通常の攻撃処理（target_directionが設定されていない場合）
             elif enemy.direction == required_direction:
                 # プレイヤーを攻撃
                 damage = enemy.attack_power
                 actual_damage = player.take_damage(damage)
+                self.current_state.mark_changed()
                 print(f"💀 敵の攻撃！ {actual_damage}ダメージ (プレイヤーHP: {player.hp}/{player.max_hp})")
 
                 if not player.is_alive():
                     print(f"☠️ プレイヤー死亡！")
-                    self.current_state.status = GameStatus.FAILED
+                    self.current_state.set_status(GameStatus.FAILED)
             else:
                 # 正しい方向を向いていない場合は段階的方向転換（複数ターン消費の可能性）
                 next_direction = self._get_next_rotation_step(enemy.direction, required_direction)
                 turns_needed = self._calculate_rotation_turns(enemy.direction, required_direction)
-                print(f"🔄 段階的方向転換: {enemy.direction.value} → {next_direction.value} (必要ターン数: {turns_needed})")
+                _trace.debug("🔄 段階的方向転換: %s → %s (必要ターン数: %s)", enemy.direction.value, next_direction.value, turns_needed)
                 enemy.direction = next_direction
+                self.current_state.mark_changed(enemy)
 
         # 隣接していない場合は1マス近づく移動を試みる（警戒状態のみ）
         elif distance > 1:
@@ -1167,7 +1130,7 @@ class GameStateManager:
             if target_position is None:
                 target_position = player.position  # フォールバック
 
-            print(f"🏃 追跡開始: 敵[{enemy.position.x},{enemy.position.y}] → 目標[{target_position.x},{target_position.y}] 距離={distance} ({'直視' if can_see else '記憶'})")
+            _trace.info("🏃 追跡開始: 敵[%s,%s] → 目標[%s,%s] 距離=%s (%s)", enemy.position.x, enemy.position.y, target_position.x, target_position.y, distance, '直視' if can_see else '記憶')
 
             # プレイヤーに向かって移動
             dx = target_position.x - enemy.position.x
@@ -1177,15 +1140,15 @@ class GameStateManager:
             move_direction = None
             if abs(dx) >= abs(dy):
                 # x軸優先追跡
-                print(f"🏃 同一距離追跡（接触重視x軸優先）: target_dx={dx}, target_dy={dy}, 選択方向={'E' if dx > 0 else 'W'}")
+                _trace.info("🏃 同一距離追跡（接触重視x軸優先）: target_dx=%s, target_dy=%s, 選択方向=%s", dx, dy, 'E' if dx > 0 else 'W')
                 move_direction = Direction.EAST if dx > 0 else Direction.WEST
             else:
                 # y軸追跡
-                print(f"🏃 y軸優先追跡: target_dy={dy}, 選択方向={'S' if dy > 0 else 'N'}")
+                _trace.info("🏃 y軸優先追跡: target_dy=%s, 選択方向=%s", dy, 'S' if dy > 0 else 'N')
                 move_direction = Direction.SOUTH if dy > 0 else Direction.NORTH
 
             # 🔧 古いAIロジックを無効化 - 正規のenemy_systemに委譲
-            print(f"🔧 古いAIロジック無効化: 正規のenemy_systemに委譲 (方向={move_direction.value})")
+            _trace.debug("🔧 古いAIロジック無効化: 正規のenemy_systemに委譲 (方向=%s)", move_direction.value)
             # 移動方向が現在の方向と異なる場合は方向転換
             # if enemy.direction != move_direction:
             #     print(f"🔄 追跡方向転換: {enemy.direction.value} → {move_direction.value}")
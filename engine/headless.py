@@ -0,0 +1,334 @@
+"""
+ヘッドレス一括シミュレーション
+学生のsolve()を描画・ログ・待機なしで実行し、最終状態とアクション履歴を返す
+
+採点などで多数の提出物を再生するための入口。``run_solve()`` で1件を実行し、
+``run_batch()`` でプロセスプールに分散して一括実行する。
+
+    results = run_batch([
+        SimulationJob("stage01", source, submission_id="s001"),
+        ...
+    ], max_actions=200, time_limit=5.0)
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import signal
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from . import GameState
+from . import api as _api
+from .api import APILayer, APIUsageError
+from .commands import ExecutionResult, CommandResult
+from .stage_loader import StageLoader
+
+SolveSpec = Union[str, Callable[[], Any]]
+
+
+class SimulationBudgetExceeded(BaseException):
+    """ターン・時間予算超過
+
+    solve()内の ``except Exception`` で握りつぶされないようBaseExceptionを継承する。
+    """
+    pass
+
+
+@dataclass
+class SimulationJob:
+    """一括実行の1件分"""
+    stage_id: str
+    solve: SolveSpec  # solve関数（プロセス間で受け渡すためモジュールレベル関数）またはソースコード
+    submission_id: Optional[str] = None
+
+
+@dataclass
+class SimulationResult:
+    """ヘッドレス実行結果"""
+    stage_id: str
+    submission_id: Optional[str]
+    status: str  # GameStatus.value（実行できなかった場合は "error"）
+    game_state: Optional[GameState] = None
+    actions: List[Dict[str, Any]] = field(default_factory=list)
+    turn_count: int = 0
+    elapsed: float = 0.0
+    budget_exceeded: bool = False
+    error: Optional[str] = None
+    engine_errors: List[str] = field(default_factory=list)  # アクション実行中に発生したエンジンの例外
+
+    @property
+    def is_success(self) -> bool:
+        """ステージクリアしたか"""
+        return self.status == "won"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """集計用の辞書に変換（最終状態は含めない）"""
+        return {
+            "stage_id": self.stage_id,
+            "submission_id": self.submission_id,
+            "status": self.status,
+            "turn_count": self.turn_count,
+            "action_count": len(self.actions),
+            "elapsed": round(self.elapsed, 4),
+            "budget_exceeded": self.budget_exceeded,
+            "error": self.error,
+            "engine_errors": self.engine_errors,
+        }
+
+
+class HeadlessAPILayer(APILayer):
+    """描画・ログ・実行制御を持たないAPIレイヤー
+
+    アクションAPIはAPILayerの実装をそのまま使い、呼び出し回数・時間の予算確認と
+    軽量な履歴記録だけを差し替える。アクション中に発生したエンジンの例外は
+    ``engine_errors`` に記録し、solve()の実行は継続する。
+    """
+
+    def __init__(self, max_actions: Optional[int] = None, deadline: Optional[float] = None,
+                 stage_loader: Optional[StageLoader] = None):
+        super().__init__(
+            renderer_type="headless",
+            enable_progression=False,
+            enable_session_logging=False,
+            enable_educational_errors=False,
+            enable_action_tracking=False
+        )
+        self.auto_render = False
+        self.max_actions = max_actions
+        self.action_calls = 0  # 失敗・ゲーム終了後の呼び出しも含むアクションAPI呼び出し回数
+        self.deadline = deadline  # time.monotonic()基準の期限
+        self.engine_errors: List[str] = []  # アクション実行中のエンジン例外（"api: 例外型: 内容"）
+        if stage_loader is not None:
+            self.stage_loader = stage_loader
+
+    def set_auto_render(self, enabled: bool) -> None:
+        """ヘッドレス実行では常に描画しない"""
+        pass
+
+    def _check_budget(self) -> None:
+        """アクションAPI呼び出しごとの予算確認"""
+        self.action_calls += 1
+        if self.max_actions is not None and self.action_calls > self.max_actions:
+            raise SimulationBudgetExceeded(f"アクション数の上限 {self.max_actions} に到達しました")
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            raise SimulationBudgetExceeded("実行時間の上限に到達しました")
+
+    def _record_call(self, api_name: str, result: ExecutionResult) -> None:
+        """API呼び出しを記録（ループ検出・進捗管理は行わない）"""
+        self.call_history.append({
+            "api": api_name,
+            "success": result.is_success,
+            "message": result.message,
+            "turn": self.game_manager.get_turn_count()
+        })
+
+    def _handle_step_completion(self, api_name: str) -> None:
+        pass
+
+    def _handle_error(self, error: Exception, context: Dict[str, Any] = None) -> None:
+        """エンジンの例外を記録（ステージで許可されていないAPIの呼び出しは記録しない）"""
+        if isinstance(error, APIUsageError):
+            return
+        api_name = (context or {}).get("action", "unknown")
+        message = f"{type(error).__name__}: {error}"
+        self.engine_errors.append(f"{api_name}: {message}")
+        if self.game_manager is not None:
+            self._record_call(api_name, ExecutionResult(result=CommandResult.ERROR, message=message))
+
+    def turn_left(self) -> bool:
+        self._check_budget()
+        return super().turn_left()
+
+    def turn_right(self) -> bool:
+        self._check_budget()
+        return super().turn_right()
+
+    def move(self) -> bool:
+        self._check_budget()
+        return super().move()
+
+    def attack(self) -> bool:
+        self._check_budget()
+        return super().attack()
+
+    def pickup(self) -> bool:
+        self._check_budget()
+        return super().pickup()
+
+    def wait(self) -> bool:
+        self._check_budget()
+        return super().wait()
+
+    def dispose(self) -> ExecutionResult:
+        self._check_budget()
+        return super().dispose()
+
+
+def load_solve(source: str, filename: str = "<solve>") -> Callable[[], Any]:
+    """ソースコードからsolve()関数を取り出す
+
+    main.pyをそのまま渡してもよい（``__name__`` が ``"__main__"`` ではないためmain()は実行されない）。
+    """
+    namespace: Dict[str, Any] = {"__name__": "__solve__", "__file__": filename}
+    exec(compile(source, filename, "exec"), namespace)
+    solve = namespace.get("solve")
+    if not callable(solve):
+        raise ValueError(f"{filename} に solve() 関数が定義されていません")
+    return solve
+
+
+@contextlib.contextmanager
+def _alarm(time_limit: Optional[float]):
+    """メインスレッドではSIGALRMで時間予算を強制する（API呼び出しのない無限ループ対策）"""
+    use_signal = (
+        time_limit is not None
+        and hasattr(signal, "setitimer")
+        and threading.current_thread() is threading.main_thread()
+    )
+    if not use_signal:
+        yield
+        return
+
+    def _on_alarm(signum, frame):
+        raise SimulationBudgetExceeded("実行時間の上限に到達しました")
+
+    previous = signal.signal(signal.SIGALRM, _on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, time_limit)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def run_solve(stage_id: str, solve: SolveSpec, max_actions: Optional[int] = None,
+              time_limit: Optional[float] = None, stages_dir: str = "stages",
+              submission_id: Optional[str] = None, quiet: bool = True) -> SimulationResult:
+    """solve()を1件ヘッドレス実行
+
+    Args:
+        stage_id: ステージID
+        solve: solve関数またはそのソースコード
+        max_actions: アクションAPI呼び出し回数の上限（Noneで無制限）
+        time_limit: 実行時間の上限（秒、Noneで無制限）
+        stages_dir: ステージファイルのディレクトリ
+        submission_id: 結果に付与する提出物ID
+        quiet: 標準出力（solve()内のprintを含む）を捨てるか
+    """
+    start = time.monotonic()
+    deadline = start + time_limit if time_limit is not None else None
+    layer = HeadlessAPILayer(max_actions, deadline, StageLoader(stages_dir))
+    result = SimulationResult(stage_id=stage_id, submission_id=submission_id, status="error")
+
+    # 学生コードは engine.api のグローバル関数経由で呼び出すため、実行中だけ差し替える
+    previous_api = _api._global_api
+    _api._global_api = layer
+    try:
+        with open(os.devnull, "w") as devnull, \
+                contextlib.redirect_stdout(devnull if quiet else sys.stdout), \
+                _alarm(time_limit):
+            try:
+                solve_func = load_solve(solve) if isinstance(solve, str) else solve
+                if not layer.initialize_stage(stage_id) or layer.game_manager is None:
+                    result.error = f"ステージ {stage_id} の初期化に失敗しました"
+                else:
+                    solve_func()
+            except SimulationBudgetExceeded as e:
+                result.budget_exceeded = True
+                result.error = str(e)
+            except Exception as e:
+                result.error = f"{type(e).__name__}: {e}"
+    finally:
+        _api._global_api = previous_api
+
+    result.engine_errors = layer.engine_errors.copy()
+    if result.error is None and result.engine_errors:
+        result.error = result.engine_errors[0]
+    result.elapsed = time.monotonic() - start
+    result.actions = layer.call_history.copy()
+    if layer.game_manager is not None and layer.game_manager.current_state is not None:
+        state = layer.game_manager.current_state
+        result.game_state = state
+        result.turn_count = state.turn_count
+        result.status = state.status.value
+    return result
+
+
+def _run_job(job: SimulationJob, max_actions: Optional[int], time_limit: Optional[float],
+             stages_dir: str, include_state: bool) -> SimulationResult:
+    result = run_solve(job.stage_id, job.solve, max_actions, time_limit, stages_dir, job.submission_id)
+    if not include_state:
+        result.game_state = None
+    return result
+
+
+def run_batch(jobs: List[SimulationJob], workers: Optional[int] = None,
+              max_actions: Optional[int] = None, time_limit: Optional[float] = None,
+              stages_dir: str = "stages", include_state: bool = True) -> List[SimulationResult]:
+    """複数のsolve()をプロセスプールで並列実行
+
+    Args:
+        jobs: 実行する提出物
+        workers: ワーカープロセス数（Noneで CPU コア数、1以下で現在のプロセスで逐次実行）
+        max_actions: 1件あたりのアクションAPI呼び出し回数の上限
+        time_limit: 1件あたりの実行時間の上限（秒）
+        stages_dir: ステージファイルのディレクトリ
+        include_state: 結果に最終GameStateを含めるか（含めない方がプロセス間転送が軽い）
+
+    Returns:
+        jobsと同じ順序の実行結果
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1 or len(jobs) <= 1:
+        return [_run_job(job, max_actions, time_limit, stages_dir, include_state) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_run_job, job, max_actions, time_limit, stages_dir, include_state)
+            for job in jobs
+        ]
+        results = []
+        for job, future in zip(jobs, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                # ワーカー異常終了・結果のpickle失敗など
+                results.append(SimulationResult(
+                    stage_id=job.stage_id, submission_id=job.submission_id,
+                    status="error", error=f"{type(e).__name__}: {e}"
+                ))
+        return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI: python -m engine.headless stage01 submissions/*.py"""
+    parser = argparse.ArgumentParser(description="solve()をヘッドレスで一括実行")
+    parser.add_argument("stage_id", help="ステージID（例: stage01）")
+    parser.add_argument("files", nargs="+", help="solve()を定義したPythonファイル")
+    parser.add_argument("--workers", type=int, default=None, help="ワーカープロセス数")
+    parser.add_argument("--max-actions", type=int, default=None, help="1件あたりのアクション数上限")
+    parser.add_argument("--time-limit", type=float, default=None, help="1件あたりの実行時間上限（秒）")
+    parser.add_argument("--stages-dir", default="stages", help="ステージファイルのディレクトリ")
+    args = parser.parse_args(argv)
+
+    jobs = [
+        SimulationJob(args.stage_id, Path(path).read_text(encoding="utf-8"), submission_id=path)
+        for path in args.files
+    ]
+    results = run_batch(jobs, args.workers, args.max_actions, args.time_limit,
+                        args.stages_dir, include_state=False)
+    print(json.dumps([r.to_dict() for r in results], ensure_ascii=False, indent=2))
+    return 0 if all(r.is_success for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""
+視線判定キャッシュ
+壁の配置が固定されたボード上の視線判定（ブレゼンハム）を (起点, 終点) 単位でメモ化する
+
+ステージ中に壁は変化しないため、視線の可否は (起点, 終点) だけで決まる。
+ボード（壁集合）ごとに ``LineOfSightCache`` を1つ持ち、ボードが差し替えられたときだけ
+新しいキャッシュを作る。エンジン（Enemy / AdvancedEnemy）と検証側（StagePathfinder /
+StandardEnemyAI）は同じ判定関数を共有する。
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Tuple
+
+# キャッシュ上限（10x10ボードの全ペアは1万件なので通常のステージは全件保持できる）
+DEFAULT_MAX_ENTRIES = 65536
+
+
+def trace_line_of_sight(start_x: int, start_y: int, end_x: int, end_y: int, walls) -> bool:
+    """起点から終点までの中間マスに壁がないか判定（起点・終点自体は判定しない）
+
+    Args:
+        walls: 壁座標 ``(x, y)`` の集合（``in`` 判定ができればよい）
+    """
+    dx = abs(end_x - start_x)
+    dy = abs(end_y - start_y)
+
+    x, y = start_x, start_y
+    step_x = 1 if start_x < end_x else -1
+    step_y = 1 if start_y < end_y else -1
+
+    if dx > dy:
+        err = dx / 2.0
+        while x != end_x:
+            x += step_x
+            err -= dy
+            if err < 0:
+                y += step_y
+                err += dx
+            if (x != end_x or y != end_y) and (x, y) in walls:
+                return False
+    else:
+        err = dy / 2.0
+        while y != end_y:
+            y += step_y
+            err -= dx
+            if err < 0:
+                x += step_x
+                err += dy
+            if (x != end_x or y != end_y) and (x, y) in walls:
+                return False
+
+    return True
+
+
+class LineOfSightCache:
+    """壁集合1つ分の視線判定キャッシュ（LRUで上限件数を保持）
+
+    ``cones`` は同じ壁集合から導かれる敵の視野範囲のキャッシュ（Enemy.get_vision_coneが利用）。
+    """
+
+    __slots__ = ("walls", "max_entries", "_cache", "hits", "misses", "cones")
+
+    def __init__(self, walls: Iterable[Tuple[int, int]], max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.walls = frozenset(walls)
+        self.max_entries = max_entries
+        self._cache: "OrderedDict[Tuple[int, int, int, int], bool]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.cones: Dict[Any, Any] = {}
+
+    def has_line_of_sight(self, start_x: int, start_y: int, end_x: int, end_y: int) -> bool:
+        """視線が通っているか（結果はキャッシュされる）"""
+        key = (start_x, start_y, end_x, end_y)
+        cache = self._cache
+        result = cache.get(key)
+        if result is not None:
+            self.hits += 1
+            cache.move_to_end(key)
+            return result
+
+        self.misses += 1
+        result = trace_line_of_sight(start_x, start_y, end_x, end_y, self.walls)
+        cache[key] = result
+        if len(cache) > self.max_entries:
+            cache.popitem(last=False)
+        return result
+
+    def clear(self) -> None:
+        """キャッシュを破棄"""
+        self._cache.clear()
+        self.cones.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+def get_board_cache(board) -> LineOfSightCache:
+    """ボードに紐づく視線キャッシュを取得（初回のみ作成）
+
+    キャッシュはボードオブジェクトに保持するため、ボードが差し替えられると自動的に作り直される。
+    """
+    cache = getattr(board, "_los_cache", None)
+    if cache is None:
+        cache = LineOfSightCache((pos.x, pos.y) for pos in board.walls)
+        board._los_cache = cache
+    return cache
+
+
+__all__ = [
+    "DEFAULT_MAX_ENTRIES", "LineOfSightCache", "trace_line_of_sight", "get_board_cache",
+]
@@ -183,7 +183,8 @@ class GameLoop:
             width=stage.board_size[0],
             height=stage.board_size[1],
             walls=stage.walls,
-            forbidden_cells=stage.forbidden_cells
+            forbidden_cells=stage.forbidden_cells,
+            cell_grid=stage.cell_grid
         )
         
         # 敵作成
@@ -13,6 +13,10 @@ import threading
 import time
 
 from . import GameState, GameStatus, Position
+from .spilling_history import SpillingHistory
+
+# 挑戦中のアクション・エラー記録をメモリに保持する件数（超えた分は一時ファイルへ退避）
+ATTEMPT_LOG_MEMORY_LIMIT = 1000
 
 
 class SkillLevel(Enum):
@@ -370,7 +374,10 @@ class ProgressionManager:
             self.current_session = StageAttempt(
                 stage_id=stage_id,
                 attempt_number=0,  # add_stage_attempt で設定される
-                start_time=datetime.now()
+                start_time=datetime.now(),
+                # 長時間の挑戦でもメモリを一定に保つため、古い記録は一時ファイルへ退避
+                actions_taken=SpillingHistory(ATTEMPT_LOG_MEMORY_LIMIT),
+                errors_made=SpillingHistory(ATTEMPT_LOG_MEMORY_LIMIT)
             )
             
             print(f"🎯 ステージ挑戦開始: {stage_id}")
@@ -526,8 +533,8 @@ class ProgressionManager:
             "result": attempt.result.value if attempt.result else None,
             "turns_used": attempt.turns_used,
             "max_turns": attempt.max_turns,
-            "actions_taken": attempt.actions_taken,
-            "errors_made": attempt.errors_made,
+            "actions_taken": list(attempt.actions_taken),
+            "errors_made": list(attempt.errors_made),
             "hints_used": attempt.hints_used,
             "success": attempt.success
         }
@@ -4,10 +4,15 @@ Rendererベースクラス、テキスト表示機能、pygame GUI機能
 """
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from typing import Dict, Any, List, Optional, Tuple
+import os
+import shutil
 import sys
+import threading
+import time
 from datetime import datetime
-from . import GameState, Position, Direction, GameStatus
+from . import GameState, Position, Direction, GameStatus, EnemyMode, EnemyType
 from .layout_constraint_manager import LayoutConstraintManager, LayoutConstraintViolation
 from .event_processing_engine import EventProcessingEngine, EventPriority
 
@@ -22,8 +27,12 @@ except ImportError:
 try:
     import pygame
     PYGAME_AVAILABLE = True
+    # ウィンドウ再表示イベント（部分転送中でも画面全体の再転送が必要）
+    _EXPOSE_EVENTS = tuple(getattr(pygame, name) for name in ("VIDEOEXPOSE", "WINDOWEXPOSED")
+                           if hasattr(pygame, name))
 except ImportError:
     PYGAME_AVAILABLE = False
+    _EXPOSE_EVENTS = ()
     print("⚠️ pygame が見つかりません。GUIレンダラーは使用できません。")
 
 
@@ -68,8 +77,19 @@ class Renderer(ABC):
                 print(f"Observer error: {e}")
 
 
+# CUI差分出力の表示間隔（秒）。1間隔内の複数回の描画は最後のフレームだけを1回で書き込む
+CUI_DISPLAY_TICK = 1 / 30
+
+
 class CuiRenderer(Renderer):
-    """CUIテキストレンダラー"""
+    """CUIテキストレンダラー
+    
+    端末（TTY）への出力では盤面を画面上部に固定し、2回目以降は変化したセルだけを
+    ANSIカーソル移動で書き換える（その他の出力は盤面の下の領域でスクロールする）。
+    差分の書き込みは display_tick 秒に1回までとし、間隔内の描画は間隔の終わりにまとめて書き込む
+    （カーソル位置を保存・復元するため、他の出力の途中に書き込まれても表示は崩れない）。
+    パイプ・ファイルへの出力や環境変数 ROGUELIKE_CUI_DIFF=0 の場合は毎回フレーム全体を出力する。
+    """
     
     def __init__(self):
         super().__init__()
@@ -90,46 +110,44 @@ class CuiRenderer(Renderer):
         }
         self.current_frame: List[List[str]] = []
         self.show_debug = False
+        # 地形（空きマス・壁・移動禁止マス・ゴール）だけを描いたフレーム（ボードごとにキャッシュ）
+        self._terrain_frame: Optional[List[List[str]]] = None
+        self._terrain_board = None
+        self._terrain_key = None
+        # 端末に表示中のフレーム（差分出力用, Noneなら次回は全体を描画）
+        self._shown_frame: Optional[List[List[str]]] = None
+        # 差分出力の間引き（書き込み待ちのフレームは間隔の終わりにタイマーで書き込む）
+        self.display_tick = CUI_DISPLAY_TICK
+        self._output_lock = threading.Lock()
+        self._pending_frame: Optional[List[List[str]]] = None
+        self._flush_timer: Optional[threading.Timer] = None
+        self._last_write = 0.0
     
     def initialize(self, width: int, height: int) -> None:
         """CUIレンダラーを初期化"""
         self.width = width
         self.height = height
         self.current_frame = [['.' for _ in range(width)] for _ in range(height)]
+        self._terrain_frame = None
+        self._release_terminal()
         print("📺 CUIレンダラー初期化完了")
     
     def render_frame(self, game_state: GameState) -> None:
         """ゲーム状態をテキストフレームに描画"""
-        # フレームをクリア
-        for y in range(self.height):
-            for x in range(self.width):
-                self.current_frame[y][x] = self.symbol_map['empty']
-        
-        # 壁を描画
-        for wall_pos in game_state.board.walls:
-            if self._is_valid_position(wall_pos):
-                self.current_frame[wall_pos.y][wall_pos.x] = self.symbol_map['wall']
-        
-        # 移動禁止マスを描画
-        for forbidden_pos in game_state.board.forbidden_cells:
-            if self._is_valid_position(forbidden_pos):
-                self.current_frame[forbidden_pos.y][forbidden_pos.x] = self.symbol_map['forbidden']
-        
-        # ゴールを描画
-        if game_state.goal_position and self._is_valid_position(game_state.goal_position):
-            self.current_frame[game_state.goal_position.y][game_state.goal_position.x] = self.symbol_map['goal']
+        # 地形フレームをコピー（描き終えてから差し替え、書き込み待ちのフレームは変更しない）
+        frame = [row[:] for row in self._get_terrain_frame(game_state)]
         
         # アイテムを描画
         for item in game_state.items:
             if self._is_valid_position(item.position):
-                self.current_frame[item.position.y][item.position.x] = self.symbol_map['item']
+                frame[item.position.y][item.position.x] = self.symbol_map['item']
         
         # 敵を描画
         for enemy in game_state.enemies:
             occupied_positions = enemy.get_occupied_positions()
             for pos in occupied_positions:
                 if self._is_valid_position(pos):
-                    self.current_frame[pos.y][pos.x] = self.symbol_map['enemy']
+                    frame[pos.y][pos.x] = self.symbol_map['enemy']
         
         # プレイヤーを描画（最後に描画して他の要素より優先）
         player_pos = game_state.player.position
@@ -139,22 +157,124 @@ class CuiRenderer(Renderer):
                 player_symbol = self.direction_symbols[game_state.player.direction]
             else:
                 player_symbol = self.symbol_map['player']
-            self.current_frame[player_pos.y][player_pos.x] = player_symbol
+            frame[player_pos.y][player_pos.x] = player_symbol
+        self.current_frame = frame
     
-    def update_display(self) -> None:
-        """フレームをコンソールに出力"""
-        # 画面をクリア（簡易版）
-        print("\n" + "=" * (self.width * 2 + 3))
+    def _get_terrain_frame(self, game_state: GameState) -> List[List[str]]:
+        """壁・移動禁止マス・ゴールを描いたフレーム（ボード・ゴールが変わったときだけ作り直す）"""
+        terrain_key = (game_state.goal_position, self.width, self.height)
+        if (self._terrain_frame is not None and self._terrain_board is game_state.board
+                and self._terrain_key == terrain_key):
+            return self._terrain_frame
         
-        # フレームを出力
-        for y in range(self.height):
-            line = "| "
-            for x in range(self.width):
-                line += self.current_frame[y][x] + " "
-            line += "|"
-            print(line)
+        frame = [[self.symbol_map['empty'] for _ in range(self.width)] for _ in range(self.height)]
         
-        print("=" * (self.width * 2 + 3))
+        # 壁を描画
+        for wall_pos in game_state.board.walls:
+            if self._is_valid_position(wall_pos):
+                frame[wall_pos.y][wall_pos.x] = self.symbol_map['wall']
+        
+        # 移動禁止マスを描画
+        for forbidden_pos in game_state.board.forbidden_cells:
+            if self._is_valid_position(forbidden_pos):
+                frame[forbidden_pos.y][forbidden_pos.x] = self.symbol_map['forbidden']
+        
+        # ゴールを描画
+        if game_state.goal_position and self._is_valid_position(game_state.goal_position):
+            frame[game_state.goal_position.y][game_state.goal_position.x] = self.symbol_map['goal']
+        
+        self._terrain_frame = frame
+        self._terrain_board = game_state.board
+        self._terrain_key = terrain_key
+        return frame
+    
+    def update_display(self) -> None:
+        """フレームをコンソールに出力（端末では変化したセルだけを表示間隔ごとに1回の書き込みで更新）"""
+        if self._uses_diff_output():
+            with self._output_lock:
+                self._pending_frame = self.current_frame
+                wait = self._last_write + self.display_tick - time.monotonic()
+                if self._shown_frame is None or wait <= 0:
+                    self._write_pending()
+                elif self._flush_timer is None:
+                    self._flush_timer = threading.Timer(wait, self.flush_display)
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
+            return
+        
+        self._release_terminal()
+        border = "=" * (self.width * 2 + 3)
+        lines = ["", border]
+        lines.extend("| " + " ".join(row) + " |" for row in self.current_frame)
+        lines.append(border)
+        print("\n".join(lines))
+    
+    def _uses_diff_output(self) -> bool:
+        """差分出力できるか（TTYで、盤面の下に出力用の行が残る高さがある場合）"""
+        if os.environ.get("ROGUELIKE_CUI_DIFF") == "0" or not self.current_frame:
+            return False
+        try:
+            if not sys.stdout.isatty():
+                return False
+        except (AttributeError, ValueError):
+            return False
+        return shutil.get_terminal_size().lines >= self.height + 5
+    
+    def flush_display(self) -> None:
+        """書き込み待ちのフレームがあれば今すぐ書き込む"""
+        with self._output_lock:
+            self._write_pending()
+    
+    def _write_pending(self) -> None:
+        """書き込み待ちのフレームを書き込む（_output_lockを保持して呼ぶ）"""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        frame, self._pending_frame = self._pending_frame, None
+        if frame is None:
+            return
+        output = self._frame_diff(frame)
+        if output:
+            sys.stdout.write(output)
+            sys.stdout.flush()
+            self._last_write = time.monotonic()
+    
+    def _frame_diff(self, frame: List[List[str]]) -> str:
+        """表示中のフレームから指定フレームへ更新するエスケープシーケンス"""
+        if self._shown_frame is None or len(self._shown_frame) != len(frame) \
+                or len(self._shown_frame[0]) != len(frame[0]):
+            # 初回: 画面を消して盤面を上部に描き、その下をスクロール領域にする
+            border = "=" * (self.width * 2 + 3)
+            rows = "\n".join("| " + " ".join(row) + " |" for row in frame)
+            terminal_rows = shutil.get_terminal_size().lines
+            output = (f"\x1b[2J\x1b[H{border}\n{rows}\n{border}"
+                      f"\x1b[{self.height + 3};{terminal_rows}r\x1b[{terminal_rows};1H")
+        else:
+            # 2回目以降: 変化したセルだけを書き換えてカーソル位置を戻す
+            parts = ["\x1b7"]
+            for y, (row, shown_row) in enumerate(zip(frame, self._shown_frame)):
+                if row == shown_row:
+                    continue
+                for x, (symbol, shown) in enumerate(zip(row, shown_row)):
+                    if symbol != shown:
+                        parts.append(f"\x1b[{y + 2};{x * 2 + 3}H{symbol}")
+            if len(parts) == 1:
+                return ""
+            parts.append("\x1b8")
+            output = "".join(parts)
+        
+        self._shown_frame = [row[:] for row in frame]
+        return output
+    
+    def _release_terminal(self) -> None:
+        """差分出力で設定したスクロール領域を解除（書き込み待ちのフレームは書き込んでから解除）"""
+        with self._output_lock:
+            self._write_pending()
+            if self._shown_frame is not None:
+                # スクロール領域の解除でカーソルが先頭に戻るため、最下行へ移動しておく
+                sys.stdout.write(f"\x1b[r\x1b[{shutil.get_terminal_size().lines};1H")
+                sys.stdout.flush()
+                self._shown_frame = None
     
     def render_game_info(self, game_state: GameState) -> None:
         """ゲーム情報を表示"""
@@ -249,6 +369,7 @@ class CuiRenderer(Renderer):
     
     def cleanup(self) -> None:
         """リソースをクリーンアップ"""
+        self._release_terminal()
         print("📺 CUIレンダラー終了")
     
     def _is_valid_position(self, pos: Position) -> bool:
@@ -256,6 +377,48 @@ class CuiRenderer(Renderer):
         return 0 <= pos.x < self.width and 0 <= pos.y < self.height
 
 
+# ビューポート: 一度に描画する最大セル数（横, 縦）。これより大きい盤面はプレイヤーに追従してスクロール
+MAX_VIEWPORT_CELLS = (30, 20)
+VIEWPORT_SCROLL_MARGIN = 3  # プレイヤーがビューポート端からこのセル数以内に来たらスクロール
+MINIMAP_MAX_SIZE = 120  # ミニマップの最大辺長（ピクセル）
+MINIMAP_MAX_CELL_PIXELS = 4  # ミニマップ1セルの最大ピクセル数
+
+# 描画済みテキストサーフェスのキャッシュ上限（ラベル・数値・ボタン文字列の種類数）
+MAX_TEXT_SURFACES = 1024
+
+
+class TextSurfaceCache:
+    """描画済みテキストサーフェスのLRUキャッシュ（フォント・文字列・色ごと）
+    
+    強調表示の違いはフォント（太字/通常）と色の違いとしてキーに含まれる。
+    返すサーフェスは共有されるため、呼び出し側で書き換えないこと。
+    """
+    
+    def __init__(self, max_entries: int = MAX_TEXT_SURFACES):
+        self.max_entries = max_entries
+        self._surfaces: "OrderedDict[Tuple[Any, str, Tuple[int, ...]], Any]" = OrderedDict()
+    
+    def __len__(self) -> int:
+        return len(self._surfaces)
+    
+    def render(self, font, text: str, color) -> "pygame.Surface":
+        """アンチエイリアス付きで描画したテキストを返す（同じ組み合わせは再描画しない）"""
+        key = (font, text, tuple(color))
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            return surface
+        
+        surface = font.render(text, True, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+    
+    def clear(self) -> None:
+        self._surfaces.clear()
+
+
 class GuiRenderer(Renderer):
     """pygame を使用したGUIレンダラー"""
     
@@ -378,6 +541,28 @@ class GuiRenderer(Renderer):
             # Turn boundary detection for highlighting management
             self.previous_execution_paused_for_turn = False
             self.action_completed = False
+        # 状態の版数が変わらない間は状態ハッシュ・ステータス追跡を再計算しない
+        self._state_hash_cache: Dict[str, Tuple[Any, str]] = {}  # 種別 -> (版数キー, ハッシュ)
+        self._idle_tracking_key = None  # 変化なし・強調表示なしで追跡済みの版数キー
+        # レイヤー描画: 地形はボードごと、ゲームエリアは状態の版数・表示設定ごとに描画してキャッシュ
+        self._terrain_layer = None
+        self._terrain_board = None
+        self._terrain_key = None
+        self._game_area_layer = None
+        self._game_area_key = None
+        self._game_area_rect = None
+        self._game_area_dirty = True
+        # 画面転送: 次回update_displayで転送する矩形（空・全体再描画待ちの場合は画面全体を転送）
+        self._dirty_rects = []
+        self._full_flip_pending = True
+        self._text_cache = TextSurfaceCache()
+        # ビューポート（描画するセル範囲, initializeで盤面サイズとmax_viewport_cellsから決定）
+        self.max_viewport_cells = MAX_VIEWPORT_CELLS
+        self.viewport_width = 0
+        self.viewport_height = 0
+        self.camera = (0, 0)  # ビューポート左上のセル座標
+        self._minimap_terrain = None
+        self._minimap_board = None
         self.button_rects = {}  # ボタン矩形管理
         
         # 🚀 v1.2.5: 7段階速度制御システム
@@ -386,6 +571,7 @@ class GuiRenderer(Renderer):
         self.current_speed_multiplier = 2  # デフォルトをx2に変更
         self.speed_button_rects = {}  # 速度ボタン矩形管理
         self.speed_warning_display = False  # 超高速警告表示フラグ
+        self.max_speed_mode = False  # 最高速モード表示フラグ
         
         # レイアウト制約管理（v1.2新機能）
         self.layout_constraint_manager = LayoutConstraintManager()
@@ -417,9 +603,14 @@ class GuiRenderer(Renderer):
         self.width = width
         self.height = height
         
+        # ビューポート（大きな盤面はプレイヤー周辺だけを描画）
+        self.viewport_width = min(width, self.max_viewport_cells[0])
+        self.viewport_height = min(height, self.max_viewport_cells[1])
+        self.camera = (0, 0)
+        
         # 画面サイズ計算
-        game_area_width = self.width * self.cell_size
-        game_area_height = self.height * self.cell_size
+        game_area_width = self.viewport_width * self.cell_size
+        game_area_height = self.viewport_height * self.cell_size
         
         # サイドバーに必要な最小高さを計算（動的計算用の初期値）
         # 初期化時はゲーム状態が不明なので、最大ケースを想定
@@ -439,6 +630,7 @@ class GuiRenderer(Renderer):
         pygame.display.init()  # ディスプレイ明示的初期化
         self.screen = pygame.display.set_mode((screen_width, screen_height))
         pygame.display.set_caption("Python初学者向けローグライク - GUI版")
+        self._full_flip_pending = True
         
         # ウィンドウをアクティブにする（macOS対応）
         import os
@@ -449,11 +641,12 @@ class GuiRenderer(Renderer):
         pygame.font.init()  # フォント明示的初期化
         self.font = pygame.font.Font(None, 24)
         self.small_font = pygame.font.Font(None, 18)
+        self._text_cache.clear()
         
         # レイアウト制約設定（v1.2新機能）
         self.layout_constraint_manager.set_layout_constraint(
-            game_width=self.width,
-            game_height=self.height, 
+            game_width=self.viewport_width,
+            game_height=self.viewport_height, 
             sidebar_width=self.sidebar_width,
             info_height=self.info_height,
             control_panel_height=self.control_panel_height,
@@ -567,54 +760,205 @@ class GuiRenderer(Renderer):
         # 🚀 v1.2.5: 7段階速度表示更新
         self.update_7stage_speed_display()
         
+        # 転送する矩形を決定（ゲームエリアが変化していなければ周囲のパネルだけ）
+        self._dirty_rects = self._collect_dirty_rects()
+        
         # イベント処理
         self._handle_events()
     
     def _draw_game_area(self, game_state: GameState) -> None:
-        """ゲームエリアを描画"""
+        """ゲームエリアを描画（状態の版数・表示設定が変わったときだけレイヤーを描き直す）"""
         start_x = self.margin + self.sidebar_width + self.margin  # サイドバーの右側に配置
         start_y = self.margin + self.control_panel_height + self.margin  # Execution Controlパネルの下に配置
+        self._game_area_rect = pygame.Rect(start_x, start_y,
+                                           self.viewport_width * self.cell_size,
+                                           self.viewport_height * self.cell_size)
+        self._update_camera(game_state.player.position)
+        
+        version_key = self._state_version_key(game_state)
+        layer_key = (version_key, self.width, self.height, self.camera, self.cell_size,
+                     self.show_grid, self.show_coordinates, self.show_enemy_vision)
+        if version_key is None or self._game_area_layer is None or layer_key != self._game_area_key:
+            self._game_area_layer = self._compose_game_area(game_state)
+            self._game_area_key = layer_key if version_key is not None else None
+            self._game_area_dirty = True
+        
+        self.screen.blit(self._game_area_layer, self._game_area_rect.topleft)
+    
+    def _compose_game_area(self, game_state: GameState) -> "pygame.Surface":
+        """地形レイヤーに動的レイヤー（エンティティ・視野・範囲攻撃・向き）を重ねたゲームエリアを作成"""
+        layer = self._get_terrain_layer(game_state).copy()
+        # レイヤー上の盤面原点（ビューポート左上のセルが(0, 0)に来る位置）
+        origin_x = -self.camera[0] * self.cell_size
+        origin_y = -self.camera[1] * self.cell_size
         
-        # 各セルを描画
-        for y in range(self.height):
-            for x in range(self.width):
-                cell_x = start_x + x * self.cell_size
-                cell_y = start_y + y * self.cell_size
-                cell_rect = pygame.Rect(cell_x, cell_y, self.cell_size, self.cell_size)
-                
-                # セルの種類を判定
-                pos = Position(x, y)
-                cell_type = self._get_cell_type(pos, game_state)
-                
-                # セルを描画
-                pygame.draw.rect(self.screen, self.colors[cell_type], cell_rect)
-                
-                # グリッド線を描画
-                if self.show_grid:
-                    pygame.draw.rect(self.screen, self.colors['grid'], cell_rect, 1)
-                
-                # 座標表示
-                if self.show_coordinates:
-                    coord_text = self.small_font.render(f"{x},{y}", True, self.colors['text'])
-                    text_rect = coord_text.get_rect()
-                    text_rect.topleft = (cell_x + 2, cell_y + 2)
-                    self.screen.blit(coord_text, text_rect)
+        # エンティティのセル
+        self._draw_entity_cells(game_state, layer)
         
         # 敵の視野範囲を描画（半透明オーバーレイ）
         if self.show_enemy_vision:
-            self._draw_enemy_vision(game_state, start_x, start_y)
+            self._draw_enemy_vision(game_state, origin_x, origin_y, surface=layer)
         
         # 範囲攻撃範囲を描画（半透明オーバーレイ）- v1.2.8特殊条件付きステージ
-        self._draw_area_attack_range(game_state, start_x, start_y)
+        self._draw_area_attack_range(game_state, origin_x, origin_y, surface=layer)
         
         # プレイヤーの向きを矢印で表示
-        self._draw_player_direction(game_state.player, start_x, start_y)
+        self._draw_player_direction(game_state.player, origin_x, origin_y, surface=layer)
         
-        # 敵の向きを矢印で表示とインデックス表示
+        # 敵の向きを矢印で表示とインデックス表示（ビューポート外の敵は省略）
         for i, enemy in enumerate(game_state.enemies):
+            if enemy.is_alive() and self._is_near_viewport(enemy.position, 0):
+                self._draw_enemy_direction(enemy, origin_x, origin_y, surface=layer)
+                self._draw_enemy_index(enemy, i + 1, origin_x, origin_y, surface=layer)
+        
+        # 盤面全体が収まらない場合はミニマップ
+        if self.uses_viewport:
+            self._draw_minimap(game_state, layer)
+        
+        return layer
+    
+    @property
+    def uses_viewport(self) -> bool:
+        """盤面の一部だけを描画しているか"""
+        return self.viewport_width < self.width or self.viewport_height < self.height
+    
+    def _update_camera(self, focus: Position) -> None:
+        """プレイヤーがビューポート端に近づいたらスクロール（盤面外は表示しない）"""
+        if not self.uses_viewport:
+            self.camera = (0, 0)
+            return
+        
+        def scroll(start: int, pos: int, view: int, total: int) -> int:
+            margin = min(VIEWPORT_SCROLL_MARGIN, (view - 1) // 2)
+            if pos < start + margin:
+                start = pos - margin
+            elif pos > start + view - 1 - margin:
+                start = pos - (view - 1 - margin)
+            return max(0, min(start, total - view))
+        
+        self.camera = (scroll(self.camera[0], focus.x, self.viewport_width, self.width),
+                       scroll(self.camera[1], focus.y, self.viewport_height, self.height))
+    
+    def _is_visible(self, pos: Position) -> bool:
+        """ビューポート内のセルか"""
+        return (self.camera[0] <= pos.x < self.camera[0] + self.viewport_width
+                and self.camera[1] <= pos.y < self.camera[1] + self.viewport_height)
+    
+    def _is_near_viewport(self, pos: Position, reach: int) -> bool:
+        """ビューポートからreachセル以内か（大型敵・視野など位置からはみ出す描画の判定用）"""
+        reach += 3  # 最大の敵サイズ分
+        return (self.camera[0] - reach <= pos.x < self.camera[0] + self.viewport_width + reach
+                and self.camera[1] - reach <= pos.y < self.camera[1] + self.viewport_height + reach)
+    
+    def _draw_minimap(self, game_state: GameState, surface: "pygame.Surface") -> None:
+        """盤面全体の縮小図（地形・敵・プレイヤー・ビューポート枠）を右上に描画"""
+        scale = min(MINIMAP_MAX_SIZE / self.width, MINIMAP_MAX_SIZE / self.height, MINIMAP_MAX_CELL_PIXELS)
+        map_size = (max(1, int(self.width * scale)), max(1, int(self.height * scale)))
+        if self._minimap_board is not game_state.board or self._minimap_terrain is None \
+                or self._minimap_terrain.get_size() != map_size:
+            # 1セル1ピクセルで地形を描いてから縮小（ボードごとにキャッシュ）
+            terrain = pygame.Surface((self.width, self.height))
+            terrain.fill(self.colors['empty'])
+            for y in range(self.height):
+                for x in range(self.width):
+                    cell_type = self._get_terrain_cell_type(Position(x, y), game_state)
+                    if cell_type != 'empty':
+                        terrain.set_at((x, y), self.colors[cell_type])
+            self._minimap_terrain = pygame.transform.scale(terrain, map_size)
+            self._minimap_board = game_state.board
+        
+        minimap = self._minimap_terrain.copy()
+        dot = max(1, int(scale))
+        for enemy in game_state.enemies:
             if enemy.is_alive():
-                self._draw_enemy_direction(enemy, start_x, start_y)
-                self._draw_enemy_index(enemy, i + 1, start_x, start_y)
+                pygame.draw.rect(minimap, self.colors[self._get_enemy_cell_type(enemy)],
+                                 (int(enemy.position.x * scale), int(enemy.position.y * scale), dot, dot))
+        player = game_state.player.position
+        pygame.draw.rect(minimap, self.colors['player'],
+                         (int(player.x * scale), int(player.y * scale), dot + 1, dot + 1))
+        view_rect = pygame.Rect(int(self.camera[0] * scale), int(self.camera[1] * scale),
+                                max(2, int(self.viewport_width * scale)), max(2, int(self.viewport_height * scale)))
+        pygame.draw.rect(minimap, (255, 255, 255), view_rect, 1)
+        
+        map_x = surface.get_width() - map_size[0] - 4
+        map_y = 4
+        pygame.draw.rect(surface, self.colors['grid'], (map_x - 2, map_y - 2, map_size[0] + 4, map_size[1] + 4))
+        surface.blit(minimap, (map_x, map_y))
+    
+    def _get_terrain_layer(self, game_state: GameState) -> "pygame.Surface":
+        """壁・移動禁止マス・ゴール・グリッド線・座標の描画済みレイヤー（ボードごとにキャッシュ）"""
+        terrain_key = (game_state.goal_position, self.width, self.height, self.camera,
+                       self.viewport_width, self.viewport_height, self.cell_size,
+                       self.show_grid, self.show_coordinates)
+        if (self._terrain_layer is not None and self._terrain_board is game_state.board
+                and self._terrain_key == terrain_key):
+            return self._terrain_layer
+        
+        # ビューポート内のセルだけを描画
+        camera_x, camera_y = self.camera
+        layer = pygame.Surface((self.viewport_width * self.cell_size, self.viewport_height * self.cell_size))
+        for y in range(camera_y, camera_y + self.viewport_height):
+            for x in range(camera_x, camera_x + self.viewport_width):
+                self._draw_cell(layer, x, y, self._get_terrain_cell_type(Position(x, y), game_state))
+        
+        self._terrain_layer = layer
+        self._terrain_board = game_state.board
+        self._terrain_key = terrain_key
+        return layer
+    
+    def _draw_entity_cells(self, game_state: GameState, surface: "pygame.Surface") -> None:
+        """プレイヤー・敵・アイテムのいるセルを描画（地形と同じ優先順位: プレイヤー＞地形＞敵＞アイテム）"""
+        cells: Dict[Position, str] = {}
+        for enemy in game_state.enemies:
+            if not self._is_near_viewport(enemy.position, 0):
+                continue
+            cell_type = self._get_enemy_cell_type(enemy)
+            for pos in enemy.get_occupied_positions():
+                cells.setdefault(pos, cell_type)
+        for item in game_state.items:
+            cells.setdefault(item.position, 'item')
+        
+        for pos, cell_type in cells.items():
+            if self._is_visible(pos) and self._get_terrain_cell_type(pos, game_state) == 'empty':
+                self._draw_cell(surface, pos.x, pos.y, cell_type)
+        
+        player_pos = game_state.player.position
+        if self._is_visible(player_pos):
+            self._draw_cell(surface, player_pos.x, player_pos.y, 'player')
+    
+    def _draw_cell(self, surface: "pygame.Surface", x: int, y: int, cell_type: str) -> None:
+        """1セル分（塗りつぶし・グリッド線・座標）をビューポート上の位置に描画"""
+        cell_rect = pygame.Rect((x - self.camera[0]) * self.cell_size, (y - self.camera[1]) * self.cell_size,
+                                self.cell_size, self.cell_size)
+        
+        # セルを描画
+        pygame.draw.rect(surface, self.colors[cell_type], cell_rect)
+        
+        # グリッド線を描画
+        if self.show_grid:
+            pygame.draw.rect(surface, self.colors['grid'], cell_rect, 1)
+        
+        # 座標表示
+        if self.show_coordinates:
+            coord_text = self._render_text(self.small_font, f"{x},{y}", self.colors['text'])
+            text_rect = coord_text.get_rect()
+            text_rect.topleft = (cell_rect.x + 2, cell_rect.y + 2)
+            surface.blit(coord_text, text_rect)
+    
+    def _collect_dirty_rects(self) -> List["pygame.Rect"]:
+        """次回update_displayで転送する矩形（ゲームエリアが変化していれば画面全体）"""
+        screen_rect = self.screen.get_rect()
+        area = self._game_area_rect
+        if self._game_area_dirty or area is None:
+            return [screen_rect]
+        
+        strips = [
+            pygame.Rect(0, 0, screen_rect.width, area.top),
+            pygame.Rect(0, area.bottom, screen_rect.width, screen_rect.height - area.bottom),
+            pygame.Rect(0, area.top, area.left, area.height),
+            pygame.Rect(area.right, area.top, screen_rect.width - area.right, area.height),
+        ]
+        return [rect for rect in strips if rect.width > 0 and rect.height > 0]
     
     def _get_cell_type(self, pos: Position, game_state: GameState) -> str:
         """位置のセル種類を取得"""
@@ -622,46 +966,55 @@ class GuiRenderer(Renderer):
         if pos == game_state.player.position:
             return 'player'
         
+        # 壁・移動禁止マス・ゴールチェック
+        terrain_type = self._get_terrain_cell_type(pos, game_state)
+        if terrain_type != 'empty':
+            return terrain_type
+        
+        # 敵チェック（v1.2.8: モード別色分け対応）
+        enemy = game_state.get_enemy_at(pos)
+        if enemy is not None:
+            return self._get_enemy_cell_type(enemy)
+        
+        # アイテムチェック
+        if game_state.get_item_at(pos) is not None:
+            return 'item'
+        
+        # 通常の空きマス
+        return 'empty'
+    
+    def _get_terrain_cell_type(self, pos: Position, game_state: GameState) -> str:
+        """位置の地形セル種類を取得（wall / forbidden / goal / empty）"""
         # 壁チェック
-        if pos in game_state.board.walls:
+        if game_state.board.is_wall(pos):
             return 'wall'
         
         # 移動禁止マスチェック
-        if pos in game_state.board.forbidden_cells:
+        if game_state.board.is_forbidden(pos):
             return 'forbidden'
         
         # ゴール位置チェック
         if game_state.goal_position and pos == game_state.goal_position:
             return 'goal'
         
-        # 敵チェック（v1.2.8: モード別色分け対応）
-        for enemy in game_state.enemies:
-            if pos in enemy.get_occupied_positions():
-                # 敵のモードに基づいて色を決定
-                if hasattr(enemy, 'enemy_mode'):
-                    from . import EnemyMode, EnemyType
-                    if enemy.enemy_type == EnemyType.SPECIAL_2X3:
-                        return 'enemy_special'
-                    elif enemy.enemy_mode == EnemyMode.RAGE:
-                        return 'enemy_rage'
-                    elif enemy.enemy_mode == EnemyMode.TRANSITIONING:
-                        return 'enemy_transitioning'
-                    elif enemy.enemy_mode == EnemyMode.HUNTING:
-                        return 'enemy_hunting'
-                    else:  # CALM mode
-                        return 'enemy_calm'
-                else:
-                    return 'enemy'
-        
-        # アイテムチェック
-        for item in game_state.items:
-            if pos == item.position:
-                return 'item'
-        
-        # 通常の空きマス
         return 'empty'
     
-    def _draw_player_direction(self, player, start_x: int, start_y: int) -> None:
+    def _get_enemy_cell_type(self, enemy) -> str:
+        """敵のセル種類を取得（モード別色分け）"""
+        if hasattr(enemy, 'enemy_mode'):
+            if enemy.enemy_type == EnemyType.SPECIAL_2X3:
+                return 'enemy_special'
+            elif enemy.enemy_mode == EnemyMode.RAGE:
+                return 'enemy_rage'
+            elif enemy.enemy_mode == EnemyMode.TRANSITIONING:
+                return 'enemy_transitioning'
+            elif enemy.enemy_mode == EnemyMode.HUNTING:
+                return 'enemy_hunting'
+            else:  # CALM mode
+                return 'enemy_calm'
+        return 'enemy'
+    
+    def _draw_player_direction(self, player, start_x: int, start_y: int, surface=None) -> None:
         """プレイヤーの向きを矢印で表示"""
         player_x = start_x + player.position.x * self.cell_size + self.cell_size // 2
         player_y = start_y + player.position.y * self.cell_size + self.cell_size // 2
@@ -681,10 +1034,10 @@ class GuiRenderer(Renderer):
             end_y = player_y + dy
             
             # 矢印を描画（太い線）
-            pygame.draw.line(self.screen, (255, 255, 255), 
+            pygame.draw.line(self.screen if surface is None else surface, (255, 255, 255), 
                            (player_x, player_y), (end_x, end_y), 3)
     
-    def _draw_enemy_direction(self, enemy, start_x: int, start_y: int) -> None:
+    def _draw_enemy_direction(self, enemy, start_x: int, start_y: int, surface=None) -> None:
         """敵の向きを矢印で表示"""
         enemy_x = start_x + enemy.position.x * self.cell_size + self.cell_size // 2
         enemy_y = start_y + enemy.position.y * self.cell_size + self.cell_size // 2
@@ -704,17 +1057,19 @@ class GuiRenderer(Renderer):
             end_y = enemy_y + dy
             
             # 敵の矢印を描画（黄色で表示）
-            pygame.draw.line(self.screen, (255, 255, 0), 
+            pygame.draw.line(self.screen if surface is None else surface, (255, 255, 0), 
                            (enemy_x, enemy_y), (end_x, end_y), 2)
     
-    def _draw_enemy_index(self, enemy, index: int, start_x: int, start_y: int) -> None:
+    def _draw_enemy_index(self, enemy, index: int, start_x: int, start_y: int, surface=None) -> None:
         """敵のインデックス番号を右下に表示"""
+        if surface is None:
+            surface = self.screen
         enemy_x = start_x + enemy.position.x * self.cell_size
         enemy_y = start_y + enemy.position.y * self.cell_size
         
         # セルの右下にインデックス番号を表示
         index_text = str(index)
-        index_surface = self.small_font.render(index_text, True, (255, 255, 255))
+        index_surface = self._render_text(self.small_font, index_text, (255, 255, 255))
         
         # 右下の位置に配置（少し内側にマージンを取る）
         text_x = enemy_x + self.cell_size - index_surface.get_width() - 3
@@ -724,10 +1079,10 @@ class GuiRenderer(Renderer):
         bg_rect = pygame.Rect(text_x - 2, text_y - 1, 
                              index_surface.get_width() + 4, 
                              index_surface.get_height() + 2)
-        pygame.draw.rect(self.screen, (0, 0, 0), bg_rect)  # 黒背景
+        pygame.draw.rect(surface, (0, 0, 0), bg_rect)  # 黒背景
         
         # インデックス番号を描画
-        self.screen.blit(index_surface, (text_x, text_y))
+        surface.blit(index_surface, (text_x, text_y))
     
     def _get_dynamic_legend_items(self, game_state: GameState) -> List[Tuple[str, Tuple[int, int, int], str]]:
         """ゲーム状態に応じて動的に凡例項目を生成"""
@@ -799,12 +1154,12 @@ class GuiRenderer(Renderer):
         
         # ステージ情報を左上に表示（v1.2.11 動的表示対応）
         stage_info_text = self.current_stage_name
-        stage_info_surface = self.small_font.render(stage_info_text, True, self.colors['text'])
+        stage_info_surface = self._render_text(self.small_font, stage_info_text, self.colors['text'])
         self.screen.blit(stage_info_surface, (self.margin, self.margin + 5))
         
         # サイドバー背景（動的高さ計算）
         dynamic_sidebar_height = self._calculate_dynamic_sidebar_height(game_state)
-        calculated_height = self.height * self.cell_size
+        calculated_height = self.viewport_height * self.cell_size
         sidebar_height = max(calculated_height, dynamic_sidebar_height)
         sidebar_rect = pygame.Rect(sidebar_x, sidebar_y, 
                                  self.sidebar_width, 
@@ -855,22 +1210,22 @@ class GuiRenderer(Renderer):
                     change_text = f"({change_symbol}{abs(hp_change)})"
 
                     # Draw base text in default color
-                    base_surface = font.render(base_text, True, self.colors['text'])
+                    base_surface = self._render_text(font, base_text, self.colors['text'])
                     self.screen.blit(base_surface, (sidebar_x + 20, y_offset))
                     x_offset = sidebar_x + 20 + base_surface.get_width()
 
                     # Draw value in highlight color
-                    value_surface = font.render(value_text, True, highlight_color)
+                    value_surface = self._render_text(font, value_text, highlight_color)
                     self.screen.blit(value_surface, (x_offset, y_offset))
                     x_offset += value_surface.get_width()
 
                     # Draw suffix in default color
-                    suffix_surface = font.render(suffix_text, True, self.colors['text'])
+                    suffix_surface = self._render_text(font, suffix_text, self.colors['text'])
                     self.screen.blit(suffix_surface, (x_offset, y_offset))
                     x_offset += suffix_surface.get_width()
 
                     # Draw change in highlight color
-                    change_surface = font.render(change_text, True, highlight_color)
+                    change_surface = self._render_text(font, change_text, highlight_color)
                     self.screen.blit(change_surface, (x_offset, y_offset))
 
                     y_offset += base_surface.get_height() + 2
@@ -905,19 +1260,19 @@ class GuiRenderer(Renderer):
                         change_text = f"({change_symbol}{abs(stamina_change)})"
 
                         # Draw stamina with highlighting
-                        base_surface = font.render(base_text, True, self.colors['text'])
+                        base_surface = self._render_text(font, base_text, self.colors['text'])
                         self.screen.blit(base_surface, (sidebar_x + 20, y_offset))
                         x_offset = sidebar_x + 20 + base_surface.get_width()
 
-                        value_surface = font.render(value_text, True, highlight_color)
+                        value_surface = self._render_text(font, value_text, highlight_color)
                         self.screen.blit(value_surface, (x_offset, y_offset))
                         x_offset += value_surface.get_width()
 
-                        suffix_surface = font.render(suffix_text, True, self.colors['text'])
+                        suffix_surface = self._render_text(font, suffix_text, self.colors['text'])
                         self.screen.blit(suffix_surface, (x_offset, y_offset))
                         x_offset += suffix_surface.get_width()
 
-                        change_surface = font.render(change_text, True, highlight_color)
+                        change_surface = self._render_text(font, change_text, highlight_color)
                         self.screen.blit(change_surface, (x_offset, y_offset))
 
                         y_offset += base_surface.get_height() + 2
@@ -954,22 +1309,22 @@ class GuiRenderer(Renderer):
                     change_text = f"({change_symbol}{abs(attack_change)})"
 
                     # Draw base text in default color
-                    base_surface = font.render(base_text, True, self.colors['text'])
+                    base_surface = self._render_text(font, base_text, self.colors['text'])
                     self.screen.blit(base_surface, (sidebar_x + 20, y_offset))
                     x_offset = sidebar_x + 20 + base_surface.get_width()
 
                     # Draw value in highlight color
-                    value_surface = font.render(value_text, True, highlight_color)
+                    value_surface = self._render_text(font, value_text, highlight_color)
                     self.screen.blit(value_surface, (x_offset, y_offset))
                     x_offset += value_surface.get_width()
 
                     # Draw space in default color
-                    space_surface = font.render(space_text, True, self.colors['text'])
+                    space_surface = self._render_text(font, space_text, self.colors['text'])
                     self.screen.blit(space_surface, (x_offset, y_offset))
                     x_offset += space_surface.get_width()
 
                     # Draw change in highlight color
-                    change_surface = font.render(change_text, True, highlight_color)
+                    change_surface = self._render_text(font, change_text, highlight_color)
                     self.screen.blit(change_surface, (x_offset, y_offset))
 
                     y_offset += base_surface.get_height() + 2
@@ -1060,22 +1415,22 @@ class GuiRenderer(Renderer):
                             change_text = f"({change_symbol}{abs(hp_change)})"
 
                             # Draw base text in default color
-                            base_surface = font.render(base_text, True, self.colors['text'])
+                            base_surface = self._render_text(font, base_text, self.colors['text'])
                             self.screen.blit(base_surface, (sidebar_x + 20, y_offset))
                             x_offset = sidebar_x + 20 + base_surface.get_width()
 
                             # Draw value in highlight color
-                            value_surface = font.render(value_text, True, highlight_color)
+                            value_surface = self._render_text(font, value_text, highlight_color)
                             self.screen.blit(value_surface, (x_offset, y_offset))
                             x_offset += value_surface.get_width()
 
                             # Draw suffix in default color
-                            suffix_surface = font.render(suffix_text, True, self.colors['text'])
+                            suffix_surface = self._render_text(font, suffix_text, self.colors['text'])
                             self.screen.blit(suffix_surface, (x_offset, y_offset))
                             x_offset += suffix_surface.get_width()
 
                             # Draw change in highlight color
-                            change_surface = font.render(change_text, True, highlight_color)
+                            change_surface = self._render_text(font, change_text, highlight_color)
                             self.screen.blit(change_surface, (x_offset, y_offset))
 
                             y_offset += base_surface.get_height() + 2
@@ -1111,22 +1466,22 @@ class GuiRenderer(Renderer):
                             change_text = f"({change_symbol}{abs(attack_change)})"
 
                             # Draw base text in default color
-                            base_surface = font.render(base_text, True, self.colors['text'])
+                            base_surface = self._render_text(font, base_text, self.colors['text'])
                             self.screen.blit(base_surface, (sidebar_x + 20, y_offset))
                             x_offset = sidebar_x + 20 + base_surface.get_width()
 
                             # Draw value in highlight color
-                            value_surface = font.render(value_text, True, highlight_color)
+                            value_surface = self._render_text(font, value_text, highlight_color)
                             self.screen.blit(value_surface, (x_offset, y_offset))
                             x_offset += value_surface.get_width()
 
                             # Draw space in default color
-                            space_surface = font.render(space_text, True, self.colors['text'])
+                            space_surface = self._render_text(font, space_text, self.colors['text'])
                             self.screen.blit(space_surface, (x_offset, y_offset))
                             x_offset += space_surface.get_width()
 
                             # Draw change in highlight color
-                            change_surface = font.render(change_text, True, highlight_color)
+                            change_surface = self._render_text(font, change_text, highlight_color)
                             self.screen.blit(change_surface, (x_offset, y_offset))
 
                             y_offset += base_surface.get_height() + 2
@@ -1200,7 +1555,7 @@ class GuiRenderer(Renderer):
         except LayoutConstraintViolation as e:
             # 制約違反時はフォールバック表示
             print(f"⚠️ レイアウト制約違反: {e}")
-            info_y = self.height * self.cell_size + self.margin * 2
+            info_y = self.viewport_height * self.cell_size + self.margin * 2
             safe_info_rect = pygame.Rect(self.margin, info_y, 200, self.info_height)
         
         # 背景描画
@@ -1237,12 +1592,16 @@ class GuiRenderer(Renderer):
             remaining_turns = game_state.max_turns - game_state.turn_count
             return f"🎮 Playing... Turns: {remaining_turns}/{game_state.max_turns}"
     
+    def _render_text(self, font, text: str, color) -> "pygame.Surface":
+        """テキストサーフェスを取得（キャッシュ済みなら再描画しない）"""
+        return self._text_cache.render(font, text, color)
+    
     def _draw_text(self, text: str, x: int, y: int, font: pygame.font.Font, color: Tuple[int, int, int] = None) -> None:
         """テキストを描画"""
         if color is None:
             color = self.colors['text']
         
-        text_surface = font.render(text, True, color)
+        text_surface = self._render_text(font, text, color)
         self.screen.blit(text_surface, (x, y))
     
     def _handle_events(self) -> None:
@@ -1256,6 +1615,9 @@ class GuiRenderer(Renderer):
         
         # システム終了イベントの個別処理
         for event in pygame_events:
+            if event.type in _EXPOSE_EVENTS:
+                # ウィンドウが再表示されたら次回は画面全体を転送
+                self._full_flip_pending = True
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -1288,15 +1650,32 @@ class GuiRenderer(Renderer):
                 print(f"   {event.event_type.value}: {event.success}")
     
     def update_display(self) -> None:
-        """ディスプレイを更新"""
+        """ディスプレイを更新（変化した領域だけを転送）"""
         if self.screen:
-            pygame.display.flip()
+            if self._full_flip_pending or not self._dirty_rects:
+                pygame.display.flip()
+            else:
+                pygame.display.update(self._dirty_rects)
+            self._dirty_rects = []
+            self._full_flip_pending = False
+            self._game_area_dirty = False
             self.clock.tick(60)  # 60 FPS
 
+    def _state_version_key(self, game_state: GameState) -> Optional[Tuple[int, int]]:
+        """ゲーム状態の版数キー（GameState以外はNone＝キャッシュしない）"""
+        if not isinstance(game_state, GameState):
+            return None
+        return (id(game_state), game_state.version)
+
     def _compute_game_state_hash(self, game_state: GameState) -> str:
         """
         Compute a hash of the current game state for action boundary detection.
         """
+        version_key = self._state_version_key(game_state)
+        cached = self._state_hash_cache.get("action")
+        if version_key is not None and cached is not None and cached[0] == version_key:
+            return cached[1]
+
         # Create a simple hash based on key game state components
         hash_components = []
 
@@ -1315,7 +1694,10 @@ class GuiRenderer(Renderer):
         if hasattr(game_state, 'status'):
             hash_components.append(f"status_{game_state.status}")
 
-        return "|".join(sorted(hash_components))
+        state_hash = "|".join(sorted(hash_components))
+        if version_key is not None:
+            self._state_hash_cache["action"] = (version_key, state_hash)
+        return state_hash
     
     def render_complete_view(self, game_state: GameState, show_legend: bool = True) -> None:
         """完全なビューを描画"""
@@ -1358,7 +1740,7 @@ class GuiRenderer(Renderer):
         
         y_offset = text_rect.bottom + 30
         for detail in details:
-            detail_text = self.font.render(detail, True, (255, 255, 255))
+            detail_text = self._render_text(self.font, detail, (255, 255, 255))
             detail_rect = detail_text.get_rect(center=(self.screen.get_width() // 2, y_offset))
             self.screen.blit(detail_text, detail_rect)
             y_offset += 30
@@ -1467,7 +1849,7 @@ class GuiRenderer(Renderer):
         """🚀 v1.2.5: 3段構成拡張コントロールパネル描画"""
         
         # Tier 1: パネル名表示
-        title_text = self.font.render("🚀 Execution Control v1.2.5", True, self.colors['text'])
+        title_text = self._render_text(self.font, "🚀 Execution Control v1.2.5", self.colors['text'])
         self.screen.blit(title_text, (control_x + 10, panel_y + 5))
         
         # Tier 2: 実行制御ボタン（既存）
@@ -1499,7 +1881,7 @@ class GuiRenderer(Renderer):
         self._draw_7stage_speed_control_buttons(control_x, speed_y, panel_width)
         
         # 超高速警告表示
-        if self.current_speed_multiplier in [10, 50]:
+        if self.current_speed_multiplier in [10, 50] or self.max_speed_mode:
             self._render_ultra_speed_warning(control_x, panel_y, panel_width)
         
         # ボタン登録（初回のみ）
@@ -1509,7 +1891,7 @@ class GuiRenderer(Renderer):
         """🚀 v1.2.5: 7段階速度制御ボタン群描画（横一列配置）"""
         
         # 速度ラベル
-        speed_label = self.small_font.render("Speed Control:", True, self.colors['text'])
+        speed_label = self._render_text(self.small_font, "Speed Control:", self.colors['text'])
         self.screen.blit(speed_label, (control_x + 10, speed_y))
         
         # 横一列レイアウト設定
@@ -1532,7 +1914,7 @@ class GuiRenderer(Renderer):
             rect = pygame.Rect(button_x, buttons_y, button_width, self.speed_button_height)
             
             # ボタン色選択
-            if multiplier == self.current_speed_multiplier:
+            if multiplier == self.current_speed_multiplier and not self.max_speed_mode:
                 button_color = self.button_colors['speed_selected']
                 text_color = self.button_colors['button_text_dark']
             elif multiplier in [10, 50]:
@@ -1547,19 +1929,37 @@ class GuiRenderer(Renderer):
             pygame.draw.rect(self.screen, self.colors['text'], rect, 1)  # ボーダー
             
             # テキスト描画（小さめフォント）
-            text_surface = self.small_font.render(f"x{multiplier}", True, text_color)
+            text_surface = self._render_text(self.small_font, f"x{multiplier}", text_color)
             text_rect = text_surface.get_rect(center=rect.center)
             self.screen.blit(text_surface, text_rect)
             
             # ボタン矩形を登録
             self.speed_button_rects[f'speed_{multiplier}'] = rect
         
+        # 最高速ボタン（待機なし・描画はディスプレイ更新ごと）
+        max_x = buttons_x_start + len(all_speeds) * (button_width + button_margin)
+        rect = pygame.Rect(max_x, buttons_y, button_width + 10, self.speed_button_height)
+        if self.max_speed_mode:
+            button_color = self.button_colors['speed_selected']
+            text_color = self.button_colors['button_text_dark']
+        else:
+            button_color = self.button_colors['speed_ultra']
+            text_color = self.button_colors['button_text']
+        pygame.draw.rect(self.screen, button_color, rect)
+        pygame.draw.rect(self.screen, self.colors['text'], rect, 1)
+        text_surface = self._render_text(self.small_font, "MAX", text_color)
+        self.screen.blit(text_surface, text_surface.get_rect(center=rect.center))
+        self.speed_button_rects['speed_max'] = rect
+        
         # 現在の速度表示（下部）
-        current_speed_text = f"Current: x{self.current_speed_multiplier}"
-        if self.current_speed_multiplier in [10, 50]:
-            current_speed_text += " ⚡"  # 超高速インディケーター
+        if self.max_speed_mode:
+            current_speed_text = "Current: MAX ⚡"
+        else:
+            current_speed_text = f"Current: x{self.current_speed_multiplier}"
+            if self.current_speed_multiplier in [10, 50]:
+                current_speed_text += " ⚡"  # 超高速インディケーター
         
-        speed_info_surface = self.small_font.render(current_speed_text, True, self.colors['text'])
+        speed_info_surface = self._render_text(self.small_font, current_speed_text, self.colors['text'])
         speed_info_x = control_x + panel_width - speed_info_surface.get_width() - 10
         self.screen.blit(speed_info_surface, (speed_info_x, speed_y + 40))
     
@@ -1586,7 +1986,7 @@ class GuiRenderer(Renderer):
         pygame.draw.rect(self.screen, (128, 128, 128), rect, 1)
         
         # テキスト描画
-        text_surface = self.small_font.render(text, True, text_color)
+        text_surface = self._render_text(self.small_font, text, text_color)
         text_rect = text_surface.get_rect(center=rect.center)
         self.screen.blit(text_surface, text_rect)
         
@@ -1594,8 +1994,11 @@ class GuiRenderer(Renderer):
     
     def _render_ultra_speed_warning(self, control_x: int, panel_y: int, panel_width: int) -> None:
         """🚀 v1.2.5: 超高速実行警告表示"""
-        warning_text = f"⚠️ Ultra-Speed Mode (x{self.current_speed_multiplier})"
-        warning_surface = self.small_font.render(warning_text, True, (255, 100, 0))  # オレンジ色
+        if self.max_speed_mode:
+            warning_text = "⚠️ Max-Speed Mode"
+        else:
+            warning_text = f"⚠️ Ultra-Speed Mode (x{self.current_speed_multiplier})"
+        warning_surface = self._render_text(self.small_font, warning_text, (255, 100, 0))  # オレンジ色
         warning_x = control_x + panel_width - warning_surface.get_width() - 10
         warning_y = panel_y + 8
         self.screen.blit(warning_surface, (warning_x, warning_y))
@@ -1639,6 +2042,13 @@ class GuiRenderer(Renderer):
         # 7段階速度制御ボタン登録（1回のみ）
         if hasattr(self, 'speed_button_rects') and not hasattr(self, '_7stage_buttons_registered'):
             for speed_key, speed_rect in self.speed_button_rects.items():
+                if speed_key == 'speed_max':
+                    self.event_processing_engine.register_button(
+                        speed_key, speed_rect,
+                        self._handle_max_speed_button_click,
+                        EventPriority.MEDIUM
+                    )
+                    continue
                 # speed_1, speed_2, ... から倍率を抽出
                 multiplier = int(speed_key.split('_')[1])
                 self.event_processing_engine.register_button(
@@ -1691,6 +2101,21 @@ class GuiRenderer(Renderer):
             print(f"❌ 7段階速度ボタンクリックエラー: {e}")
             return False
     
+    def _handle_max_speed_button_click(self) -> bool:
+        """最高速ボタンクリック処理（もう一度押すと現在の倍率に戻る）"""
+        if not self._7stage_speed_manager:
+            print("⚠️ 7段階速度制御システムが初期化されていません")
+            return False
+        
+        enabled = not self._7stage_speed_manager.is_max_speed_mode()
+        if not self._7stage_speed_manager.set_max_speed_mode(enabled):
+            print("❌ 最高速モード切替失敗")
+            return False
+        
+        self.max_speed_mode = enabled
+        print("🏎️ 最高速モード: " + ("有効" if enabled else f"解除（x{self.current_speed_multiplier}）"))
+        return True
+    
     def _handle_ultra_high_speed_mode_activation(self, multiplier: int) -> None:
         """🚀 v1.2.5: 超高速モード有効化処理"""
         if not self._ultra_speed_controller:
@@ -1711,8 +2136,11 @@ class GuiRenderer(Renderer):
         if self._7stage_speed_manager:
             self.current_speed_multiplier = self._7stage_speed_manager.get_current_speed_multiplier()
             
+            is_max_speed_mode = getattr(self._7stage_speed_manager, 'is_max_speed_mode', None)
+            self.max_speed_mode = callable(is_max_speed_mode) and is_max_speed_mode() is True
+            
             # 超高速警告フラグ更新
-            self.speed_warning_display = self.current_speed_multiplier in [10, 50]
+            self.speed_warning_display = self.current_speed_multiplier in [10, 50] or self.max_speed_mode
         
         # ボタン領域は既に上記で設定済み（exit含む5つのボタン）
         
@@ -1733,7 +2161,7 @@ class GuiRenderer(Renderer):
         pygame.draw.rect(self.screen, (128, 128, 128), rect, 2)
         
         # テキスト描画
-        text_surface = self.small_font.render(text, True, self.button_colors['button_text'])
+        text_surface = self._render_text(self.small_font, text, self.button_colors['button_text'])
         text_rect = text_surface.get_rect(center=rect.center)
         self.screen.blit(text_surface, text_rect)
         
@@ -1920,22 +2348,29 @@ class GuiRenderer(Renderer):
         except Exception as e:
             print(f"⚠️ 終了イベント送信エラー: {e}")
     
-    def _draw_enemy_vision(self, game_state: GameState, start_x: int, start_y: int) -> None:
+    def _draw_enemy_vision(self, game_state: GameState, start_x: int, start_y: int, surface=None) -> None:
         """敵の視野範囲を描画"""
+        if surface is None:
+            surface = self.screen
         for enemy in game_state.enemies:
-            if not enemy.is_alive():
+            if not enemy.is_alive() or not self._is_near_viewport(enemy.position, enemy.vision_range):
                 continue
             
-            # 敵の視野範囲セルを取得（壁による遮蔽を考慮）
-            vision_cells = enemy.get_vision_cells(game_state.board)
+            # 敵の視野範囲セルを取得（壁による遮蔽を考慮、can_see_playerと同じキャッシュ済みの視野）
+            vision_cone = enemy.get_vision_cone(game_state.board)
             
             # 視野の色を決定（警戒状態かどうかで変更）
             vision_color = self.colors['vision_alerted'] if enemy.alerted else self.colors['vision_normal']
             
+            # 半透明サーフェスを作成（全セル共通）
+            vision_surface = pygame.Surface((self.cell_size, self.cell_size))
+            vision_surface.set_alpha(80)  # 透明度設定（0-255、低いほど透明）
+            vision_surface.fill(vision_color)
+            
             # 各視野セルを半透明で描画
-            for vision_pos in vision_cells:
+            for vision_pos in vision_cone.cells:
                 # 画面範囲内かチェック
-                if 0 <= vision_pos.x < self.width and 0 <= vision_pos.y < self.height:
+                if self._is_visible(vision_pos):
                     # 壁や移動禁止セルは視野描画をスキップ
                     if self._is_vision_blocked(vision_pos, game_state):
                         continue
@@ -1943,27 +2378,22 @@ class GuiRenderer(Renderer):
                     cell_x = start_x + vision_pos.x * self.cell_size
                     cell_y = start_y + vision_pos.y * self.cell_size
                     
-                    # 半透明サーフェスを作成
-                    vision_surface = pygame.Surface((self.cell_size, self.cell_size))
-                    vision_surface.set_alpha(80)  # 透明度設定（0-255、低いほど透明）
-                    vision_surface.fill(vision_color)
-                    
                     # サーフェスを描画
-                    self.screen.blit(vision_surface, (cell_x, cell_y))
+                    surface.blit(vision_surface, (cell_x, cell_y))
                     
                     # 警戒状態の場合は枠線を追加
                     if enemy.alerted:
                         alert_rect = pygame.Rect(cell_x, cell_y, self.cell_size, self.cell_size)
-                        pygame.draw.rect(self.screen, (200, 0, 0), alert_rect, 3)  # 濃い赤の太い枠線
+                        pygame.draw.rect(surface, (200, 0, 0), alert_rect, 3)  # 濃い赤の太い枠線
     
     def _is_vision_blocked(self, pos: Position, game_state: GameState) -> bool:
         """視野が遮られるセルかチェック（壁など）"""
         # 壁は視野を遮る
-        if pos in game_state.board.walls:
+        if game_state.board.is_wall(pos):
             return True
         
         # 移動禁止セルも視野を遮る
-        if pos in game_state.board.forbidden_cells:
+        if game_state.board.is_forbidden(pos):
             return True
         
         return False
@@ -1981,8 +2411,10 @@ class GuiRenderer(Renderer):
         
         return mode_names.get(enemy.enemy_mode, "Unknown")
     
-    def _draw_area_attack_range(self, game_state: GameState, start_x: int, start_y: int) -> None:
+    def _draw_area_attack_range(self, game_state: GameState, start_x: int, start_y: int, surface=None) -> None:
         """範囲攻撃範囲視覚化 - v1.2.8特殊条件付きステージ"""
+        if surface is None:
+            surface = self.screen
         from .enemy_system import LargeEnemySystem
         from . import EnemyMode
         
@@ -1999,8 +2431,7 @@ class GuiRenderer(Renderer):
                     # Stage11専用範囲攻撃描画
                     for attack_pos in enemy.stage11_attack_range:
                         # 画面範囲内かチェック
-                        if (0 <= attack_pos.x < self.width and 
-                            0 <= attack_pos.y < self.height):
+                        if self._is_visible(attack_pos):
                             # 攻撃範囲セルを描画（黄色でハイライト）
                             cell_rect = pygame.Rect(
                                 start_x + attack_pos.x * self.cell_size,
@@ -2013,10 +2444,10 @@ class GuiRenderer(Renderer):
                             range_surface = pygame.Surface((self.cell_size, self.cell_size))
                             range_surface.set_alpha(180)  # 透明度設定
                             range_surface.fill(self.colors['area_attack_range'])
-                            self.screen.blit(range_surface, cell_rect)
+                            surface.blit(range_surface, cell_rect)
                             
                             # 範囲攻撃境界線
-                            pygame.draw.rect(self.screen, (255, 100, 0), cell_rect, 2)
+                            pygame.draw.rect(surface, (255, 100, 0), cell_rect, 2)
                             
             # 怒りモードの大型敵のみ範囲攻撃表示
             elif (hasattr(enemy, 'enemy_mode') and 
@@ -2033,7 +2464,7 @@ class GuiRenderer(Renderer):
                     
                     # 範囲攻撃セルを描画
                     for attack_pos in attack_range:
-                        if 0 <= attack_pos.x < self.width and 0 <= attack_pos.y < self.height:
+                        if self._is_visible(attack_pos):
                             cell_x = start_x + attack_pos.x * self.cell_size
                             cell_y = start_y + attack_pos.y * self.cell_size
                             
@@ -2041,11 +2472,11 @@ class GuiRenderer(Renderer):
                             range_surface = pygame.Surface((self.cell_size, self.cell_size))
                             range_surface.set_alpha(100)
                             range_surface.fill(self.colors['area_attack_range'])
-                            self.screen.blit(range_surface, (cell_x, cell_y))
+                            surface.blit(range_surface, (cell_x, cell_y))
                             
                             # 範囲攻撃枠線
                             range_rect = pygame.Rect(cell_x, cell_y, self.cell_size, self.cell_size)
-                            pygame.draw.rect(self.screen, (255, 165, 0), range_rect, 2)
+                            pygame.draw.rect(surface, (255, 165, 0), range_rect, 2)
 
     # ========================
     # GUI Enhancement Methods (v1.2.11)
@@ -2145,6 +2576,13 @@ class GuiRenderer(Renderer):
         """
         import hashlib
 
+        version_key = self._state_version_key(game_state)
+        if version_key is not None:
+            version_key = (version_key, getattr(self, '_action_counter', 0))
+            cached = self._state_hash_cache.get("turn")
+            if cached is not None and cached[0] == version_key:
+                return cached[1]
+
         # Collect important state information
         state_data = []
 
@@ -2168,7 +2606,10 @@ class GuiRenderer(Renderer):
 
         # Create hash
         state_string = "|".join(state_data)
-        return hashlib.md5(state_string.encode()).hexdigest()
+        state_hash = hashlib.md5(state_string.encode()).hexdigest()
+        if version_key is not None:
+            self._state_hash_cache["turn"] = (version_key, state_hash)
+        return state_hash
 
     def update_entity_status_tracking(self, game_state: GameState) -> None:
         """
@@ -2180,6 +2621,13 @@ class GuiRenderer(Renderer):
         if not GUI_ENHANCEMENT_AVAILABLE or not self.status_tracker:
             return
 
+        # 前回の追跡から状態が変わらず、解除待ちの強調表示もなければ再比較は不要
+        version_key = self._state_version_key(game_state)
+        if version_key is not None and version_key == self._idle_tracking_key:
+            if not self._is_in_step_execution_pause():
+                self.stable_state_count += 1
+            return
+
         # Game state hash-based action boundary detection
         current_hash = self._compute_game_state_hash(game_state)
 
@@ -2258,6 +2706,15 @@ class GuiRenderer(Renderer):
         if should_clear_highlighting:
             self.status_tracker.advance_turn()
 
+        # 変化も強調表示も残っていなければ、状態が変わるまで追跡を省略する
+        entity_ids = ["player"] + list(enemy_results.keys())
+        if (player_result.has_any_changes
+                or any(result.has_any_changes for result in enemy_results.values())
+                or any(self.status_tracker.has_changes(entity_id) for entity_id in entity_ids)):
+            self._idle_tracking_key = None
+        else:
+            self._idle_tracking_key = version_key
+
     def render_status_with_highlighting(self, entity_id: str, status_key: str,
                                       current_value: int, x: int, y: int, max_width: int = None) -> int:
         """
@@ -2277,7 +2734,7 @@ class GuiRenderer(Renderer):
         if not GUI_ENHANCEMENT_AVAILABLE or not self.display_manager or not self.status_tracker:
             # Fallback to normal rendering
             text = str(current_value)
-            text_surface = self.small_font.render(text, True, self.colors['text'])
+            text_surface = self._render_text(self.small_font, text, self.colors['text'])
             self.screen.blit(text_surface, (x, y))
             return text_surface.get_height()
 
@@ -2296,7 +2753,7 @@ class GuiRenderer(Renderer):
             font = self.small_font
 
         # Render text with appropriate color
-        text_surface = font.render(formatted_text.content, True, formatted_text.color)
+        text_surface = self._render_text(font, formatted_text.content, formatted_text.color)
 
         # Apply width constraint if specified
         if max_width and text_surface.get_width() > max_width:
@@ -2315,6 +2772,35 @@ class GuiRenderer(Renderer):
         pygame.quit()
 
 
+class HeadlessRenderer(Renderer):
+    """描画を行わないレンダラー（一括採点・シミュレーション用）"""
+    
+    def initialize(self, width: int, height: int) -> None:
+        self.width = width
+        self.height = height
+    
+    def render_frame(self, game_state: GameState) -> None:
+        pass
+    
+    def update_display(self) -> None:
+        pass
+    
+    def render_complete_view(self, game_state: GameState, show_legend: bool = True) -> None:
+        pass
+    
+    def render_game_result(self, game_state: GameState) -> None:
+        pass
+    
+    def render_legend(self) -> None:
+        pass
+    
+    def render_action_history(self, actions: List[str], limit: int = 10) -> None:
+        pass
+    
+    def cleanup(self) -> None:
+        pass
+
+
 class RendererFactory:
     """レンダラーファクトリー"""
     
@@ -2329,9 +2815,11 @@ class RendererFactory:
             else:
                 print("⚠️ pygame が利用できません。CUIレンダラーを使用します。")
                 return CuiRenderer()
+        elif renderer_type.lower() == "headless":
+            return HeadlessRenderer()
         else:
             raise ValueError(f"未対応のレンダラータイプ: {renderer_type}")
 
 
 # エクスポート用
-__all__ = ["Renderer", "CuiRenderer", "GuiRenderer", "RendererFactory"]
\ No newline at end of file
+__all__ = ["Renderer", "CuiRenderer", "GuiRenderer", "HeadlessRenderer", "RendererFactory"]
\ No newline at end of file
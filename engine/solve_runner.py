@@ -0,0 +1,110 @@
+"""
+協調スケジューラによるsolve()実行
+
+solve()をバックグラウンドスレッドではなく呼び出し元スレッド（GUIメインスレッド）で実行する。
+solve()内の各API呼び出しはExecutionController.wait_for_action()でスケジューラに制御を戻し、
+待機中はスケジューラがGUIフレームを処理する。Step・Pause・Resetは状態変更だけで完結し、
+スレッドの生成・ポーリング・強制終了は発生しない。
+"""
+
+import threading
+import time
+import logging
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# GUIフレーム処理の最短間隔（60 FPS）
+FRAME_INTERVAL = 1.0 / 60
+
+
+class SolveInterrupted(RuntimeError):
+    """Reset・停止要求によりsolve()の実行を打ち切る例外"""
+
+    def __init__(self, reason: str = "reset"):
+        super().__init__("solve() execution stopped by reset")
+        self.reason = reason
+
+
+class CooperativeSolveRunner:
+    """solve()を呼び出し元スレッドで協調的に実行するスケジューラ"""
+
+    def __init__(self, execution_controller, frame_pump: Optional[Callable[[], None]] = None,
+                 frame_interval: float = FRAME_INTERVAL):
+        """
+        初期化
+
+        Args:
+            execution_controller: ExecutionControllerインスタンス
+            frame_pump: GUIを1フレーム処理する関数（イベント処理・描画）
+            frame_interval: frame_pumpを呼び出す最短間隔（秒）
+        """
+        self.execution_controller = execution_controller
+        self.frame_pump = frame_pump
+        self.frame_interval = frame_interval
+        self.thread: Optional[threading.Thread] = None
+        self._reset_generation = 0
+        self._next_frame = 0.0
+
+    @property
+    def is_running(self) -> bool:
+        """solve()実行中か"""
+        return self.thread is not None
+
+    def owns_current_thread(self) -> bool:
+        """現在のスレッドがこのスケジューラで実行中のsolve()か"""
+        return self.thread is threading.current_thread()
+
+    def run(self, solve_function: Callable[[], None]) -> None:
+        """
+        solve()を実行（完了・Reset・停止まで戻らない）
+
+        Reset・停止で打ち切られた場合はSolveInterruptedが送出される。
+        """
+        controller = self.execution_controller
+        self.thread = threading.current_thread()
+        self._reset_generation = controller.reset_generation
+        self._next_frame = time.monotonic()
+        controller.attach_scheduler(self)
+        try:
+            with controller.solve_context():
+                solve_function()
+        finally:
+            controller.detach_scheduler(self)
+            self.thread = None
+
+    def yield_point(self) -> None:
+        """API呼び出しごとの切替点（フレーム処理の時刻ならGUIを1フレーム進める）"""
+        if time.monotonic() >= self._next_frame:
+            self._pump_frame()
+
+    def wait_until(self, predicate: Callable[[], bool], timeout: Optional[float] = None) -> bool:
+        """
+        条件が満たされるまでGUIフレームを処理しながら待機
+
+        Args:
+            predicate: 待機終了条件
+            timeout: 最大待機時間（秒）、Noneで無制限
+
+        Returns:
+            bool: 条件が満たされた場合True、タイムアウトした場合False
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not predicate():
+            now = time.monotonic()
+            if deadline is not None and now >= deadline:
+                return False
+            if now >= self._next_frame:
+                self._pump_frame()
+                continue
+            wake_at = self._next_frame if deadline is None else min(deadline, self._next_frame)
+            time.sleep(wake_at - now)
+        return True
+
+    def _pump_frame(self) -> None:
+        """GUIを1フレーム処理し、その間のResetを検出"""
+        self._next_frame = time.monotonic() + self.frame_interval
+        if self.frame_pump:
+            self.frame_pump()
+        if self.execution_controller.reset_generation != self._reset_generation:
+            raise SolveInterrupted("reset")
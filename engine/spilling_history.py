@@ -0,0 +1,170 @@
+"""
+ディスク退避付き履歴バッファ
+メモリ上には直近の一定件数だけを保持し、それより古い要素は一時ファイルへ書き出す
+
+長時間の実行（solve()内の無限ループなど）でも履歴のメモリ使用量が一定に保たれる。
+読み出し側からは通常のシーケンスとして見え、インデックス・スライス・反復はメモリと
+ディスクの両方を透過的に参照する。
+
+    history = SpillingHistory(capacity=1000)
+    history.append({"api": "move", ...})
+    history[-5:]        # 直近5件（メモリのみ参照）
+    list(history)       # 全件（ディスク分を含む）
+"""
+
+import json
+import tempfile
+import threading
+from array import array
+from collections import deque
+from collections.abc import Sequence
+from typing import Any, Deque, Iterable, Iterator, List, Optional
+
+# メモリ上に保持する既定の件数
+DEFAULT_CAPACITY = 1000
+
+# ディスク上の何件ごとにファイル位置を記録するか（ランダムアクセス時の読み飛ばし上限）
+CHECKPOINT_INTERVAL = 256
+
+
+def _encode(entry: Any) -> bytes:
+    return json.dumps(entry, ensure_ascii=False, separators=(",", ":"), default=str).encode("utf-8") + b"\n"
+
+
+class SpillingHistory(Sequence):
+    """直近capacity件をメモリに、それより古い要素を一時ファイルに保持する履歴"""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, entries: Iterable[Any] = (),
+                 spill_dir: Optional[str] = None):
+        if capacity <= 0:
+            raise ValueError("capacityは1以上である必要があります")
+        self.capacity = capacity
+        self.spill_dir = spill_dir
+        self._recent: Deque[Any] = deque()
+        self._spill = None  # 退避先の一時ファイル（最初の退避時に作成）
+        self._spill_end = 0
+        self._spilled = 0
+        self._checkpoints = array("Q")  # CHECKPOINT_INTERVAL件ごとの行頭オフセット
+        self._lock = threading.RLock()
+        self.extend(entries)
+
+    # --- 追加・削除 ---
+
+    def append(self, entry: Any) -> None:
+        """要素を追加（メモリ上限を超えた分は最も古い要素からディスクへ退避）"""
+        with self._lock:
+            if len(self._recent) >= self.capacity:
+                self._write_spill(self._recent.popleft())
+            self._recent.append(entry)
+
+    def extend(self, entries: Iterable[Any]) -> None:
+        for entry in entries:
+            self.append(entry)
+
+    def clear(self) -> None:
+        """全要素を破棄（一時ファイルも削除）"""
+        with self._lock:
+            self._recent.clear()
+            if self._spill is not None:
+                self._spill.close()
+            self._spill = None
+            self._spill_end = 0
+            self._spilled = 0
+            self._checkpoints = array("Q")
+
+    def copy(self) -> List[Any]:
+        """全要素をリストで取得"""
+        return list(self)
+
+    @property
+    def spilled_count(self) -> int:
+        """ディスクへ退避済みの件数"""
+        return self._spilled
+
+    # --- シーケンスとしての参照 ---
+
+    def __len__(self) -> int:
+        return self._spilled + len(self._recent)
+
+    def __getitem__(self, index):
+        with self._lock:
+            length = len(self)
+            if isinstance(index, slice):
+                start, stop, step = index.indices(length)
+                if step < 0 or start >= stop:
+                    return [self[i] for i in range(start, stop, step)]
+                return self._read_range(start, stop)[::step]
+
+            if index < 0:
+                index += length
+            if not 0 <= index < length:
+                raise IndexError("history index out of range")
+            if index >= self._spilled:
+                return self._recent[index - self._spilled]
+            return self._read_spilled(index, index + 1)[0]
+
+    def __iter__(self) -> Iterator[Any]:
+        # 反復開始時点の内容を返す（反復中の追加は含まない）
+        with self._lock:
+            snapshot = self._read_range(0, len(self))
+        return iter(snapshot)
+
+    def __reversed__(self) -> Iterator[Any]:
+        return reversed(self.copy())
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (SpillingHistory, list)):
+            return len(self) == len(other) and self.copy() == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"SpillingHistory(len={len(self)}, in_memory={len(self._recent)}, capacity={self.capacity})"
+
+    def __reduce__(self):
+        # pickle・deepcopyでは全要素を持つ新しい履歴として復元する
+        return (SpillingHistory, (self.capacity, self.copy(), self.spill_dir))
+
+    # --- ディスク退避 ---
+
+    def _write_spill(self, entry: Any) -> None:
+        if self._spill is None:
+            self._spill = tempfile.TemporaryFile(prefix="history_", dir=self.spill_dir)
+        if self._spilled % CHECKPOINT_INTERVAL == 0:
+            self._checkpoints.append(self._spill_end)
+        data = _encode(entry)
+        self._spill.seek(self._spill_end)
+        self._spill.write(data)
+        self._spill_end += len(data)
+        self._spilled += 1
+
+    def _read_spilled(self, start: int, stop: int) -> List[Any]:
+        """ディスク上の [start, stop) 件目を読み出す"""
+        stop = min(stop, self._spilled)
+        if start >= stop:
+            return []
+        spill = self._spill
+        spill.flush()
+        spill.seek(self._checkpoints[start // CHECKPOINT_INTERVAL])
+        for _ in range(start % CHECKPOINT_INTERVAL):
+            spill.readline()
+        return [json.loads(spill.readline()) for _ in range(stop - start)]
+
+    def _read_range(self, start: int, stop: int) -> List[Any]:
+        """[start, stop) 件目をディスク・メモリから読み出す"""
+        spilled = self._spilled
+        entries = self._read_spilled(start, stop) if start < spilled else []
+        if stop > spilled:
+            recent = self._recent
+            begin = max(start - spilled, 0)
+            end = stop - spilled
+            if begin == 0 and end == len(recent):
+                entries.extend(recent)
+            else:
+                entries.extend(recent[i] for i in range(begin, end))
+        return entries
+
+
+__all__ = ["DEFAULT_CAPACITY", "CHECKPOINT_INTERVAL", "SpillingHistory"]
@@ -399,7 +399,7 @@ class StageLoader:
                 elif cell == "X" or (cell in legend and legend[cell] == "forbidden"):
                     forbidden_cells.append(pos)
         
-        # ボード作成
+        # ボード作成（セル種別グリッドはここで一度だけ構築し、Stage経由で再利用する）
         board = Board(width, height, walls, forbidden_cells)
         
         # プレイヤー情報の抽出
@@ -488,7 +488,8 @@ class StageLoader:
             goal_position=goal_position,
             allowed_apis=allowed_apis,
             constraints=constraints,
-            victory_conditions=victory_conditions
+            victory_conditions=victory_conditions,
+            cell_grid=board.cell_grid
         )
     
     def get_available_stages(self) -> List[str]:
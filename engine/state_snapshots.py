@@ -0,0 +1,199 @@
+"""
+差分スナップショットによるゲーム状態の巻き戻し
+ターンごとに変化したエンティティの記録だけを保存し、任意の過去ターンへ戻す
+
+盤面（Board）は不変なので共有し、プレイヤー・敵・アイテムはエンティティごとに
+「いつの時点でどの属性値だったか」のバージョン記録を持つ。各スナップショットは
+ターン数・状態と、その時点で盤上にいた敵・アイテムの参照（変化がなければ前回と共有）、
+そして変化したエンティティの一覧（差分）だけを保持する。
+
+変化の判定はエンティティの版数（state_version）で行い、版数が前回の記録から
+進んでいないエンティティは属性を読まずに読み飛ばす。エンティティを変更する処理は
+take_damage等の変更メソッドかGameState.mark_changed()で版数を進めること。
+
+    timeline = StateTimeline(game_state)   # 初期状態をスナップショット0として記録
+    ...コマンド実行...
+    timeline.record(game_state)            # 変化したエンティティの記録だけを追加
+    timeline.rewind_to_turn(game_state, 3) # ターン3の状態へ戻す（以降の記録は破棄）
+"""
+
+import copy
+from bisect import bisect_right
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from . import GameState, GameStatus, Position, STATE_VERSION_ATTR
+
+# そのまま共有して良い（不変な）属性値の型
+_ATOMIC_TYPES = (int, float, str, bytes, type(None), Enum, Position)
+
+
+class _FrozenList(tuple):
+    """要素が不変なリスト属性の記録（復元時にlistへ戻す）"""
+    __slots__ = ()
+
+
+class _FrozenDict(tuple):
+    """値が不変な辞書属性の記録（復元時にdictへ戻す）"""
+    __slots__ = ()
+
+
+def _capture(value: Any) -> Any:
+    """属性値を記録用の値に変換（可変な値は以降の変更の影響を受けない形にする）"""
+    if isinstance(value, _ATOMIC_TYPES):
+        return value
+    if type(value) is list and all(isinstance(v, _ATOMIC_TYPES) for v in value):
+        return _FrozenList(value)
+    if type(value) is dict and all(isinstance(v, _ATOMIC_TYPES) for v in value.values()):
+        return _FrozenDict(value.items())
+    return copy.deepcopy(value)
+
+
+def _thaw(value: Any) -> Any:
+    """記録用の値から属性値を作り直す"""
+    if isinstance(value, _FrozenList):
+        return list(value)
+    if isinstance(value, _FrozenDict):
+        return dict(value)
+    if isinstance(value, _ATOMIC_TYPES):
+        return value
+    return copy.deepcopy(value)
+
+
+def _entity_record(entity: Any) -> Tuple[Tuple[str, Any], ...]:
+    """エンティティの全属性（動的に追加された属性を含む, 版数を除く）の記録"""
+    return tuple((name, _capture(value)) for name, value in vars(entity).items()
+                 if name != STATE_VERSION_ATTR)
+
+
+def _restore_entity(entity: Any, record: Tuple[Tuple[str, Any], ...]) -> None:
+    """記録の時点の属性に戻す（記録後に追加された動的属性は削除）"""
+    names = {name for name, _ in record}
+    for name in [name for name in vars(entity) if name not in names and name != STATE_VERSION_ATTR]:
+        delattr(entity, name)
+    for name, value in record:
+        setattr(entity, name, _thaw(value))
+
+
+def _same_members(a: Sequence[Any], b: Sequence[Any]) -> bool:
+    return len(a) == len(b) and all(x is y for x, y in zip(a, b))
+
+
+class _EntityVersions:
+    """1エンティティの記録の履歴（スナップショット番号の昇順）"""
+    __slots__ = ("entity", "indices", "records", "version")
+
+    def __init__(self, entity: Any):
+        self.entity = entity
+        self.indices: List[int] = []
+        self.records: List[Tuple[Tuple[str, Any], ...]] = []
+        self.version = -1  # 最後に記録した時点のエンティティの版数
+
+    def append(self, index: int) -> None:
+        """エンティティの現在の属性を記録に追加"""
+        self.indices.append(index)
+        self.records.append(_entity_record(self.entity))
+        self.version = self.entity.state_version
+
+
+@dataclass(frozen=True)
+class TurnSnapshot:
+    """1ターン分のスナップショット"""
+    turn_count: int
+    status: GameStatus
+    enemies: Tuple[Any, ...]
+    items: Tuple[Any, ...]
+    changed: Tuple[Any, ...]  # このスナップショットで記録が追加されたエンティティ（差分）
+
+
+class StateTimeline:
+    """ゲーム状態のターンごとの差分スナップショット列"""
+
+    def __init__(self, state: GameState):
+        self.board = state.board  # 盤面は不変なので共有
+        self._snapshots: List[TurnSnapshot] = []
+        self._versions: Dict[int, _EntityVersions] = {}
+        self.record(state)
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    @property
+    def snapshots(self) -> Tuple[TurnSnapshot, ...]:
+        return tuple(self._snapshots)
+
+    def record(self, state: GameState) -> TurnSnapshot:
+        """現在の状態をスナップショットとして追加（前回から版数が進んだエンティティだけを記録）"""
+        index = len(self._snapshots)
+        changed = []
+        for entity in (state.player, *state.enemies, *state.items):
+            versions = self._versions.get(id(entity))
+            if versions is None:
+                versions = self._versions[id(entity)] = _EntityVersions(entity)
+            elif versions.version == entity.state_version:
+                continue
+            versions.append(index)
+            changed.append(entity)
+
+        previous = self._snapshots[-1] if self._snapshots else None
+        enemies = tuple(state.enemies)
+        items = tuple(state.items)
+        if previous is not None:
+            # 構成が変わっていなければ前回のタプルを共有
+            if _same_members(previous.enemies, enemies):
+                enemies = previous.enemies
+            if _same_members(previous.items, items):
+                items = previous.items
+
+        snapshot = TurnSnapshot(state.turn_count, state.status, enemies, items, tuple(changed))
+        self._snapshots.append(snapshot)
+        return snapshot
+
+    def index_for_turn(self, turn: int) -> Optional[int]:
+        """指定ターン時点の状態を表すスナップショット番号（該当なしはNone）"""
+        turns = [snapshot.turn_count for snapshot in self._snapshots]
+        index = bisect_right(turns, turn) - 1
+        return index if index >= 0 else None
+
+    def rewind(self, state: GameState, index: int) -> TurnSnapshot:
+        """index番目のスナップショットの状態へ戻し、それより後の記録を破棄"""
+        if not 0 <= index < len(self._snapshots):
+            raise IndexError("snapshot index out of range")
+        snapshot = self._snapshots[index]
+
+        for key in list(self._versions):
+            versions = self._versions[key]
+            count = len(versions.indices)
+            keep = bisect_right(versions.indices, index)
+            if keep == 0:
+                # 戻し先より後に登場したエンティティ
+                del self._versions[key]
+                continue
+            if keep < count:
+                del versions.indices[keep:]
+                del versions.records[keep:]
+            entity = versions.entity
+            # 戻し先以降に変化したもの・最後の記録後に変更されたものだけを復元
+            if keep < count or versions.version != entity.state_version:
+                _restore_entity(entity, versions.records[-1])
+                entity.mark_changed()
+                versions.version = entity.state_version
+
+        del self._snapshots[index + 1:]
+        state.enemies[:] = snapshot.enemies
+        state.items[:] = snapshot.items
+        state.turn_count = snapshot.turn_count
+        state.set_status(snapshot.status)
+        state.reindex()
+        return snapshot
+
+    def rewind_to_turn(self, state: GameState, turn: int) -> Optional[TurnSnapshot]:
+        """指定ターン時点の状態へ戻す（該当するスナップショットがなければNone）"""
+        index = self.index_for_turn(turn)
+        if index is None:
+            return None
+        return self.rewind(state, index)
+
+
+__all__ = ["TurnSnapshot", "StateTimeline"]
@@ -0,0 +1,220 @@
+"""
+ターン処理トレースシステム
+エンジン・A*検証のホットパス向けレベル付きトレース
+
+- 遅延フォーマット: メッセージは出力・記録されるときだけ ``fmt % args`` で整形
+- モジュール別スイッチ: ``set_level("engine.game_state", DEBUG)`` のように名前単位で閾値を設定
+- リングバッファ: ``enable_capture()`` で直近のトレースを出力せずに保持し、事後解析に利用
+
+無効時のコストは閾値比較1回のみ。既定の閾値はWARNINGで、ターン毎のデバッグ出力は表示されない。
+環境変数 ``ROGUELIKE_TRACE`` で起動時に設定できる（例: ``engine.game_state=debug,stage_validator=info``、
+全モジュール一括なら ``debug``）。
+"""
+
+import os
+import time
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+# トレースレベル（loggingモジュールと同じ数値）
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+OFF = 100
+
+LEVEL_NAMES = {
+    "debug": DEBUG,
+    "info": INFO,
+    "warning": WARNING,
+    "error": ERROR,
+    "off": OFF,
+}
+
+DEFAULT_LEVEL = WARNING
+DEFAULT_CAPTURE_SIZE = 2000
+ENV_VAR = "ROGUELIKE_TRACE"
+
+# (timestamp, tracer_name, level, fmt, args)
+TraceRecord = Tuple[float, str, int, str, Tuple[Any, ...]]
+
+
+def format_record(record: TraceRecord) -> str:
+    """トレースレコードを文字列に整形"""
+    _, _, _, fmt, args = record
+    if not args:
+        return fmt
+    try:
+        return fmt % args
+    except (TypeError, ValueError):
+        return f"{fmt} {args!r}"
+
+
+def _print_sink(message: str) -> None:
+    print(message)
+
+
+class Tracer:
+    """モジュール単位のトレーサー"""
+
+    __slots__ = ("name", "threshold", "_emit_level", "_registry")
+
+    def __init__(self, name: str, registry: "TraceRegistry"):
+        self.name = name
+        self._registry = registry
+        self._emit_level = DEFAULT_LEVEL
+        # 出力・キャプチャいずれかが有効になる最小レベル（ホットパスではこの比較のみ）
+        self.threshold = DEFAULT_LEVEL
+
+    def is_enabled(self, level: int) -> bool:
+        """指定レベルのトレースが出力またはキャプチャされるか"""
+        return level >= self.threshold
+
+    def debug(self, fmt: str, *args: Any) -> None:
+        if DEBUG >= self.threshold:
+            self._registry._record(self, DEBUG, fmt, args)
+
+    def info(self, fmt: str, *args: Any) -> None:
+        if INFO >= self.threshold:
+            self._registry._record(self, INFO, fmt, args)
+
+    def warning(self, fmt: str, *args: Any) -> None:
+        if WARNING >= self.threshold:
+            self._registry._record(self, WARNING, fmt, args)
+
+    def error(self, fmt: str, *args: Any) -> None:
+        if ERROR >= self.threshold:
+            self._registry._record(self, ERROR, fmt, args)
+
+
+class TraceRegistry:
+    """トレーサー・出力先・リングバッファの管理"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tracers: Dict[str, Tracer] = {}
+        self._levels: Dict[str, int] = {}
+        self._default_level = DEFAULT_LEVEL
+        self._sink: Callable[[str], None] = _print_sink
+        self._capture: Optional[Deque[TraceRecord]] = None
+        self._capture_level = OFF
+
+    def get_tracer(self, name: str) -> Tracer:
+        """名前に対応するトレーサーを取得（なければ作成）"""
+        with self._lock:
+            tracer = self._tracers.get(name)
+            if tracer is None:
+                tracer = Tracer(name, self)
+                self._tracers[name] = tracer
+                self._refresh(tracer)
+            return tracer
+
+    def set_level(self, name: Optional[str], level: int) -> None:
+        """モジュール（前方一致）または全体（name=None）の出力レベルを設定"""
+        with self._lock:
+            if name is None:
+                self._default_level = level
+            else:
+                self._levels[name] = level
+            self._refresh_all()
+
+    def reset(self) -> None:
+        """設定を既定値に戻す（キャプチャも停止）"""
+        with self._lock:
+            self._levels.clear()
+            self._default_level = DEFAULT_LEVEL
+            self._sink = _print_sink
+            self._capture = None
+            self._capture_level = OFF
+            self._refresh_all()
+
+    def set_sink(self, sink: Optional[Callable[[str], None]]) -> None:
+        """出力先を設定（Noneで標準出力に戻す）"""
+        self._sink = sink or _print_sink
+
+    def configure(self, spec: str) -> None:
+        """``name=level,...`` 形式の設定文字列を適用"""
+        for entry in spec.split(","):
+            entry = entry.strip()
+            if not entry:
+                continue
+            name, sep, level_name = entry.rpartition("=")
+            level = LEVEL_NAMES.get(level_name.strip().lower())
+            if level is None:
+                raise ValueError(f"不明なトレースレベルです: {level_name}")
+            self.set_level(name.strip() if sep else None, level)
+
+    def enable_capture(self, size: int = DEFAULT_CAPTURE_SIZE, level: int = DEBUG) -> None:
+        """指定レベル以上のトレースを直近size件までリングバッファに保持
+
+        引数は整形せずにそのまま保持するため、記録コストはタプル1個の追加のみ。
+        """
+        with self._lock:
+            self._capture = deque(maxlen=size)
+            self._capture_level = level
+            self._refresh_all()
+
+    def disable_capture(self) -> None:
+        """リングバッファへの記録を停止（保持済みの内容は破棄）"""
+        with self._lock:
+            self._capture = None
+            self._capture_level = OFF
+            self._refresh_all()
+
+    def get_captured(self) -> List[TraceRecord]:
+        """キャプチャ済みレコードを取得（古い順）"""
+        capture = self._capture
+        return list(capture) if capture is not None else []
+
+    def dump_capture(self) -> List[str]:
+        """キャプチャ済みトレースを整形済み文字列で取得（事後解析用）"""
+        return [f"[{record[1]}] {format_record(record)}" for record in self.get_captured()]
+
+    def _level_for(self, name: str) -> int:
+        best_len = -1
+        level = self._default_level
+        for prefix, prefix_level in self._levels.items():
+            if (name == prefix or name.startswith(prefix + ".")) and len(prefix) > best_len:
+                best_len = len(prefix)
+                level = prefix_level
+        return level
+
+    def _refresh(self, tracer: Tracer) -> None:
+        tracer._emit_level = self._level_for(tracer.name)
+        tracer.threshold = min(tracer._emit_level, self._capture_level)
+
+    def _refresh_all(self) -> None:
+        for tracer in self._tracers.values():
+            self._refresh(tracer)
+
+    def _record(self, tracer: Tracer, level: int, fmt: str, args: Tuple[Any, ...]) -> None:
+        capture = self._capture
+        if capture is not None and level >= self._capture_level:
+            capture.append((time.time(), tracer.name, level, fmt, args))
+        if level >= tracer._emit_level:
+            self._sink(format_record((0.0, tracer.name, level, fmt, args)))
+
+
+_registry = TraceRegistry()
+
+get_tracer = _registry.get_tracer
+set_level = _registry.set_level
+set_sink = _registry.set_sink
+configure = _registry.configure
+reset = _registry.reset
+enable_capture = _registry.enable_capture
+disable_capture = _registry.disable_capture
+get_captured = _registry.get_captured
+dump_capture = _registry.dump_capture
+
+if os.environ.get(ENV_VAR):
+    configure(os.environ[ENV_VAR])
+
+
+__all__ = [
+    "DEBUG", "INFO", "WARNING", "ERROR", "OFF",
+    "Tracer", "TraceRegistry", "TraceRecord", "format_record",
+    "get_tracer", "set_level", "set_sink", "configure", "reset",
+    "enable_capture", "disable_capture", "get_captured", "dump_capture",
+]
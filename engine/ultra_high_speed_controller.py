@@ -7,6 +7,7 @@
 import time
 import logging
 import statistics
+from collections import deque
 from typing import List, Dict, Optional
 from datetime import datetime
 from dataclasses import dataclass, field
@@ -40,6 +41,121 @@ class HighPrecisionTimingData:
             self.stability_coefficient = statistics.stdev(self.actual_intervals)
 
 
+class AdaptiveSleepTimer:
+    """
+    OSスリープ＋短時間スピンのハイブリッドタイマー
+    
+    起動時にOSスリープの超過時間（オーバーシュート）を計測し、
+    間隔の大部分をOSスリープで待ち、計測したジッタ幅だけをスピン待機する。
+    スピン幅は実行中の計測値で随時補正される（ホストごとに適応）。
+    """
+    
+    CALIBRATION_SAMPLES = 20
+    CALIBRATION_SLEEP = 0.001
+    OVERSHOOT_WINDOW = 64      # スピン幅の推定に使う直近の計測数
+    MARGIN_PERCENTILE = 0.9    # スピン幅 = 直近オーバーシュートの90パーセンタイル
+    MIN_SPIN_MARGIN = 0.0001   # 0.1ms
+    MAX_SPIN_MARGIN = 0.01     # 10ms
+    
+    # ホスト単位の較正結果（プロセス内で共有）
+    _host_calibration: Optional[List[float]] = None
+    
+    def __init__(self):
+        self.overshoots = deque(self.calibrate(), maxlen=self.OVERSHOOT_WINDOW)
+        self.spin_margin = self._estimate_margin()
+        self.reset_stats()
+    
+    @classmethod
+    def calibrate(cls, force: bool = False) -> List[float]:
+        """
+        OSスリープのオーバーシュートを計測（プロセス内で1回のみ）
+        
+        Args:
+            force: Trueの場合は再計測する
+            
+        Returns:
+            List[float]: 計測したオーバーシュート（秒）
+        """
+        if cls._host_calibration is not None and not force:
+            return cls._host_calibration
+        
+        overshoots = []
+        for _ in range(cls.CALIBRATION_SAMPLES):
+            start = time.perf_counter()
+            time.sleep(cls.CALIBRATION_SLEEP)
+            overshoots.append(max(0.0, time.perf_counter() - start - cls.CALIBRATION_SLEEP))
+        
+        cls._host_calibration = overshoots
+        logger.debug(f"🎯 スリープ較正: 平均超過 {statistics.mean(overshoots) * 1000:.3f}ms")
+        return overshoots
+    
+    def sleep(self, interval: float) -> float:
+        """
+        指定間隔だけ待機
+        
+        Args:
+            interval: 待機間隔（秒）
+            
+        Returns:
+            float: 実際の経過時間
+        """
+        start = time.perf_counter()
+        cpu_start = time.thread_time()
+        target_end = start + interval
+        
+        # Phase 1: スピン幅を残してOSスリープ
+        coarse = interval - self.spin_margin
+        if coarse > 0:
+            time.sleep(coarse)
+            self._observe_overshoot(time.perf_counter() - start - coarse)
+        
+        # Phase 2: 計測済みジッタ幅だけスピン待機
+        spin_start = time.perf_counter()
+        while time.perf_counter() < target_end:
+            pass
+        end = time.perf_counter()
+        
+        elapsed = end - start
+        self.ticks += 1
+        self.total_cpu_time += time.thread_time() - cpu_start
+        self.total_spin_time += end - spin_start
+        self.total_deviation += abs(elapsed - interval)
+        self.max_deviation = max(self.max_deviation, abs(elapsed - interval))
+        return elapsed
+    
+    def get_stats(self) -> Dict:
+        """タイマー統計取得（時間はミリ秒）"""
+        ticks = self.ticks or 1
+        return {
+            'ticks': self.ticks,
+            'cpu_time_per_tick_ms': self.total_cpu_time / ticks * 1000,
+            'spin_time_per_tick_ms': self.total_spin_time / ticks * 1000,
+            'avg_deviation_ms': self.total_deviation / ticks * 1000,
+            'max_deviation_ms': self.max_deviation * 1000,
+            'spin_margin_ms': self.spin_margin * 1000,
+            'sleep_overshoot_ms': statistics.mean(self.overshoots) * 1000
+        }
+    
+    def reset_stats(self) -> None:
+        """統計リセット（較正結果は保持）"""
+        self.ticks = 0
+        self.total_cpu_time = 0.0
+        self.total_spin_time = 0.0
+        self.total_deviation = 0.0
+        self.max_deviation = 0.0
+    
+    def _observe_overshoot(self, overshoot: float) -> None:
+        """実測オーバーシュートでスピン幅を補正"""
+        self.overshoots.append(max(0.0, overshoot))
+        self.spin_margin = self._estimate_margin()
+    
+    def _estimate_margin(self) -> float:
+        """直近のオーバーシュート分布からスピン幅を算出（単発の外れ値には引きずられない）"""
+        ordered = sorted(self.overshoots)
+        margin = ordered[int((len(ordered) - 1) * self.MARGIN_PERCENTILE)]
+        return min(self.MAX_SPIN_MARGIN, max(self.MIN_SPIN_MARGIN, margin))
+
+
 class UltraHighSpeedController:
     """超高速制御専用コンポーネント"""
     
@@ -58,6 +174,9 @@ class UltraHighSpeedController:
         self.current_target_interval = 0.0
         self.current_tolerance_ms = 0.0
         
+        # OSスリープ較正済みのハイブリッドタイマー
+        self.timer = AdaptiveSleepTimer()
+        
         # 性能監視
         self.performance_degradation_detected = False
         self.consecutive_precision_failures = 0
@@ -134,30 +253,9 @@ class UltraHighSpeedController:
         Returns:
             float: 実際の経過時間
         """
-        start_time = time.perf_counter()
-        target_end = start_time + target_interval
-        tolerance_sec = tolerance_ms / 1000.0
-        
         try:
-            # Phase 1: 粗いスリープフェーズ（95%まで）
-            rough_end = target_end - (target_interval * 0.05)
-            current_time = time.perf_counter()
-            
-            while current_time < rough_end:
-                remaining = rough_end - current_time
-                if remaining > 0.001:  # 1ms以上残っていれば粗いスリープ
-                    time.sleep(min(remaining * 0.8, 0.001))
-                current_time = time.perf_counter()
-            
-            # Phase 2: 精密スピンロックフェーズ（残り5%）
-            while time.perf_counter() < target_end - tolerance_sec:
-                pass  # CPU集約的な高精度待機
-            
-            # Phase 3: 最終調整フェーズ
-            while time.perf_counter() < target_end:
-                pass
-            
-            actual_elapsed = time.perf_counter() - start_time
+            # 大部分をOSスリープで待ち、較正済みのジッタ幅だけスピン待機
+            actual_elapsed = self.timer.sleep(target_interval)
             
             # 測定データ記録
             if self.timing_data:
@@ -276,6 +374,7 @@ class UltraHighSpeedController:
                 'avg_deviation': self.monitor_precision_deviation(),
                 'stability_coefficient': self.timing_data.stability_coefficient if self.timing_data else 0.0
             },
+            'timer': self.timer.get_stats(),
             'ultra_speed_active': self.ultra_high_speed_active,
             'performance_degradation': self.performance_degradation_detected
         }
@@ -286,6 +385,7 @@ class UltraHighSpeedController:
         self.ultra_high_speed_active = False
         self.performance_degradation_detected = False
         self.consecutive_precision_failures = 0
+        self.timer.reset_stats()
         
         # 統計リセット
         self.precision_stats = {
@@ -67,7 +67,7 @@ class Validator:
             )
         
         # 4. 敵との衝突チェック
-        enemy_collision = self._check_enemy_collision(target_pos, game_state.enemies)
+        enemy_collision = self._check_enemy_collision(target_pos, game_state)
         if enemy_collision:
             return MovementResult(
                 is_valid=False,
@@ -95,12 +95,9 @@ class Validator:
         """移動禁止マスチェック"""
         return board.is_forbidden(pos)
     
-    def _check_enemy_collision(self, pos: Position, enemies: List[Enemy]) -> bool:
+    def _check_enemy_collision(self, pos: Position, game_state: GameState) -> bool:
         """敵との衝突チェック"""
-        for enemy in enemies:
-            if pos in enemy.get_occupied_positions():
-                return True
-        return False
+        return game_state.get_enemy_at(pos) is not None
     
     def can_attack_target(self,
                          attacker_pos: Position,
@@ -222,14 +219,14 @@ class Validator:
                     )
                 
                 # 他の敵との衝突チェック
-                for other_enemy in game_state.enemies:
-                    if other_enemy != enemy and check_pos in other_enemy.get_occupied_positions():
-                        return MovementResult(
-                            is_valid=False,
-                            reason="他の敵と衝突します",
-                            blocked_by="enemy",
-                            target_position=target_pos
-                        )
+                other_enemy = game_state.get_enemy_at(check_pos)
+                if other_enemy is not None and other_enemy != enemy:
+                    return MovementResult(
+                        is_valid=False,
+                        reason="他の敵と衝突します",
+                        blocked_by="enemy",
+                        target_position=target_pos
+                    )
         
         return MovementResult(
             is_valid=True,
@@ -6,17 +6,37 @@ Webhook Session Log Uploader for Google Apps Script Integration
 Google Apps Scriptのwebhookエンドポイントにセッションログを送信するシンプルなアップローダー
 """
 
+import gzip
 import json
 import logging
+import random
+import threading
 import time
 import requests
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 
 from .session_data_models import StudentLogEntry, LogSummaryItem
 
 
+# アップロード動作の既定値（設定ファイルの "upload_options" で上書き可能）
+DEFAULT_UPLOAD_OPTIONS = {
+    'max_workers': 4,              # 同時送信数（コネクションプール数）
+    'batch_size': 1,               # 1リクエストあたりのエントリ数（2以上は {"entries": [...]} 形式）
+    'gzip': False,                 # リクエスト本文のgzip圧縮（エンドポイントが対応している場合のみ）
+    'max_retries': 3,              # 429/5xx・通信エラー時の再試行回数
+    'backoff_base_seconds': 0.5,   # 指数バックオフの基準時間
+    'backoff_max_seconds': 30.0,   # バックオフの上限
+    'timeout_seconds': 10
+}
+
+# 再試行対象のHTTPステータス
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
 class WebhookUploadError(Exception):
     """Webhookアップロード関連エラー"""
     pass
@@ -97,6 +117,14 @@ class WebhookConfigManager:
         self.save_config(self._config)
         self.logger.info(f"学生IDを設定しました: {student_id}")
     
+    def get_upload_options(self) -> Dict[str, Any]:
+        """アップロード動作設定取得（未知のキーは無視）"""
+        options = self._config.get('upload_options') or {}
+        if not isinstance(options, dict):
+            self.logger.warning(f"upload_optionsの形式が不正です: {options}")
+            return {}
+        return {key: value for key, value in options.items() if key in DEFAULT_UPLOAD_OPTIONS}
+    
     def is_configured(self) -> bool:
         """設定完了確認"""
         return (self.get_webhook_url() is not None and 
@@ -106,31 +134,66 @@ class WebhookConfigManager:
 class WebhookUploader:
     """Webhookアップローダー"""
     
-    def __init__(self, config_manager: Optional[WebhookConfigManager] = None):
+    USER_AGENT = 'Rogue-like-Framework-v1.2.3'
+    
+    def __init__(self, config_manager: Optional[WebhookConfigManager] = None,
+                 upload_options: Optional[Dict[str, Any]] = None):
         """
         Webhookアップローダーの初期化
         
         Args:
             config_manager: 設定管理インスタンス
+            upload_options: アップロード動作設定（省略時は設定ファイルの値）
         """
         self.config_manager = config_manager or WebhookConfigManager()
         self.logger = logging.getLogger(__name__)
         
+        if upload_options is None and isinstance(self.config_manager, WebhookConfigManager):
+            upload_options = self.config_manager.get_upload_options()
+        self.options = dict(DEFAULT_UPLOAD_OPTIONS)
+        self.options.update(upload_options or {})
+        self.options['max_workers'] = max(1, int(self.options['max_workers']))
+        self.options['batch_size'] = max(1, int(self.options['batch_size']))
+        
+        # Keep-Alive付きコネクションプール（同時送信数分の接続を再利用）
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.options['max_workers'])
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+        self._session.headers.update({
+            'User-Agent': self.USER_AGENT,
+            'Connection': 'keep-alive'
+        })
+        
         # 統計情報
+        self._stats_lock = threading.Lock()
         self.stats = {
             'total_uploads': 0,
             'successful_uploads': 0,
             'failed_uploads': 0
         }
     
+    def close(self):
+        """コネクションプールを解放"""
+        self._session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
     def upload_session_logs(self, entries: List[StudentLogEntry], 
                            progress_callback: Optional[callable] = None) -> Dict[str, Any]:
         """
         セッションログアップロード
         
+        エントリをbatch_size件ずつのリクエストにまとめ、max_workers件まで並行送信する。
+        429/5xx応答は指数バックオフ（ジッター付き）で再試行する。
+        
         Args:
             entries: アップロード対象のログエントリ
-            progress_callback: 進捗コールバック関数
+            progress_callback: 進捗コールバック関数（呼び出し元スレッドで呼ばれる）
             
         Returns:
             アップロード結果
@@ -154,41 +217,47 @@ class WebhookUploader:
         
         successful_uploads = 0
         failed_uploads = 0
+        completed = 0
         start_time = time.time()
         
-        self.logger.info(f"Webhookアップロード開始: {len(entries)} エントリ")
+        batch_size = self.options['batch_size']
+        batches = [entries[i:i + batch_size] for i in range(0, len(entries), batch_size)]
+        workers = min(self.options['max_workers'], len(batches))
         
-        for i, entry in enumerate(entries):
-            try:
-                # エントリをWebhook用データに変換
-                webhook_data = self._convert_entry_to_webhook_data(entry, student_id)
-                
-                # Webhookに送信
-                response = self._send_webhook_request(webhook_url, webhook_data)
+        self.logger.info(
+            f"Webhookアップロード開始: {len(entries)} エントリ "
+            f"({len(batches)} リクエスト, 並列数={workers})"
+        )
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='webhook-upload') as executor:
+            futures = {
+                executor.submit(self._upload_batch, webhook_url, student_id, batch): (index, len(batch))
+                for index, batch in enumerate(batches)
+            }
+            for future in as_completed(futures):
+                index, count = futures[future]
+                try:
+                    recorded = future.result()
+                    successful_uploads += recorded
+                    failed_uploads += count - recorded
+                    if recorded == count:
+                        self.logger.debug(f"リクエスト {index+1} アップロード成功 ({count} エントリ)")
+                except Exception as e:
+                    failed_uploads += count
+                    self.logger.error(f"リクエスト {index+1} 送信エラー: {e}")
                 
-                if response.status_code == 200:
-                    successful_uploads += 1
-                    self.logger.debug(f"エントリ {i+1} アップロード成功")
-                else:
-                    failed_uploads += 1
-                    self.logger.warning(f"エントリ {i+1} アップロード失敗: HTTP {response.status_code}")
+                completed += count
                 
                 # 進捗コールバック
                 if progress_callback:
-                    progress = ((i + 1) / len(entries)) * 100
-                    progress_callback(progress, f"{i+1}/{len(entries)} 完了")
-                
-                # レート制限対応（適度な間隔を空ける）
-                time.sleep(0.1)
-                
-            except Exception as e:
-                failed_uploads += 1
-                self.logger.error(f"エントリ {i+1} 送信エラー: {e}")
+                    progress = (completed / len(entries)) * 100
+                    progress_callback(progress, f"{completed}/{len(entries)} 完了")
         
         # 統計更新
-        self.stats['total_uploads'] += len(entries)
-        self.stats['successful_uploads'] += successful_uploads
-        self.stats['failed_uploads'] += failed_uploads
+        with self._stats_lock:
+            self.stats['total_uploads'] += len(entries)
+            self.stats['successful_uploads'] += successful_uploads
+            self.stats['failed_uploads'] += failed_uploads
         
         processing_time = time.time() - start_time
         success = failed_uploads == 0
@@ -212,6 +281,108 @@ class WebhookUploader:
         
         return result
     
+    def _upload_batch(self, webhook_url: str, student_id: str,
+                      batch: List[StudentLogEntry]) -> int:
+        """
+        エントリ群を1リクエストで送信し、記録されたエントリ数を返す（ワーカースレッドで実行）
+        
+        Apps Scriptは記録に失敗してもHTTP 200を返すため、応答本文の
+        recorded/errorsでエントリごとに成否を判定し、失敗したエントリだけを再送する。
+        """
+        pending = [self._convert_entry_to_webhook_data(entry, student_id) for entry in batch]
+        recorded = 0
+        attempt = 0
+        while True:
+            if len(pending) == 1:
+                payload = pending[0]
+            else:
+                payload = {'student_id': student_id, 'entries': pending}
+            
+            response = self._send_with_retry(webhook_url, payload)
+            if response.status_code != 200:
+                self.logger.warning(f"アップロード失敗: HTTP {response.status_code} ({len(pending)} エントリ)")
+                return recorded
+            
+            count, failed = self._parse_upload_response(response, len(pending))
+            recorded += count
+            if not failed:
+                if count < len(pending):
+                    self.logger.warning(f"アップロード失敗: {len(pending) - count} エントリ（応答から失敗箇所を特定できません）")
+                return recorded
+            if attempt >= self.options['max_retries']:
+                self.logger.warning(f"アップロード失敗: {len(failed)} エントリが記録されませんでした")
+                return recorded
+            
+            pending = [pending[index] for index in failed]
+            delay = self._backoff_delay(attempt)
+            self.logger.debug(
+                f"{len(failed)} エントリの記録に失敗 - {delay:.2f}秒後に再送 ({attempt+1}/{self.options['max_retries']})"
+            )
+            time.sleep(delay)
+            attempt += 1
+    
+    def _parse_upload_response(self, response: requests.Response, count: int) -> Tuple[int, List[int]]:
+        """
+        応答本文から（記録されたエントリ数, 再送すべきエントリの番号）を求める
+        
+        一括送信の失敗は failed_indices / errors の index で特定する。失敗箇所を示さない error は
+        エンドポイントがデータを拒否したものとして再送しない。それ以外で失敗箇所を特定できない応答は
+        重複記録を避けるため、1件も記録されていない場合だけ全エントリを再送対象にする。
+        """
+        try:
+            body = response.json()
+        except ValueError:
+            body = None
+        if not isinstance(body, dict):
+            return 0, []
+        
+        indices = list(body.get('failed_indices') or [])
+        indices.extend(error.get('index') for error in body.get('errors') or [] if isinstance(error, dict))
+        failed = sorted({index for index in indices if isinstance(index, int) and 0 <= index < count})
+        if failed:
+            return count - len(failed), failed
+        if body.get('success') is True:
+            return count, []
+        
+        recorded = body.get('recorded')
+        if isinstance(recorded, int) and 0 < recorded <= count:
+            return recorded, []
+        if body.get('error'):
+            return 0, []
+        return 0, list(range(count))
+    
+    def _send_with_retry(self, webhook_url: str, data: Dict[str, Any]) -> requests.Response:
+        """429/5xx・通信エラー時に指数バックオフで再試行して送信"""
+        max_retries = self.options['max_retries']
+        attempt = 0
+        while True:
+            try:
+                response = self._send_webhook_request(webhook_url, data)
+            except WebhookUploadError as e:
+                if attempt >= max_retries:
+                    raise
+                delay = self._backoff_delay(attempt)
+                self.logger.debug(f"{e} - {delay:.2f}秒後に再試行 ({attempt+1}/{max_retries})")
+            else:
+                if response.status_code not in RETRYABLE_STATUS_CODES or attempt >= max_retries:
+                    return response
+                delay = self._backoff_delay(attempt, response.headers.get('Retry-After'))
+                self.logger.debug(
+                    f"HTTP {response.status_code} - {delay:.2f}秒後に再試行 ({attempt+1}/{max_retries})"
+                )
+            time.sleep(delay)
+            attempt += 1
+    
+    def _backoff_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """再試行までの待機時間（Retry-After優先、なければフルジッター付き指数バックオフ）"""
+        cap = self.options['backoff_max_seconds']
+        if retry_after:
+            try:
+                return min(max(0.0, float(retry_after)), cap)
+            except ValueError:
+                pass  # HTTP日付形式は指数バックオフで代用
+        return random.uniform(0, min(cap, self.options['backoff_base_seconds'] * (2 ** attempt)))
+    
     def _convert_entry_to_webhook_data(self, entry: StudentLogEntry, student_id: str) -> Dict[str, Any]:
         """ログエントリをWebhookデータに変換（v1.2.2セッション用7項目のみ）"""
         webhook_data = {
@@ -229,13 +400,12 @@ class WebhookUploader:
         return webhook_data
     
     def _send_webhook_request(self, webhook_url: str, data: Dict[str, Any]) -> requests.Response:
-        """Webhook リクエスト送信"""
-        import json
-        
-        headers = {
-            'Content-Type': 'application/json',
-            'User-Agent': 'Rogue-like-Framework-v1.2.3'
-        }
+        """Webhook リクエスト送信（プール済みセッションで1回送信）"""
+        headers = {'Content-Type': 'application/json; charset=utf-8'}
+        body = json.dumps(data, ensure_ascii=False).encode('utf-8')
+        if self.options['gzip']:
+            body = gzip.compress(body)
+            headers['Content-Encoding'] = 'gzip'
         
         try:
             self.logger.debug(f"=== Webhook送信開始 ===")
@@ -243,11 +413,11 @@ class WebhookUploader:
             self.logger.debug(f"送信データ: {json.dumps(data, indent=2)}")
             self.logger.debug(f"送信ヘッダー: {headers}")
             
-            response = requests.post(
+            response = self._session.post(
                 webhook_url,
-                json=data,
+                data=body,
                 headers=headers,
-                timeout=10
+                timeout=self.options['timeout_seconds']
             )
             
             self.logger.debug(f"レスポンスコード: {response.status_code}")
@@ -289,10 +459,11 @@ class WebhookUploader:
         try:
             response = self._send_webhook_request(webhook_url, test_data)
             
-            if response.status_code == 200:
-                return True, "Webhook接続テスト成功"
-            else:
+            if response.status_code != 200:
                 return False, f"Webhook接続テスト失敗: HTTP {response.status_code}"
+            if self._parse_upload_response(response, 1)[0] != 1:
+                return False, f"Webhook接続テスト失敗: {response.text}"
+            return True, "Webhook接続テスト成功"
                 
         except Exception as e:
             return False, f"接続テストエラー: {e}"
@@ -303,11 +474,12 @@ class WebhookUploader:
     
     def reset_statistics(self):
         """統計リセット"""
-        self.stats = {
-            'total_uploads': 0,
-            'successful_uploads': 0,
-            'failed_uploads': 0
-        }
+        with self._stats_lock:
+            self.stats = {
+                'total_uploads': 0,
+                'successful_uploads': 0,
+                'failed_uploads': 0
+            }
 
 
 def create_sample_webhook_config() -> str:
@@ -316,6 +488,10 @@ def create_sample_webhook_config() -> str:
         "webhook_url": "https://script.google.com/macros/s/YOUR_SCRIPT_ID/exec",
         "student_id": "123456A",
         "description": "Google Apps Script Webhookアップロード設定",
+        "upload_options": {
+            "max_workers": DEFAULT_UPLOAD_OPTIONS['max_workers'],
+            "batch_size": DEFAULT_UPLOAD_OPTIONS['batch_size']
+        },
         "created_at": datetime.now().isoformat()
     }
     
@@ -69,6 +69,11 @@ function doPost(e) {
     const requestData = JSON.parse(e.postData.contents);
     Logger.log(`解析されたリクエストデータ: ${JSON.stringify(requestData)}`);
     
+    // 複数エントリの一括送信（{"entries": [...]}）
+    if (Array.isArray(requestData.entries)) {
+      return handleBatchPost(requestData.entries);
+    }
+    
     // ログデータを検証
     Logger.log('データ検証開始');
     if (!validateLogData(requestData)) {
@@ -91,7 +96,7 @@ function doPost(e) {
       });
     } else {
       Logger.log(`ログ記録失敗: ${result.error}`);
-      return createResponse(500, { error: result.error });
+      return createResponse(500, { success: false, error: result.error });
     }
     
   } catch (error) {
@@ -102,6 +107,44 @@ function doPost(e) {
   }
 }
 
+/**
+ * 複数エントリの一括記録
+ * Apps ScriptはHTTPステータスを返せないため、成否は本文の success と
+ * failed_indices / errors[].index（entries内の位置）でエントリごとに伝える
+ * @param {Array} entries - ログデータの配列
+ * @return {Object} レスポンス
+ */
+function handleBatchPost(entries) {
+  Logger.log(`一括記録開始: ${entries.length} エントリ`);
+  const errors = [];
+  let recorded = 0;
+  
+  entries.forEach((entry, index) => {
+    if (!validateLogData(entry)) {
+      errors.push({ index: index, error: '無効なログデータです' });
+      return;
+    }
+    const result = recordLogToSheet(entry);
+    if (result.success) {
+      recorded++;
+    } else {
+      errors.push({ index: index, error: result.error });
+    }
+  });
+  
+  Logger.log(`一括記録完了: 成功=${recorded}, 失敗=${errors.length}`);
+  if (errors.length > 0) {
+    return createResponse(500, {
+      success: false,
+      error: `${errors.length} 件の記録に失敗しました`,
+      recorded: recorded,
+      failed_indices: errors.map(error => error.index),
+      errors: errors
+    });
+  }
+  return createResponse(200, { success: true, message: 'ログを記録しました', recorded: recorded, failed_indices: [] });
+}
+
 /**
  * GETリクエスト用ハンドラー（テスト用）
  * @param {Object} e - リクエストオブジェクト
@@ -24,6 +24,7 @@ from engine import ExecutionMode
 import config
 from engine.hyperparameter_manager import HyperParameterManager, HyperParameterError
 from engine.execution_controller import ExecutionController
+from engine.solve_runner import CooperativeSolveRunner
 from engine.session_log_manager import SessionLogManager, LoggingSystemError
 from engine import StepPauseException
 from engine.solve_parser import parse_solve_function
@@ -552,6 +553,11 @@ def main():
         default="stage01",
         help="実行するステージ名（デフォルト: stage01）"
     )
+    parser.add_argument(
+        "--cooperative",
+        action="store_true",
+        help="solve()をスレッドを使わず協調スケジューラで実行"
+    )
     
     args = parser.parse_args()
     
@@ -737,6 +743,33 @@ def main():
         loop_count = 0
         max_loops = 60000  # 最大10分間のループ制限（60FPS * 600秒）
         
+        # 協調実行モード: solve()をこのスレッドで実行し、待機中はGUIフレームを処理する
+        solve_runner = None
+        if args.cooperative:
+            def pump_gui_frame():
+                if hasattr(_global_api, 'renderer') and _global_api.renderer and _global_api.game_manager:
+                    try:
+                        game_state = _global_api.game_manager.get_current_state()
+                        _global_api.renderer.render_frame(game_state)
+                        _global_api.renderer.update_display()
+                    except Exception as render_error:
+                        print(f"⚠️ 描画エラー: {render_error}")
+            
+            solve_runner = CooperativeSolveRunner(execution_controller, pump_gui_frame)
+        
+        def run_solve_cooperatively():
+            try:
+                solve_runner.run(solve)
+            except RuntimeError as e:
+                if "stopped by reset" in str(e):
+                    print(f"🔄 solve()はReset操作により正常終了しました")
+                else:
+                    print(f"❌ solve()実行エラー: {e}")
+            except Exception as e:
+                print(f"❌ solve()実行エラー: {e}")
+            finally:
+                execution_controller.mark_solve_complete()
+        
         # 新しい状態での継続実行可能性を確認
         def should_continue_main_loop(current_mode: ExecutionMode) -> bool:
             """🆕 v1.2.1: メインループ継続判定"""
@@ -865,11 +898,17 @@ def main():
                 # ステップ実行モード：実際のsolve()をネストループ対応で実行
                 try:
                     # 実際のsolve()関数を呼び出し（APIレイヤーでwait_for_action()制御）
-                    if not hasattr(execution_controller, '_solve_thread_started'):
+                    if not hasattr(execution_controller, '_solve_thread_started') and solve_runner:
+                        # 協調実行: solve()が完了・Resetされるまでここで実行（待機中もGUIは更新される）
+                        execution_controller._solve_thread_started = True
+                        print("🚀 solve()を協調実行で開始しました")
+                        run_solve_cooperatively()
+                    elif not hasattr(execution_controller, '_solve_thread_started'):
                         # 初回のみsolve()をバックグラウンドで開始
                         def run_solve():
                             try:
-                                solve()
+                                with execution_controller.solve_context():
+                                    solve()
                             except RuntimeError as e:
                                 if "stopped by reset" in str(e):
                                     print(f"🔄 solve()はReset操作により正常終了しました")
@@ -893,11 +932,17 @@ def main():
             elif current_mode == ExecutionMode.CONTINUOUS:
                 # 連続実行モード：実際のsolve()をネストループ対応で連続実行
                 try:
-                    if not hasattr(execution_controller, '_solve_thread_started'):
+                    if not hasattr(execution_controller, '_solve_thread_started') and solve_runner:
+                        # 協調実行: solve()が完了・Resetされるまでここで実行（待機中もGUIは更新される）
+                        execution_controller._solve_thread_started = True
+                        print("🚀 連続実行のsolve()を協調実行で開始しました")
+                        run_solve_cooperatively()
+                    elif not hasattr(execution_controller, '_solve_thread_started'):
                         # 実際のsolve()関数をバックグラウンドで実行
                         def run_solve_continuous():
                             try:
-                                solve()
+                                with execution_controller.solve_context():
+                                    solve()
                             except RuntimeError as e:
                                 if "stopped by reset" in str(e):
                                     print(f"🔄 solve()はReset操作により正常終了しました")
@@ -916,6 +961,7 @@ def main():
                 except Exception as e:
                     print(f"❌ 連続実行開始エラー: {e}")
                     execution_controller.state.mode = ExecutionMode.ERROR
+                    execution_controller.notify_state_change()
                 
                 # 連続実行モードでは自動進行（wait_for_action()で速度制御）
             
@@ -1,8 +1,13 @@
 #!/usr/bin/env python3
 """CLI script for validating stage solvability"""
 import argparse
+import contextlib
+import glob
+import os
 import sys
 import json
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 # Add src to Python path
@@ -60,13 +65,28 @@ def main():
         prog="validate_stage.py"
     )
 
-    parser.add_argument(
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument(
         "--file", "-f",
         type=str,
-        required=True,
         help="Path to stage YAML file"
     )
 
+    target.add_argument(
+        "--batch", "-b",
+        type=str,
+        metavar="DIR_OR_GLOB",
+        help="Validate every stage in a directory or matching a glob in parallel; "
+             "prints one JSON line per stage as each finishes"
+    )
+
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=None,
+        help="Worker processes for --batch (default: CPU count)"
+    )
+
     parser.add_argument(
         "--detailed", "-d",
         action="store_true",
@@ -93,6 +113,12 @@ def main():
         help="Maximum nodes to explore (e.g., 1000000, 50M, unlimited). Default: auto-detect based on stage type"
     )
 
+    parser.add_argument(
+        "--portfolio", "-p",
+        action="store_true",
+        help="Race A*, weighted A*, iterative deepening and patrol patterns in parallel; first solution wins"
+    )
+
     parser.add_argument(
         "--format", "-F",
         choices=["text", "json"],
@@ -118,6 +144,14 @@ def main():
         print("Error: Stage validation system not available", file=sys.stderr)
         return 2
 
+    # Validate timeout (applies to both single-file and batch validation)
+    if args.timeout < 1:
+        print("Error: Timeout must be at least 1 second", file=sys.stderr)
+        return 2
+
+    if args.batch:
+        return _run_batch(args)
+
     # Check if file exists
     stage_file = Path(args.file)
     if not stage_file.exists():
@@ -133,11 +167,6 @@ def main():
             print(error_msg, file=sys.stderr)
         return 2
 
-    # Validate timeout
-    if args.timeout < 1:
-        print("Error: Timeout must be at least 1 second", file=sys.stderr)
-        return 2
-
     # Parse max nodes
     max_nodes = None
     if args.max_nodes:
@@ -170,7 +199,7 @@ def main():
 
         # Convert to StageConfiguration and run real validation
         stage_config = StageConfiguration.from_dict(stage_data)
-        validator = StageValidator(timeout_seconds=args.timeout)
+        validator = StageValidator(timeout_seconds=args.timeout, use_portfolio=args.portfolio)
 
         # Set max_nodes if specified
         if max_nodes is not None:
@@ -263,6 +292,85 @@ def main():
         return 2
 
 
+def _collect_stage_files(pattern: str) -> list:
+    """Resolve --batch argument (directory or glob) to a sorted list of stage files"""
+    path = Path(pattern)
+    if path.is_dir():
+        files = list(path.glob("*.yml")) + list(path.glob("*.yaml"))
+    else:
+        files = [Path(p) for p in glob.glob(pattern, recursive=True)]
+    return sorted(str(f) for f in files if f.is_file())
+
+
+def _validate_stage_file(stage_path: str, timeout: int, max_nodes, use_portfolio: bool = False) -> dict:
+    """Validate one stage file in a worker process and return a JSON-serializable summary"""
+    start_time = time.time()
+    result = {"stage_path": stage_path, "success": False}
+
+    # Search progress output would interleave with the JSON lines of other workers
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        try:
+            stage_data = load_stage_config(stage_path)
+            if not validate_schema(stage_data):
+                result.update(error="invalid_format", message=f"Invalid stage file format: {stage_path}")
+            else:
+                validator = StageValidator(timeout_seconds=timeout, use_portfolio=use_portfolio)
+                if max_nodes is not None:
+                    validator.max_nodes = max_nodes
+                validation_result = validator.validate_stage(StageConfiguration.from_dict(stage_data))
+                result.update(
+                    success=validation_result.success,
+                    path_found=validation_result.path_found,
+                    required_apis=validation_result.required_apis,
+                    solution_length=validation_result.solution_length,
+                    message=validation_result.error_details
+                )
+        except Exception as e:
+            result.update(error="validation_error", message=str(e))
+
+    result["elapsed_seconds"] = round(time.time() - start_time, 3)
+    return result
+
+
+def _run_batch(args) -> int:
+    """Validate many stages on a process pool, streaming JSON lines as results arrive"""
+    stage_files = _collect_stage_files(args.batch)
+    if not stage_files:
+        print(f"Error: No stage files found: {args.batch}", file=sys.stderr)
+        return 2
+
+    max_nodes = None
+    if args.max_nodes:
+        try:
+            max_nodes = parse_max_nodes(args.max_nodes)
+        except ValueError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            return 2
+
+    jobs = args.jobs or multiprocessing.cpu_count()
+    jobs = max(1, min(jobs, len(stage_files)))
+    print(f"Validating {len(stage_files)} stages with {jobs} workers (timeout {args.timeout}s each)",
+          file=sys.stderr)
+
+    all_success = True
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            executor.submit(_validate_stage_file, stage_path, args.timeout, max_nodes, args.portfolio): stage_path
+            for stage_path in stage_files
+        }
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                # Worker crashed (e.g. killed by the OS)
+                result = {"stage_path": futures[future], "success": False,
+                          "error": "worker_error", "message": str(e)}
+            all_success = all_success and result["success"]
+            print(json.dumps(result, ensure_ascii=False), flush=True)
+
+    return 0 if all_success else 1
+
+
 def validate_stage_with_bombs(stage_file: str) -> bool:
     """Validate stage solvability including bomb handling - v1.2.12
 
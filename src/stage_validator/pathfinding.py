@@ -1,11 +1,27 @@
 """A* pathfinding algorithm for stage validation"""
 from typing import List, Tuple, Set, Optional, Dict, Any
+import copy
 import heapq
 import math
+import sys
+import time
 from dataclasses import dataclass, field
 from enum import Enum
+from pathlib import Path
 
 from stage_generator.data_models import StageConfiguration, EnemyConfiguration
+from stage_validator.validation_models import PathfindingTimeoutError
+
+try:
+    from engine.trace import get_tracer, DEBUG
+    from engine.line_of_sight import LineOfSightCache
+except ImportError:
+    # パス調整が必要な場合
+    sys.path.append(str(Path(__file__).parent.parent.parent))
+    from engine.trace import get_tracer, DEBUG
+    from engine.line_of_sight import LineOfSightCache
+
+_trace = get_tracer("stage_validator.pathfinding")
 
 
 class ActionType(Enum):
@@ -71,21 +87,256 @@ class GameState:
         ))
 
 
-@dataclass
 class SearchNode:
-    """Node in the A* search tree"""
-    state: GameState
-    g_cost: int  # Cost from start
-    h_cost: int  # Heuristic cost to goal
-    f_cost: int  # Total cost
-    parent: Optional['SearchNode']
-    action: Optional[ActionType]
+    """Open-list entry in the A* search (compact state key + costs)"""
+    __slots__ = ("key", "g_cost", "f_cost")
+
+    def __init__(self, key: int, g_cost: int, f_cost: int):
+        self.key = key  # StateEncoder key of the state
+        self.g_cost = g_cost  # Cost from start
+        self.f_cost = f_cost  # Total cost
 
     def __lt__(self, other):
         """For priority queue ordering"""
         return self.f_cost < other.f_cost
 
 
+class StateEncoder:
+    """Packs GameState into a single integer key for the A* tables
+
+    Player position/direction/HP, item bitmasks and the dynamic fields of every
+    enemy are stored in fixed-width bit fields, with the turn count in the
+    (unbounded) high bits. Static enemy attributes (max_hp, attack_power,
+    behavior, patrol_path, vision_range) are kept once here and restored by
+    decode(), so closed/visited tables hold one int per state instead of a
+    GameState with an enemy dict and two sets.
+    """
+
+    DIRECTIONS = ["N", "E", "S", "W"]
+    DIRECTION_CODES = {name: code for code, name in enumerate(DIRECTIONS)}
+    COOLDOWN_BITS = 5
+
+    def __init__(self, width: int, height: int, start_state: GameState, item_ids: List[str]):
+        self.width = width
+        self.pos_bits = max(1, (width * height).bit_length())
+
+        self.item_ids = list(item_ids)
+        self.item_masks = {item_id: 1 << i for i, item_id in enumerate(self.item_ids)}
+        self.item_bits = max(1, len(self.item_ids))
+
+        self.enemy_ids = list(start_state.enemies.keys())
+        self.enemy_templates = [start_state.enemies[enemy_id] for enemy_id in self.enemy_ids]
+
+        # Attacked enemies are rebuilt with the default type, so "normal" is always encodable
+        self.enemy_types = ["normal"]
+        for template in self.enemy_templates:
+            if template.enemy_type not in self.enemy_types:
+                self.enemy_types.append(template.enemy_type)
+        self.enemy_type_codes = {name: code for code, name in enumerate(self.enemy_types)}
+        self.type_bits = max(1, (len(self.enemy_types) - 1).bit_length())
+
+        max_hp = max([start_state.player_hp] +
+                     [max(e.hp, e.max_hp) for e in self.enemy_templates])
+        self.hp_bits = max(1, max_hp.bit_length())
+        max_patrol = max([len(e.patrol_path) for e in self.enemy_templates if e.patrol_path] or [1])
+        self.patrol_bits = max(1, max_patrol.bit_length())
+
+    def _pack(self, key: int, value: int, bits: int) -> int:
+        if value < 0 or value >> bits:
+            raise ValueError(f"State value {value} does not fit in {bits}-bit field")
+        return (key << bits) | value
+
+    def _pos_index(self, pos: Tuple[int, int]) -> int:
+        return pos[1] * self.width + pos[0]
+
+    def _index_pos(self, index: int) -> Tuple[int, int]:
+        return (index % self.width, index // self.width)
+
+    def encode(self, state: GameState) -> int:
+        """Encode a state into its integer key"""
+        key = state.turn_count
+        key = self._pack(key, self._pos_index(state.player_pos), self.pos_bits)
+        key = (key << 2) | self.DIRECTION_CODES[state.player_dir]
+        key = self._pack(key, state.player_hp, self.hp_bits)
+
+        collected = 0
+        for item_id in state.collected_items:
+            collected |= self.item_masks[item_id]
+        disposed = 0
+        for item_id in state.disposed_items:
+            disposed |= self.item_masks[item_id]
+        key = (key << self.item_bits) | collected
+        key = (key << self.item_bits) | disposed
+
+        for enemy_id in self.enemy_ids:
+            enemy = state.enemies[enemy_id]
+            key = self._pack(key, self.enemy_type_codes[enemy.enemy_type], self.type_bits)
+            key = self._pack(key, enemy.alert_cooldown, self.COOLDOWN_BITS)
+            last_seen = 0 if enemy.last_seen_player is None else self._pos_index(enemy.last_seen_player) + 1
+            key = self._pack(key, last_seen, self.pos_bits)
+            target_dir = 0 if enemy.target_direction is None else self.DIRECTION_CODES[enemy.target_direction] + 1
+            key = (key << 3) | target_dir
+            key = self._pack(key, enemy.patrol_index, self.patrol_bits)
+            key = (key << 2) | (int(enemy.is_alive) << 1) | int(enemy.is_alert)
+            key = self._pack(key, enemy.hp, self.hp_bits)
+            key = (key << 2) | self.DIRECTION_CODES[enemy.direction]
+            key = self._pack(key, self._pos_index(enemy.position), self.pos_bits)
+        return key
+
+    def decode(self, key: int) -> GameState:
+        """Rebuild a GameState from its integer key"""
+        pos_mask = (1 << self.pos_bits) - 1
+        hp_mask = (1 << self.hp_bits) - 1
+
+        enemies = {}
+        for enemy_id, template in zip(reversed(self.enemy_ids), reversed(self.enemy_templates)):
+            position = self._index_pos(key & pos_mask)
+            key >>= self.pos_bits
+            direction = self.DIRECTIONS[key & 3]
+            key >>= 2
+            hp = key & hp_mask
+            key >>= self.hp_bits
+            is_alert = bool(key & 1)
+            is_alive = bool(key & 2)
+            key >>= 2
+            patrol_index = key & ((1 << self.patrol_bits) - 1)
+            key >>= self.patrol_bits
+            target_dir = key & 7
+            key >>= 3
+            last_seen = key & pos_mask
+            key >>= self.pos_bits
+            alert_cooldown = key & ((1 << self.COOLDOWN_BITS) - 1)
+            key >>= self.COOLDOWN_BITS
+            enemy_type = self.enemy_types[key & ((1 << self.type_bits) - 1)]
+            key >>= self.type_bits
+
+            enemies[enemy_id] = EnemyState(
+                position=position,
+                direction=direction,
+                hp=hp,
+                max_hp=template.max_hp,
+                attack_power=template.attack_power,
+                behavior=template.behavior,
+                enemy_type=enemy_type,
+                is_alive=is_alive,
+                patrol_path=template.patrol_path,
+                patrol_index=patrol_index,
+                target_direction=None if target_dir == 0 else self.DIRECTIONS[target_dir - 1],
+                is_alert=is_alert,
+                vision_range=template.vision_range,
+                last_seen_player=None if last_seen == 0 else self._index_pos(last_seen - 1),
+                alert_cooldown=alert_cooldown
+            )
+
+        item_mask = (1 << self.item_bits) - 1
+        disposed = key & item_mask
+        key >>= self.item_bits
+        collected = key & item_mask
+        key >>= self.item_bits
+        player_hp = key & hp_mask
+        key >>= self.hp_bits
+        player_dir = self.DIRECTIONS[key & 3]
+        key >>= 2
+        player_pos = self._index_pos(key & pos_mask)
+        key >>= self.pos_bits
+
+        return GameState(
+            player_pos=player_pos,
+            player_dir=player_dir,
+            player_hp=player_hp,
+            # Preserve the stage's enemy order for iteration-dependent AI
+            enemies={enemy_id: enemies[enemy_id] for enemy_id in self.enemy_ids},
+            collected_items={i for i in self.item_ids if collected & self.item_masks[i]},
+            turn_count=key,
+            disposed_items={i for i in self.item_ids if disposed & self.item_masks[i]}
+        )
+
+
+# Calm patrol pose: (position, direction, patrol_index)
+PatrolPose = Tuple[Tuple[int, int], str, int]
+
+
+class PatrolTimeline:
+    """Precomputed calm-patrol schedule for one patrol path
+
+    A calm patrol enemy's next pose depends only on its current pose and, when
+    it is about to step forward, on whether the player stands on the target
+    cell (walls and board bounds never change). Each entry therefore holds both
+    outcomes: pose -> (moved_pose, blocked_pose, target_cell), where
+    target_cell is None when the enemy only turns or stays.
+
+    The table is filled along the cycle from each enemy's starting pose when
+    the stage is loaded, so an enemy that is never blocked or alerted walks the
+    table as pose(t) = cycle[t % period]. Poses off that cycle (after the player
+    blocked a step, or where an alert ended) are added the first time they are
+    reached, which keeps lookups correct without replaying from turn 0.
+    """
+
+    __slots__ = ("patrol_path", "steps", "_is_open")
+
+    OFFSETS = {"N": (0, -1), "S": (0, 1), "E": (1, 0), "W": (-1, 0)}
+
+    def __init__(self, patrol_path: Tuple[Tuple[int, int], ...], is_open):
+        self.patrol_path = patrol_path
+        self.steps: Dict[PatrolPose, Tuple[PatrolPose, PatrolPose, Optional[Tuple[int, int]]]] = {}
+        self._is_open = is_open  # (x, y) -> bool, static passability
+
+    def step(self, pose: PatrolPose) -> Tuple[PatrolPose, PatrolPose, Optional[Tuple[int, int]]]:
+        """Return (moved_pose, blocked_pose, target_cell) for one calm patrol turn"""
+        entry = self.steps.get(pose)
+        if entry is None:
+            entry = self._compute(pose)
+            self.steps[pose] = entry
+        return entry
+
+    def precompute(self, start_pose: PatrolPose) -> List[PatrolPose]:
+        """Fill the table along the unblocked cycle from start_pose and return the cycle"""
+        cycle = []
+        seen = set()
+        pose = start_pose
+        while pose not in seen:
+            seen.add(pose)
+            cycle.append(pose)
+            pose = self.step(pose)[0]
+        return cycle
+
+    def _compute(self, pose: PatrolPose) -> Tuple[PatrolPose, PatrolPose, Optional[Tuple[int, int]]]:
+        # Same rules as the game engine's patrol (see _apply_standard_patrol_ai)
+        position, direction, patrol_index = pose
+        path = self.patrol_path
+        length = len(path)
+
+        current_target = path[(patrol_index + 1) % length]
+        # If already at current target, advance to next patrol point
+        if position == current_target:
+            patrol_index = (patrol_index + 1) % length
+            current_target = path[(patrol_index + 1) % length]
+
+        if current_target == position:
+            stay = (position, direction, patrol_index)
+            return stay, stay, None
+
+        # Choose required direction (x-axis priority)
+        dx = current_target[0] - position[0]
+        dy = current_target[1] - position[1]
+        if dx != 0:
+            required_direction = "E" if dx > 0 else "W"
+        else:
+            required_direction = "S" if dy > 0 else "N"
+
+        if direction != required_direction:
+            # Direction change only - no movement this turn
+            turned = (position, required_direction, patrol_index)
+            return turned, turned, None
+
+        offset_x, offset_y = self.OFFSETS[required_direction]
+        next_position = (position[0] + offset_x, position[1] + offset_y)
+        stay = (position, direction, patrol_index)
+        if not self._is_open(next_position):
+            return stay, stay, None
+        return (next_position, direction, patrol_index), stay, next_position
+
+
 class StagePathfinder:
     """A* pathfinder for validating stage solvability"""
 
@@ -93,6 +344,8 @@ class StagePathfinder:
         self.stage = stage
         self.width, self.height = stage.board.size
         self.walls = self._extract_walls()
+        # Line-of-sight results shared with the game engine's Bresenham (walls never change)
+        self._line_of_sight = LineOfSightCache(self.walls)
         self.goal_pos = tuple(stage.goal.position)
 
         # Item positions
@@ -108,6 +361,22 @@ class StagePathfinder:
 
         self.direction_names = ["N", "E", "S", "W"]  # Clockwise order
 
+        # f = g + heuristic_weight * h (values above 1.0 give weighted A*: faster, not shortest)
+        self.heuristic_weight = 1.0
+
+        # True when the last find_path() emptied its queue without reaching the goal,
+        # i.e. no solution exists within the turn bound (as opposed to hitting max_nodes)
+        self.search_exhausted = False
+
+        # One-step successor cache: (state, [(action, new_state), ...])
+        self._successor_cache = (None, [])
+
+        # Calm patrol schedules keyed by patrol path, and vision cones keyed by
+        # (position, direction, vision_range) as bitmaps over y * width + x
+        self._patrol_timelines: Dict[Tuple[Tuple[int, int], ...], PatrolTimeline] = {}
+        self._vision_bitmaps: Dict[Tuple[Tuple[int, int], str, int], int] = {}
+        self._precompute_patrol_timelines()
+
         # Enemy size mappings for large enemies
         self.enemy_sizes = {
             "normal": (1, 1),
@@ -120,6 +389,29 @@ class StagePathfinder:
             "boss": (2, 2)     # ボスも大型
         }
 
+    def _precompute_patrol_timelines(self) -> None:
+        """Build each patrol enemy's calm cycle (and the vision cones along it) up front"""
+        for enemy in self.stage.enemies:
+            if enemy.behavior != "patrol" or not enemy.patrol_path or len(enemy.patrol_path) <= 1:
+                continue
+            timeline = self._patrol_timeline(enemy.patrol_path)
+            start_pose = (tuple(enemy.position), enemy.direction, self._calculate_initial_patrol_index(enemy))
+            cycle = timeline.precompute(start_pose)
+            if enemy.vision_range:
+                for position, direction, _ in cycle:
+                    self._vision_bitmap(position, direction, enemy.vision_range)
+
+    def _patrol_timeline(self, patrol_path) -> PatrolTimeline:
+        key = tuple(tuple(pos) for pos in patrol_path)
+        timeline = self._patrol_timelines.get(key)
+        if timeline is None:
+            timeline = PatrolTimeline(key, self._is_patrol_cell_open)
+            self._patrol_timelines[key] = timeline
+        return timeline
+
+    def _is_patrol_cell_open(self, pos: Tuple[int, int]) -> bool:
+        return pos not in self.walls and 0 <= pos[0] < self.width and 0 <= pos[1] < self.height
+
     def _extract_walls(self) -> Set[Tuple[int, int]]:
         """Extract wall positions from board grid"""
         walls = set()
@@ -149,16 +441,23 @@ class StagePathfinder:
                 positions.append(pos)
         return positions
 
-    def find_path(self, max_turns: Optional[int] = None) -> Optional[List[ActionType]]:
+    def find_path(self, max_turns: Optional[int] = None,
+                  timeout_seconds: Optional[float] = None) -> Optional[List[ActionType]]:
         """
         Find a path from start to goal using A* algorithm
 
         Args:
             max_turns: Maximum number of turns allowed (from stage constraints if None)
+            timeout_seconds: Wall-clock budget for the search (unlimited if None)
 
         Returns:
             List of actions to reach goal, or None if no path exists
+
+        Raises:
+            PathfindingTimeoutError: If the search exceeds timeout_seconds
         """
+        deadline = time.monotonic() + timeout_seconds if timeout_seconds is not None else None
+        self.search_exhausted = False
         if max_turns is None:
             max_turns = self.stage.constraints.max_turns
 
@@ -190,29 +489,30 @@ class StagePathfinder:
         )
 
         # DEBUG: Log initial enemy positions
-        print(f"DEBUG FIND_PATH: 初期状態確認")
-        print(f"   プレイヤー: pos={start_state.player_pos}, dir={start_state.player_dir}, HP={start_state.player_hp}")
+        _trace.debug("DEBUG FIND_PATH: 初期状態確認")
+        _trace.debug("   プレイヤー: pos=%s, dir=%s, HP=%s", start_state.player_pos, start_state.player_dir, start_state.player_hp)
         for enemy_id, enemy_state in start_state.enemies.items():
-            print(f"   敵 {enemy_id}: pos={enemy_state.position}, dir={enemy_state.direction}, HP={enemy_state.hp}, alerted={enemy_state.is_alert}")
+            _trace.debug("   敵 %s: pos=%s, dir=%s, HP=%s, alerted=%s", enemy_id, enemy_state.position,
+                         enemy_state.direction, enemy_state.hp, enemy_state.is_alert)
 
         # Check if already at goal
         if self._is_goal_reached(start_state):
             return []
 
-        # A* search
-        open_set = []
-        start_node = SearchNode(
-            state=start_state,
-            g_cost=0,
-            h_cost=self._heuristic(start_state),
-            f_cost=self._heuristic(start_state),
-            parent=None,
-            action=None
-        )
+        # A* search over compact state keys
+        # closed_set / visited_states hold ints, and parent pointers are kept as
+        # key -> (parent_key, action) instead of chains of node objects
+        encoder = StateEncoder(self.width, self.height, start_state, list(self.items.keys()))
+        start_key = encoder.encode(start_state)
+        weight = self.heuristic_weight
+        start_h = self._heuristic(start_state)
+        if weight != 1.0:
+            start_h *= weight
 
-        heapq.heappush(open_set, start_node)
+        open_set = []
+        heapq.heappush(open_set, SearchNode(start_key, 0, start_h))
         closed_set = set()
-        visited_states = {start_state: start_node}
+        visited_states = {start_key: (start_h, None, None)}  # key -> (f_cost, parent_key, action)
 
         # Search loop with progress tracking
         nodes_explored = 0
@@ -237,6 +537,12 @@ class StagePathfinder:
             current_node = heapq.heappop(open_set)
             nodes_explored += 1
 
+            # Timeout check every 1024 nodes keeps the clock call off the hot path
+            if deadline is not None and not (nodes_explored & 1023) and time.monotonic() >= deadline:
+                raise PathfindingTimeoutError(
+                    f"Search exceeded {timeout_seconds}s after {nodes_explored:,} nodes"
+                )
+
             # Progress display - frequent early progress, then every 10M nodes
             show_progress = False
             if nodes_explored < 1000000:  # First 1M nodes - show every 100K
@@ -257,64 +563,62 @@ class StagePathfinder:
                           f"| キュー: {queue_size:,} | 探索済み: {closed_size:,}")
                 last_progress = nodes_explored
 
-            if current_node.state in closed_set:
+            current_key = current_node.key
+            if current_key in closed_set:
                 continue
 
-            closed_set.add(current_node.state)
+            closed_set.add(current_key)
+            current_state = encoder.decode(current_key)
 
             # Check if player died
-            if current_node.state.player_hp <= 0:
+            if current_state.player_hp <= 0:
                 continue  # Skip this invalid state
 
             # Check if goal reached
-            if self._is_goal_reached(current_node.state):
-                print(f"GOAL REACHED! Player: {current_node.state.player_pos}, HP: {current_node.state.player_hp}")
-                print(f"   Enemies: {[(id, e.position, e.hp, e.is_alive) for id, e in current_node.state.enemies.items()]}")
-                print(f"   Items: collected={current_node.state.collected_items}, disposed={current_node.state.disposed_items}")
+            if self._is_goal_reached(current_state):
+                print(f"GOAL REACHED! Player: {current_state.player_pos}, HP: {current_state.player_hp}")
+                print(f"   Enemies: {[(id, e.position, e.hp, e.is_alive) for id, e in current_state.enemies.items()]}")
+                print(f"   Items: collected={current_state.collected_items}, disposed={current_state.disposed_items}")
                 print(f"探索完了: 解法発見! 総ノード数: {nodes_explored:,}")
-                return self._reconstruct_path(current_node)
+                return self._reconstruct_path(current_key, visited_states)
 
             # Check turn limit - allow some flexibility for complex scenarios
-            if current_node.state.turn_count >= max_turns * 1.2:  # Allow 20% more turns for exploration
+            if current_state.turn_count >= max_turns * 1.2:  # Allow 20% more turns for exploration
                 continue
 
             # CRITICAL FIX: Pre-check if current state would lead to certain death
             # If player is in a position where enemies will kill them no matter what action they take,
             # this state should be considered invalid (same as game engine behavior)
-            if self._is_state_lethal(current_node.state):
+            if self._is_state_lethal(current_state):
                 # This state leads to certain death - do not explore further
                 continue
 
             # Generate successor states
-            for action in self._get_valid_actions(current_node.state):
-                new_state = self._apply_action(current_node.state, action)
-                if new_state is None or new_state in closed_set:
+            for action, new_state in self._get_successors(current_state):
+                if new_state is None:
+                    continue
+                new_key = encoder.encode(new_state)
+                if new_key in closed_set:
                     continue
 
                 # Calculate costs
                 g_cost = current_node.g_cost + 1
                 h_cost = self._heuristic(new_state)
+                if weight != 1.0:
+                    h_cost *= weight
                 f_cost = g_cost + h_cost
 
                 # Skip if we've seen this state with better cost
-                if new_state in visited_states and visited_states[new_state].f_cost <= f_cost:
+                visited = visited_states.get(new_key)
+                if visited is not None and visited[0] <= f_cost:
                     continue
 
-                # Create new node
-                new_node = SearchNode(
-                    state=new_state,
-                    g_cost=g_cost,
-                    h_cost=h_cost,
-                    f_cost=f_cost,
-                    parent=current_node,
-                    action=action
-                )
-
-                visited_states[new_state] = new_node
-                heapq.heappush(open_set, new_node)
+                visited_states[new_key] = (f_cost, current_key, action)
+                heapq.heappush(open_set, SearchNode(new_key, g_cost, f_cost))
 
         # Search completed without finding solution
-        if unlimited:
+        self.search_exhausted = not open_set
+        if self.search_exhausted:
             print(f"探索終了: 解法未発見 ({nodes_explored:,} ノード探索済み, キューが空)")
         else:
             print(f"探索終了: 解法未発見 (最大ノード数 {max_nodes:,} に到達)")
@@ -384,14 +688,16 @@ class StagePathfinder:
 
             else:
                 # Unknown condition type - fail safe by returning False
-                print(f"⚠️ Unknown victory condition type: {condition_type}")
+                _trace.warning("⚠️ Unknown victory condition type: %s", condition_type)
                 return False
 
         # All conditions have been checked and passed
-        print(f"🎉 All victory conditions satisfied! Player at {state.player_pos}")
-        print(f"🎯 Final enemy positions:")
-        for enemy_id, enemy_state in state.enemies.items():
-            print(f"   {enemy_id}: {enemy_state.position} facing {enemy_state.direction} (HP: {enemy_state.hp}/{enemy_state.max_hp})")
+        _trace.info("🎉 All victory conditions satisfied! Player at %s", state.player_pos)
+        if _trace.is_enabled(DEBUG):
+            _trace.debug("🎯 Final enemy positions:")
+            for enemy_id, enemy_state in state.enemies.items():
+                _trace.debug("   %s: %s facing %s (HP: %s/%s)", enemy_id, enemy_state.position,
+                             enemy_state.direction, enemy_state.hp, enemy_state.max_hp)
         return True
 
     def _is_state_lethal(self, state: GameState) -> bool:
@@ -400,20 +706,19 @@ class StagePathfinder:
         This simulates the game engine's behavior where enemies attack after player actions.
         """
         # Test all possible actions from this state
-        valid_actions = self._get_valid_actions(state)
-        if not valid_actions:
+        successors = self._get_successors(state)
+        if not successors:
             return True  # No valid actions available
 
         lethal_actions = 0
 
-        for action in valid_actions:
+        for action, test_state in successors:
             # Simulate the action outcome
-            test_state = self._apply_action(state, action)
             if test_state is None:  # Action results in immediate death
                 lethal_actions += 1
 
         # If ALL actions lead to death, this state is lethal
-        return lethal_actions == len(valid_actions)
+        return lethal_actions == len(successors)
 
     def _heuristic(self, state: GameState) -> int:
         """Calculate heuristic cost to goal (combat-aware)"""
@@ -860,8 +1165,6 @@ class StagePathfinder:
     def _can_attack_any_direction(self, state: GameState) -> List[str]:
         """Check if player can attack enemies by facing any direction.
         Returns list of directions that would allow successful attack."""
-        import copy
-
         # Create a temporary state to simulate enemy movement
         temp_state = GameState(
             player_pos=state.player_pos,
@@ -1052,14 +1355,31 @@ class StagePathfinder:
 
         return False
 
+    def _get_successors(self, state: GameState) -> List[Tuple[ActionType, Optional[GameState]]]:
+        """Apply every valid action once and cache the result for this state
+
+        _is_state_lethal and the expansion loop in find_path both need the
+        successors of the node being expanded; the one-entry cache keyed on the
+        state object lets them share a single simulation per action.
+        """
+        cached_state, cached_successors = self._successor_cache
+        if cached_state is state:
+            return cached_successors
+
+        successors = [(action, self._apply_action(state, action))
+                      for action in self._get_valid_actions(state)]
+        self._successor_cache = (state, successors)
+        return successors
+
     def _apply_action(self, state: GameState, action: ActionType) -> Optional[GameState]:
         """Apply an action to a state and return the new state"""
-        import copy
+        # Enemy states are shared with the parent state; _apply_enemy_ai and the
+        # attack branch replace (copy-on-write) only the enemies they change
         new_state = GameState(
             player_pos=state.player_pos,
             player_dir=state.player_dir,
             player_hp=state.player_hp,
-            enemies=copy.deepcopy(state.enemies),
+            enemies=dict(state.enemies),
             collected_items=set(state.collected_items),
             disposed_items=set(state.disposed_items),  # v1.2.12
             turn_count=state.turn_count + 1
@@ -1203,20 +1523,21 @@ class StagePathfinder:
 
         # Check if player died after enemy AI processing
         if new_state.player_hp <= 0:
-            print(f"💀 INVALID STATE: Player died (HP: {new_state.player_hp})")
+            _trace.debug("💀 INVALID STATE: Player died (HP: %s)", new_state.player_hp)
             return None  # Return None to indicate invalid state
 
         return new_state
 
-    def _reconstruct_path(self, goal_node: SearchNode) -> List[ActionType]:
-        """Reconstruct the path from start to goal"""
+    def _reconstruct_path(self, goal_key: int,
+                          visited_states: Dict[int, Tuple[int, Optional[int], Optional[ActionType]]]) -> List[ActionType]:
+        """Reconstruct the path from start to goal by following parent keys"""
         path = []
-        current = goal_node
+        _, parent_key, action = visited_states[goal_key]
 
-        while current.parent is not None:
-            if current.action:
-                path.append(current.action)
-            current = current.parent
+        while parent_key is not None:
+            if action:
+                path.append(action)
+            _, parent_key, action = visited_states[parent_key]
 
         path.reverse()
 
@@ -1259,10 +1580,15 @@ class StagePathfinder:
 
     def _apply_enemy_ai(self, state: GameState) -> None:
         """Apply enemy AI behavior - exactly match game_state.py logic"""
-        for enemy_id, enemy_state in state.enemies.items():
-            if not enemy_state.is_alive or enemy_state.hp <= 0:
+        for enemy_id, shared_enemy_state in list(state.enemies.items()):
+            if not shared_enemy_state.is_alive or shared_enemy_state.hp <= 0:
                 continue
 
+            # Copy-on-write: the enemy object may be shared with the parent state
+            # (and sibling successors), so simulate on a shallow copy and only
+            # keep it if something actually changed
+            enemy_state = copy.copy(shared_enemy_state)
+
             # Reset attacked flag at start of new turn
             if hasattr(enemy_state, 'attacked_this_turn'):
                 enemy_state.attacked_this_turn = False
@@ -1292,17 +1618,19 @@ class StagePathfinder:
 
             # DEBUG: Log any enemy changes (simplified to reduce spam)
             if enemy_state.position != original_pos:
-                print(f"DEBUG ENEMY MOVE: {enemy_id} {original_pos}->{enemy_state.position}, alert={enemy_state.is_alert}, behavior={enemy_state.behavior}")
+                _trace.debug("DEBUG ENEMY MOVE: %s %s->%s, alert=%s, behavior=%s", enemy_id, original_pos,
+                             enemy_state.position, enemy_state.is_alert, enemy_state.behavior)
 
             # DEBUG: Log when static enemies are processed
             if enemy_state.behavior == "static" and enemy_state.is_alert:
-                print(f"DEBUG STATIC ALERT: {enemy_id} at {enemy_state.position}, alert={enemy_state.is_alert} - chasing player")
+                _trace.debug("DEBUG STATIC ALERT: %s at %s, alert=%s - chasing player", enemy_id,
+                             enemy_state.position, enemy_state.is_alert)
 
             # THEN check if enemy can see player at NEW position (same as game engine)
             if self._can_enemy_see_player(state, enemy_state):
                 # Player detected - switch to alert mode
                 if not enemy_state.is_alert:
-                    print(f"ALERT: 敵がプレイヤーを発見！警戒状態に移行")
+                    _trace.debug("ALERT: 敵がプレイヤーを発見！警戒状態に移行")
                     enemy_state.is_alert = True
                     enemy_state.alert_cooldown = 10  # 10 turns of continued tracking
                     enemy_state.last_seen_player = state.player_pos
@@ -1321,6 +1649,9 @@ class StagePathfinder:
                     # No alert cooldown - return to normal behavior
                     enemy_state.is_alert = False
 
+            if enemy_state != shared_enemy_state:
+                state.enemies[enemy_id] = enemy_state
+
             # DEBUG: Log enemy position and direction changes (disabled)
             # if enemy_state.position != original_pos:
             #     print(f"🚶 ENEMY MOVE: {enemy_id} moved from {original_pos} to {enemy_state.position} (direction: {original_direction}->{enemy_state.direction}, Player at {state.player_pos})")
@@ -1332,108 +1663,57 @@ class StagePathfinder:
     def _can_enemy_see_player(self, state: GameState, enemy_state: EnemyState) -> bool:
         """Check if enemy can see the player using directional cone vision (same as game engine)"""
         px, py = state.player_pos
-        ex, ey = enemy_state.position
-
-        # Use enemy's actual vision_range (must be explicitly set)
-        vision_range = enemy_state.vision_range
-
-        # DEBUG: Add detailed vision debugging for step 7 issue (DISABLED for performance)
-        # if state.turn_count == 7 or ((ex, ey) == (8, 2) and (px, py) == (6, 0)):
-        #     print(f"🔍 A* VISION DEBUG: Enemy at ({ex},{ey}) dir={enemy_state.direction} → Player at ({px},{py}) | Turn={state.turn_count}")
-        #     print(f"   vision_range={vision_range}, alert={enemy_state.is_alert}")
+        bitmap = self._vision_bitmap(enemy_state.position, enemy_state.direction, enemy_state.vision_range)
+        return (bitmap >> (py * self.width + px)) & 1 == 1
+
+    def _vision_bitmap(self, position: Tuple[int, int], direction: str, vision_range: int) -> int:
+        """Cells visible from a pose, as a bitmap over y * width + x (memoized per stage)"""
+        key = (position, direction, vision_range)
+        bitmap = self._vision_bitmaps.get(key)
+        if bitmap is None:
+            bitmap = self._compute_vision_bitmap(position, direction, vision_range)
+            self._vision_bitmaps[key] = bitmap
+        return bitmap
+
+    def _compute_vision_bitmap(self, position: Tuple[int, int], direction: str, vision_range: int) -> int:
+        """Build the vision cone bitmap with line-of-sight checks (same cone as game engine)"""
+        ex, ey = position
+        bitmap = 0
 
         # Direction mappings to match game engine
-        direction_offsets = {
-            "N": (0, -1),  # North
-            "S": (0, 1),   # South
-            "E": (1, 0),   # East
-            "W": (-1, 0)   # West
-        }
-
-        if enemy_state.direction not in direction_offsets:
-            return False
-
-        dx_dir, dy_dir = direction_offsets[enemy_state.direction]
+        if direction not in ("N", "S", "E", "W"):
+            return bitmap
 
         # Check each distance within vision range (same logic as game engine)
         for distance in range(1, vision_range + 1):
             for offset in range(-distance, distance + 1):
                 # Calculate target position based on direction (same as engine/__init__.py:299-308)
-                if enemy_state.direction == "N":
+                if direction == "N":
                     target_x = ex + offset
                     target_y = ey - distance
-                elif enemy_state.direction == "S":
+                elif direction == "S":
                     target_x = ex + offset
                     target_y = ey + distance
-                elif enemy_state.direction == "E":
+                elif direction == "E":
                     target_x = ex + distance
                     target_y = ey + offset
-                elif enemy_state.direction == "W":
+                else:
                     target_x = ex - distance
                     target_y = ey + offset
-                else:
+
+                if not (0 <= target_x < self.width and 0 <= target_y < self.height):
                     continue
 
-                # DEBUG: Show all calculation steps for critical case (DISABLED for performance)
-                # if (ex, ey) == (8, 2) and enemy_state.direction == "N" and px == 6 and py == 0:
-                #     print(f"🔍 CRITICAL CASE DEBUG: distance={distance}, offset={offset}, target=({target_x},{target_y}), player=({px},{py})")
-                #     print(f"🔍 CRITICAL CASE: Checking position match: target=({target_x},{target_y}) vs player=({px},{py}) → match={((target_x, target_y) == (px, py))}")
-                #     if (target_x, target_y) == (px, py):
-                #         print(f"🔍 CRITICAL CASE: POSITION MATCH! Checking angle: abs({offset}) <= {distance} → {abs(offset) <= distance}")
-
-                # Check if this target position matches player position
-                if (target_x, target_y) == (px, py):
-                    # 90-degree field of view check (same as engine/__init__.py:311)
-                    if abs(offset) <= distance:
-                        # Check line of sight (wall obstruction) - same as game engine
-                        if self._has_line_of_sight(enemy_state.position, (target_x, target_y)):
-                            # print(f"🔍 A* VISION: PLAYER DETECTED at distance={distance}, offset={offset}, target=({target_x},{target_y})")  # DISABLED for clean output
-                            return True
-
-        # print(f"🔍 A* VISION: No detection - vision_range={vision_range}, direction={enemy_state.direction}")  # DISABLED for clean output
-        return False
+                # 90-degree field of view (abs(offset) <= distance) holds by construction;
+                # line of sight (wall obstruction) - same as game engine
+                if self._has_line_of_sight(position, (target_x, target_y)):
+                    bitmap |= 1 << (target_y * self.width + target_x)
+
+        return bitmap
 
     def _has_line_of_sight(self, start_pos: Tuple[int, int], target_pos: Tuple[int, int]) -> bool:
         """Check if line of sight is clear (no walls blocking) - same as game engine"""
-        start_x, start_y = start_pos
-        end_x, end_y = target_pos
-
-        # Use Bresenham line algorithm (same as engine/__init__.py:334-375)
-        dx = abs(end_x - start_x)
-        dy = abs(end_y - start_y)
-
-        step_x = 1 if start_x < end_x else -1
-        step_y = 1 if start_y < end_y else -1
-
-        x, y = start_x, start_y
-
-        if dx > dy:
-            err = dx / 2.0
-            while x != end_x:
-                x += step_x
-                err -= dy
-                if err < 0:
-                    y += step_y
-                    err += dx
-                # Check intermediate points for walls (excluding target)
-                if x != end_x or y != end_y:
-                    if (x, y) in self.walls:
-                        return False
-        else:
-            err = dy / 2.0
-            while y != end_y:
-                y += step_y
-                err -= dx
-                if err < 0:
-                    x += step_x
-                    err += dy
-                # Check intermediate points for walls (excluding target)
-                if x != end_x or y != end_y:
-                    if (x, y) in self.walls:
-                        return False
-
-        return True
-
+        return self._line_of_sight.has_line_of_sight(start_pos[0], start_pos[1], target_pos[0], target_pos[1])
 
     def _apply_combat_ai(self, state: GameState, enemy_state: EnemyState) -> None:
         """Apply combat AI - attack player with gradual rotation (exactly same as game engine)"""
@@ -1467,7 +1747,7 @@ class StagePathfinder:
 
                 # Check if player died from this attack
                 if state.player_hp <= 0:
-                    print(f"💀 PLAYER DIED: Enemy {enemy_id} killed player with {enemy_state.attack_power} damage")
+                    _trace.debug("💀 PLAYER DIED: Enemy %s killed player with %s damage", enemy_id, enemy_state.attack_power)
                     # Player is dead - this state should not be valid for further exploration
                     return
         else:
@@ -1540,69 +1820,20 @@ class StagePathfinder:
             self._apply_standard_patrol_ai(state, enemy_state)
 
     def _apply_standard_patrol_ai(self, state: GameState, enemy_state: EnemyState) -> None:
-        """Apply standard patrol AI - move enemy along patrol path (EXACTLY same as game engine)"""
+        """Apply standard patrol AI - move enemy along patrol path (EXACTLY same as game engine)
+
+        The transition is looked up in the precomputed PatrolTimeline; the only
+        per-state input is whether the player stands on the cell being entered.
+        """
         if not enemy_state.patrol_path or len(enemy_state.patrol_path) <= 1:
             return
 
-        # DEBUG: Log patrol state for step 6-7 synchronization issue (DISABLED for performance)
-        # if state.turn_count >= 6 and state.turn_count <= 8:
-        #     print(f"🚶 A* PATROL DEBUG: Turn={state.turn_count}, Enemy at {enemy_state.position}, patrol_index={enemy_state.patrol_index}")
-        #     print(f"   patrol_path: {enemy_state.patrol_path}")
-        #     print(f"   direction: {enemy_state.direction}")
-
-        # Get next target position (same as game engine's get_next_patrol_position)
-        # Based on engine/__init__.py:383 - returns NEXT position (current_patrol_index + 1)
-        next_index = (enemy_state.patrol_index + 1) % len(enemy_state.patrol_path)
-        current_target = tuple(enemy_state.patrol_path[next_index])
-
-        # If already at current target, advance to next patrol point (same as game engine)
-        if enemy_state.position == current_target:
-            enemy_state.patrol_index = (enemy_state.patrol_index + 1) % len(enemy_state.patrol_path)
-            next_index = (enemy_state.patrol_index + 1) % len(enemy_state.patrol_path)
-            current_target = tuple(enemy_state.patrol_path[next_index])
-
-        # Move towards target if different from current position
-        if current_target != enemy_state.position:
-            # Calculate required direction (same logic as game engine:1060-1067)
-            dx = current_target[0] - enemy_state.position[0]
-            dy = current_target[1] - enemy_state.position[1]
-
-            # Choose required direction (x-axis priority, same as game engine:1064-1067)
-            if dx != 0:
-                required_direction = "E" if dx > 0 else "W"
-            elif dy != 0:
-                required_direction = "S" if dy > 0 else "N"
-            else:
-                return  # Already at target
-
-            # FIXED: Apply EXACT game engine logic (game_state.py:1072-1079)
-            # Check if already facing correct direction
-            if enemy_state.direction == required_direction:
-                # Movement execution - only if already facing correct direction
-                offset_x = 1 if required_direction == "E" else (-1 if required_direction == "W" else 0)
-                offset_y = 1 if required_direction == "S" else (-1 if required_direction == "N" else 0)
-                next_position = (enemy_state.position[0] + offset_x, enemy_state.position[1] + offset_y)
-
-                # Check if next position is valid (same as game engine:1075-1076)
-                if (next_position not in self.walls and
-                    0 <= next_position[0] < self.width and
-                    0 <= next_position[1] < self.height and
-                    next_position != state.player_pos):
-                    # Move to target
-                    old_pos = enemy_state.position
-                    old_dir = enemy_state.direction
-                    enemy_state.position = next_position
-                    # ⚠️  CRITICAL FIX: 方向設定はすでに上で行われているため、ここで重複設定しない
-                    # enemy_state.direction = required_direction  # REMOVED: Duplicate direction setting
-                    # print(f"🚶 A* PATROL MOVE: Enemy moved {old_pos}→{next_position} dir={old_dir}→{enemy_state.direction} (Turn={state.turn_count})")  # DISABLED for clean output
-                else:
-                    # print(f"🚫 A* PATROL BLOCKED: Enemy cannot move to {next_position} (Turn={state.turn_count})")  # DISABLED for clean output
-                    pass
-            else:
-                # Direction change - just change direction without moving (same as game engine:1078-1079)
-                old_dir = enemy_state.direction
-                enemy_state.direction = required_direction
-                # print(f"🔄 A* PATROL TURN: Enemy turned {old_dir}→{required_direction} at {enemy_state.position} (Turn={state.turn_count})")  # DISABLED for clean output
+        timeline = self._patrol_timeline(enemy_state.patrol_path)
+        moved, blocked, target_cell = timeline.step(
+            (enemy_state.position, enemy_state.direction, enemy_state.patrol_index)
+        )
+        pose = blocked if target_cell == state.player_pos else moved
+        enemy_state.position, enemy_state.direction, enemy_state.patrol_index = pose
 
     def _apply_chase_ai(self, state: GameState, enemy_state: EnemyState) -> None:
         """Apply chase AI - exact implementation from game_state.py _simple_chase_behavior"""
@@ -6,12 +6,21 @@ A*とゲームエンジンで統一された敵AIロジック。
 """
 
 from abc import ABC, abstractmethod
-from typing import Tuple, List, Dict, Any, Optional
+from typing import Tuple, List, Dict, Any, Iterable, Optional
 import math
 import logging
+import sys
+from pathlib import Path
 
 from .models import EnemyState, ValidationConfig, get_global_config
 
+try:
+    from engine.line_of_sight import LineOfSightCache
+except ImportError:
+    # パス調整が必要な場合
+    sys.path.append(str(Path(__file__).parent.parent.parent))
+    from engine.line_of_sight import LineOfSightCache
+
 
 class UnifiedEnemyAI(ABC):
     """統一敵AIロジックの抽象基底クラス"""
@@ -47,9 +56,13 @@ class UnifiedEnemyAI(ABC):
 class StandardEnemyAI(UnifiedEnemyAI):
     """標準統一敵AI実装"""
 
-    def __init__(self, config: Optional[ValidationConfig] = None):
+    def __init__(self, config: Optional[ValidationConfig] = None,
+                 line_of_sight: Optional[LineOfSightCache] = None):
         super().__init__(config)
 
+        # 壁による視線遮蔽の判定（ボード差し替え時は set_line_of_sight で入れ替える）
+        self.line_of_sight = line_of_sight
+
         # AIの内部状態
         self.enemy_memory: Dict[str, Dict] = {}
         self.turn_counter = 0
@@ -329,10 +342,16 @@ class StandardEnemyAI(UnifiedEnemyAI):
         else:  # left, right
             return dir_vector[0] * to_player[0] > 0 and abs(to_player[1]) <= abs(to_player[0])
 
+    def set_line_of_sight(self, line_of_sight: Optional[LineOfSightCache]) -> None:
+        """視線判定キャッシュを設定（ボード差し替え時に呼ぶ）"""
+        self.line_of_sight = line_of_sight
+
     def _has_line_of_sight(self, from_pos: Tuple[int, int], to_pos: Tuple[int, int]) -> bool:
-        """視線チェック（障害物なし）"""
-        # 簡略化：常にTrueを返す（壁チェックは省略）
-        return True
+        """視線チェック"""
+        # 壁情報がない場合は従来どおり遮蔽なしとして扱う
+        if self.line_of_sight is None:
+            return True
+        return self.line_of_sight.has_line_of_sight(from_pos[0], from_pos[1], to_pos[0], to_pos[1])
 
     def advance_turn(self) -> None:
         """ターンを進める"""
@@ -378,6 +397,16 @@ class StandardEnemyAI(UnifiedEnemyAI):
 
 
 # デフォルト実装のファクトリー関数
-def create_standard_enemy_ai(config: Optional[ValidationConfig] = None) -> StandardEnemyAI:
-    """標準敵AI作成"""
-    return StandardEnemyAI(config)
\ No newline at end of file
+def create_standard_enemy_ai(config: Optional[ValidationConfig] = None,
+                             walls: Optional[Iterable[Tuple[int, int]]] = None,
+                             line_of_sight: Optional[LineOfSightCache] = None) -> StandardEnemyAI:
+    """標準敵AI作成
+
+    Args:
+        config: 検証設定
+        walls: ボードの壁座標（ステージYAMLの ``[x, y]`` 形式も可）。視線判定キャッシュを作成する
+        line_of_sight: 既存の視線判定キャッシュ（StagePathfinder等と共有する場合。wallsより優先）
+    """
+    if line_of_sight is None and walls is not None:
+        line_of_sight = LineOfSightCache(tuple(wall) for wall in walls)
+    return StandardEnemyAI(config, line_of_sight)
\ No newline at end of file
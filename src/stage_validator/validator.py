@@ -5,16 +5,19 @@ from pathlib import Path
 
 from stage_generator.data_models import StageConfiguration
 from stage_validator.pathfinding import StagePathfinder, ActionType
-from stage_validator.validation_models import ValidationResult
+from stage_validator.validation_models import ValidationResult, PathfindingTimeoutError
 from stage_validator.solution_generator import SolutionCodeGenerator
 from stage_validator.patrol_validator import PatrolStageValidator, PatrolValidationResult
+from stage_validator.portfolio import PortfolioRunner
 
 
 class StageValidator:
     """Main validator for stage solvability and quality"""
 
-    def __init__(self, timeout_seconds: int = 60):
+    def __init__(self, timeout_seconds: int = 60, use_portfolio: bool = False):
         self.timeout_seconds = timeout_seconds
+        # Race several search strategies in worker processes instead of a single A*
+        self.use_portfolio = use_portfolio
 
     def validate_stage(self, stage: StageConfiguration, detailed: bool = False,
                       generate_solution: bool = False) -> ValidationResult:
@@ -51,14 +54,26 @@ class StageValidator:
             #     if patrol_result.success:
             #         return patrol_result
 
-            # Standard A* pathfinding validation with enhanced limits
-            pathfinder = StagePathfinder(stage)
+            validation_method = "enhanced_a_star_pathfinding"
+            if self.use_portfolio:
+                portfolio_result = PortfolioRunner(
+                    max_nodes=getattr(self, 'max_nodes', None),
+                    timeout_seconds=self.timeout_seconds
+                ).run(stage)
+                if portfolio_result.timed_out:
+                    raise PathfindingTimeoutError(f"No strategy finished within {self.timeout_seconds}s")
+                solution_path = portfolio_result.solution_path
+                if portfolio_result.winner:
+                    validation_method = f"portfolio:{portfolio_result.winner}"
+            else:
+                # Standard A* pathfinding validation with enhanced limits
+                pathfinder = StagePathfinder(stage)
 
-            # Set max_nodes if specified via command line
-            if hasattr(self, 'max_nodes'):
-                pathfinder.max_nodes = self.max_nodes
+                # Set max_nodes if specified via command line
+                if hasattr(self, 'max_nodes'):
+                    pathfinder.max_nodes = self.max_nodes
 
-            solution_path = pathfinder.find_path()  # No timeout parameter
+                solution_path = pathfinder.find_path(timeout_seconds=self.timeout_seconds)
 
             path_found = solution_path is not None
             solution_length = len(solution_path) if solution_path else 0
@@ -76,7 +91,7 @@ class StageValidator:
             detailed_analysis = None
             if detailed:
                 detailed_analysis = {
-                    "validation_method": "enhanced_a_star_pathfinding",
+                    "validation_method": validation_method,
                     "stage_type": self._infer_stage_type(stage),
                     "board_size": stage.board.size,
                     "api_count": len(stage.constraints.allowed_apis),
@@ -99,6 +114,18 @@ class StageValidator:
                 solution_code=solution_code
             )
 
+        except PathfindingTimeoutError as e:
+            return ValidationResult(
+                success=False,
+                stage_path="",
+                path_found=False,
+                required_apis=[],
+                solution_length=0,
+                error_details=f"Validation timed out: {str(e)}",
+                detailed_analysis=None,
+                solution_code=None
+            )
+
         except Exception as e:
             return ValidationResult(
                 success=False,
@@ -84,6 +84,16 @@ class TestValidateStageCLI:
         ], capture_output=True, text=True, cwd=Path(__file__).parent.parent.parent)
         assert result.returncode == 2  # argparse error
 
+    def test_timeout_below_minimum_rejected_for_batch(self):
+        """Test that --timeout is validated before batch validation starts"""
+        result = subprocess.run([
+            sys.executable, "scripts/validate_stage.py",
+            "--batch", "stages", "--timeout", "0"
+        ], capture_output=True, text=True, cwd=Path(__file__).parent.parent.parent)
+        assert result.returncode == 2
+        assert "Timeout must be at least 1 second" in result.stderr
+        assert "Validating" not in result.stderr
+
     def test_format_option(self):
         """Test --format option accepts text and json"""
         for format_type in ["text", "json"]:
@@ -215,6 +215,53 @@ def test_command_history():
     print("✅ 履歴クリア正常")
 
 
+def test_long_undo_history():
+    """長い実行でも取り消せる件数はちょうど max_depth 件で、圧縮済みの範囲まで取り消せる"""
+    player = Character(Position(1, 2), Direction.NORTH)
+    game_state = GameState(player=player, board=Board(5, 5, [], []), max_turns=10000)
+    invoker = CommandInvoker(max_depth=300)
+
+    poses = [(player.position, player.direction)]
+    commands = [TurnRightCommand, MoveCommand, TurnRightCommand, TurnRightCommand, MoveCommand, TurnRightCommand]
+    for i in range(1200):
+        result = invoker.execute_command(commands[i % len(commands)](), game_state)
+        assert result.is_success
+        poses.append((player.position, player.direction))
+
+    assert len(invoker.history) < 128
+    assert len(invoker.get_history()) == 300
+
+    undo_count = 0
+    while invoker.can_undo():
+        assert invoker.undo_last_command(game_state)
+        undo_count += 1
+        assert (player.position, player.direction) == poses[-1 - undo_count]
+
+    assert invoker.get_history() == []
+    assert undo_count == 300
+    assert not invoker.undo_last_command(game_state)
+
+    # 取り消し後の実行は以降の履歴をその場で切り詰める
+    invoker.execute_command(TurnLeftCommand(), game_state)
+    assert invoker.get_history()[-1] == "左に90度回転"
+
+
+def test_small_undo_depth_is_hard_limit():
+    """max_depth が圧縮単位より小さくても取り消せるのは max_depth 件まで"""
+    player = Character(Position(1, 2), Direction.NORTH)
+    game_state = GameState(player=player, board=Board(5, 5, [], []), max_turns=10000)
+    invoker = CommandInvoker(max_depth=10)
+
+    for _ in range(200):
+        invoker.execute_command(TurnRightCommand(), game_state)
+        assert len(invoker.get_history()) <= 10
+
+    undo_count = 0
+    while invoker.undo_last_command(game_state):
+        undo_count += 1
+    assert undo_count == 10
+
+
 def test_command_integration():
     """コマンド統合テスト"""
     print("🔗 コマンド統合テスト...")
@@ -8,7 +8,8 @@ from datetime import datetime
 from engine import (
     Direction, GameStatus, ItemType, EnemyType,
     Position, Character, Enemy, Item, Board,
-    GameState, Stage, LogEntry
+    GameState, Stage, LogEntry,
+    CELL_EMPTY, CELL_WALL, CELL_FORBIDDEN
 )
 
 class TestDirection:
@@ -185,6 +186,29 @@ class TestBoard:
         assert not board.is_passable(Position(1, 1))  # 壁
         assert not board.is_passable(Position(2, 2))  # 移動不可
         assert not board.is_passable(Position(3, 3))  # 範囲外
+    
+    def test_cell_grid(self):
+        """セル種別グリッドテスト"""
+        board = Board(
+            width=4,
+            height=2,
+            walls=[Position(1, 0), Position(3, 1)],
+            forbidden_cells=[Position(0, 1)]
+        )
+        
+        assert len(board.cell_grid) == 8
+        assert board.get_cell(Position(1, 0)) == CELL_WALL
+        assert board.get_cell(Position(0, 1)) == CELL_FORBIDDEN
+        assert board.get_cell(Position(2, 0)) == CELL_EMPTY
+        assert board.get_cell(Position(5, 5)) == CELL_EMPTY  # 範囲外
+        
+        # 構築済みグリッドを渡した場合はそのまま再利用される
+        shared = Board(4, 2, board.walls, board.forbidden_cells, cell_grid=board.cell_grid)
+        assert shared.cell_grid is board.cell_grid
+        assert shared.is_wall(Position(3, 1))
+        
+        # 従来のリストフィールドも引き続き参照可能
+        assert Position(1, 0) in shared.walls
 
 class TestGameState:
     """GameState クラスのテスト"""
@@ -227,7 +251,80 @@ class TestGameState:
         assert state.turn_count == 2
         assert state.status == GameStatus.TIMEOUT
         assert state.is_game_over()
-    
+
+    def test_spatial_lookup_follows_entities(self):
+        """座標照会は敵・アイテムの移動・削除に追従する"""
+        player = Character(Position(0, 0), Direction.NORTH)
+        large = Enemy(Position(1, 1), Direction.SOUTH, enemy_type=EnemyType.LARGE_2X2)
+        small = Enemy(Position(4, 4), Direction.WEST)
+        item = Item(id="key", item_type=ItemType.KEY, position=Position(0, 4))
+        state = GameState(player=player, enemies=[large, small], items=[item], board=Board(6, 6, [], []))
+
+        assert state.get_enemy_at(Position(2, 2)) is large
+        assert state.get_enemy_at(Position(4, 4)) is small
+        assert state.get_item_at(Position(0, 4)) is item
+
+        # 移動・削除は索引を作り直さずに旧座標の削除と新座標の登録だけで反映される
+        cells = state._spatial_index.enemies
+        state.move_enemy(large, Position(3, 0))
+        assert state.get_enemy_at(Position(1, 1)) is None
+        assert state.get_enemy_at(Position(4, 1)) is large
+
+        state.remove_enemy(small)
+        state.remove_item(item)
+        assert state.get_enemy_at(Position(4, 4)) is None
+        assert state.get_item_at(Position(0, 4)) is None
+        assert state._spatial_index.enemies is cells
+        assert small not in state.enemies and state.items == []
+
+        # 重なった敵は先に登録された方が返り、抜けると残りが繰り上がる
+        other = Enemy(Position(4, 1), Direction.NORTH)
+        state.enemies.append(other)  # リストの直接編集は次の照会で索引を作り直す
+        assert state.get_enemy_at(Position(4, 1)) is large
+        state.move_enemy(large, Position(0, 3))
+        assert state.get_enemy_at(Position(4, 1)) is other
+        assert state.get_enemy_at(Position(1, 4)) is large
+
+    def test_version_tracks_mutations(self):
+        """版数は移動・ダメージ・取得・ターン経過・状態変化で進み、状態ごとに独立している"""
+        player = Character(Position(0, 0), Direction.NORTH)
+        large = Enemy(Position(1, 1), Direction.SOUTH, enemy_type=EnemyType.LARGE_2X2)
+        item = Item(id="key", item_type=ItemType.KEY, position=Position(0, 4))
+        state = GameState(player=player, enemies=[large], items=[item], board=Board(6, 6, [], []))
+        other = GameState(player=Character(Position(5, 5), Direction.WEST), board=Board(6, 6, [], []))
+
+        version = state.version
+        state.get_enemy_at(Position(1, 1))  # 照会だけでは変化しない
+        player.hp = 90  # 属性の代入そのものには処理を挟まない
+        assert state.version == version
+
+        player_version = player.state_version
+        player.take_damage(10)
+        assert player.state_version > player_version
+
+        state.move_enemy(large, Position(3, 0))
+        assert state.version > version
+        assert large.state_version > 0
+
+        # 別の状態の変更は影響しない
+        version = state.version
+        other.increment_turn()
+        other.mark_changed(other.player)
+        assert state.version == version
+
+        state.remove_item(item)
+        assert state.version > version
+
+        version = state.version
+        state.increment_turn()
+        assert state.version > version
+
+        version = state.version
+        state.set_status(GameStatus.WON)
+        assert state.version > version
+        state.set_status(GameStatus.WON)  # 同じ状態への変更は版数を進めない
+        assert state.version == version + 1
+
     def test_goal_check(self):
         """ゴール判定テスト"""
         player = Character(Position(0, 0), Direction.NORTH)
@@ -46,6 +46,34 @@ def test_infinite_loop_detector():
         return False
 
 
+def test_infinite_loop_detector_incremental():
+    """逐次判定が直近の履歴だけで循環・高速実行を検出することのテスト"""
+    from engine.educational_feedback import InfiniteLoopDetector
+    from datetime import datetime, timedelta
+
+    base_time = datetime(2024, 1, 1)
+    detector = InfiniteLoopDetector()
+
+    # 長い非循環の履歴のあとでも、直近8件の2周期パターンで検出される
+    results = []
+    actions = ["move", "turn_left", "move", "move", "turn_right", "attack"] * 50 + ["move", "pickup"] * 3
+    for i, action in enumerate(actions):
+        results.append(detector.add_action(action, timestamp=base_time + timedelta(seconds=i)))
+
+    assert all(result is None for result in results[:-1])
+    assert results[-1] == {
+        'type': 'action_cycle', 'cycle_length': 2, 'pattern': ["move", "pickup"], 'confidence': 0.9
+    }
+
+    # 非循環でも間隔が短ければ高速実行として検出される
+    detector.reset()
+    actions = ["move", "turn_left", "move", "turn_right", "attack", "move", "pickup", "wait", "move", "dispose"]
+    for i, action in enumerate(actions):
+        result = detector.add_action(action, timestamp=base_time + timedelta(seconds=0.1 * i))
+    assert result['type'] == 'rapid_execution'
+    assert abs(result['average_interval'] - 0.1) < 1e-9
+
+
 def test_learning_pattern_analyzer():
     """学習パターン分析器テスト"""
     print("\n🧪 学習パターン分析器テスト")
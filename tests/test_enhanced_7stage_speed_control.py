@@ -15,7 +15,7 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from engine.enhanced_7stage_speed_control_manager import Enhanced7StageSpeedControlManager
-from engine.ultra_high_speed_controller import UltraHighSpeedController
+from engine.ultra_high_speed_controller import UltraHighSpeedController, AdaptiveSleepTimer
 from engine.enhanced_7stage_speed_errors import (
     Enhanced7StageSpeedControlError,
     InvalidSpeedMultiplierError,
@@ -26,6 +26,8 @@ from engine.enhanced_7stage_speed_errors import (
     SpeedDegradationError
 )
 from engine.speed_control_error_handler import SpeedControlErrorHandler
+from engine.execution_controller import ExecutionController
+from engine.api import APILayer
 
 
 class TestEnhanced7StageSpeedControlManager(unittest.TestCase):
@@ -189,6 +191,111 @@ class TestUltraHighSpeedController(unittest.TestCase):
             self.ultra_controller._handle_precision_failure(15.0, 5.0)
 
 
+class TestAdaptiveSleepTimer(unittest.TestCase):
+    """AdaptiveSleepTimer テストクラス"""
+    
+    def test_calibration_is_shared_per_process(self):
+        """較正はプロセス内で1回だけ行われる"""
+        first = AdaptiveSleepTimer()
+        second = AdaptiveSleepTimer()
+        self.assertIs(AdaptiveSleepTimer.calibrate(), AdaptiveSleepTimer.calibrate())
+        self.assertEqual(first.spin_margin, second.spin_margin)
+        self.assertGreaterEqual(first.spin_margin, AdaptiveSleepTimer.MIN_SPIN_MARGIN)
+        self.assertLessEqual(first.spin_margin, AdaptiveSleepTimer.MAX_SPIN_MARGIN)
+    
+    def test_sleep_spins_only_for_margin(self):
+        """間隔の大部分はOSスリープで待ち、スピンはジッタ幅に限られる"""
+        timer = AdaptiveSleepTimer()
+        for _ in range(10):
+            elapsed = timer.sleep(0.02)
+            self.assertGreaterEqual(elapsed, 0.02)
+        
+        stats = timer.get_stats()
+        self.assertEqual(stats['ticks'], 10)
+        self.assertLess(stats['cpu_time_per_tick_ms'], 10.0)
+        self.assertLessEqual(stats['spin_time_per_tick_ms'], AdaptiveSleepTimer.MAX_SPIN_MARGIN * 1000 + 1.0)
+    
+    def test_margin_ignores_single_outlier(self):
+        """単発の大きなオーバーシュートではスピン幅が広がらない"""
+        timer = AdaptiveSleepTimer()
+        for _ in range(AdaptiveSleepTimer.OVERSHOOT_WINDOW):
+            timer._observe_overshoot(0.0002)
+        timer._observe_overshoot(0.008)
+        self.assertAlmostEqual(timer.spin_margin, 0.0002)
+    
+    def test_performance_stats_expose_timer(self):
+        """性能統計にtick当たりCPU時間と精度が含まれる"""
+        ultra_controller = UltraHighSpeedController(Mock())
+        ultra_controller.ultra_precise_sleep(0.005, 5.0)
+        
+        timer_stats = ultra_controller.get_ultra_speed_performance_stats()['timer']
+        self.assertEqual(timer_stats['ticks'], 1)
+        for key in ('cpu_time_per_tick_ms', 'avg_deviation_ms', 'max_deviation_ms', 'spin_margin_ms'):
+            self.assertIn(key, timer_stats)
+
+
+class TestMaxSpeedMode(unittest.TestCase):
+    """最高速モードのテストクラス"""
+    
+    def setUp(self):
+        """テスト初期化"""
+        self.execution_controller = ExecutionController()
+        self.speed_manager = Enhanced7StageSpeedControlManager(self.execution_controller)
+        self.execution_controller.setup_7stage_speed_control(
+            self.speed_manager, UltraHighSpeedController(self.speed_manager)
+        )
+    
+    def test_max_speed_skips_action_wait(self):
+        """最高速モードではアクション間で待機しない"""
+        self.speed_manager.set_speed_multiplier(1)
+        self.assertTrue(self.speed_manager.set_max_speed_mode(True))
+        self.execution_controller.continuous_execution()
+        self.assertTrue(self.execution_controller.is_max_speed_running())
+        
+        start_time = time.perf_counter()
+        for _ in range(1000):
+            self.execution_controller.wait_for_action()
+        self.assertLess(time.perf_counter() - start_time, 1.0)
+    
+    def test_enabling_max_speed_wakes_interval_wait(self):
+        """待機中に最高速モードへ切り替えると、残りの間隔を待たずに進む"""
+        self.speed_manager.set_speed_multiplier(1)  # 2秒間隔
+        self.execution_controller.continuous_execution()
+        
+        waiter = threading.Thread(target=self.execution_controller.wait_for_action, daemon=True)
+        waiter.start()
+        waiter.join(0.05)
+        self.assertTrue(waiter.is_alive())
+        
+        self.speed_manager.set_max_speed_mode(True)
+        waiter.join(1.0)
+        self.assertFalse(waiter.is_alive())
+    
+    def test_selecting_multiplier_leaves_max_speed(self):
+        """倍率を選ぶと最高速モードは解除される"""
+        self.speed_manager.set_max_speed_mode(True)
+        self.speed_manager.set_speed_multiplier(5)
+        self.assertFalse(self.speed_manager.is_max_speed_mode())
+        self.assertFalse(self.execution_controller.max_speed_mode)
+        self.assertEqual(self.execution_controller.state.sleep_interval, 0.1)
+    
+    def test_solve_thread_does_not_render_at_max_speed(self):
+        """最高速モードの連続実行中はアクションごとの描画を行わない"""
+        api = APILayer(renderer_type="cui")
+        api.execution_controller = self.execution_controller
+        api.renderer = Mock()
+        api.game_manager = Mock()
+        
+        self.speed_manager.set_max_speed_mode(True)
+        self.execution_controller.continuous_execution()
+        api._render_current_state()
+        api.renderer.render_complete_view.assert_not_called()
+        
+        self.execution_controller.pause_execution()
+        api._render_current_state()
+        api.renderer.render_complete_view.assert_called_once()
+
+
 class TestSpeedControlErrorClasses(unittest.TestCase):
     """速度制御エラークラステスト"""
     
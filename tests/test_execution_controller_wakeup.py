@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+ExecutionController 待機・起床ハンドシェイクのテスト
+"""
+
+import threading
+import time
+
+import pytest
+
+from engine import ExecutionMode
+from engine.execution_controller import ExecutionController
+
+
+def _start_waiter(controller, results):
+    """wait_for_action()を呼ぶsolve()相当のスレッドを起動"""
+    def run():
+        try:
+            controller.wait_for_action()
+            results.append("allowed")
+        except RuntimeError:
+            results.append("stopped")
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return thread
+
+
+class TestExecutionControllerWakeup:
+    """状態変更通知による待機解除のテスト"""
+
+    def setup_method(self):
+        self.controller = ExecutionController()
+        self.controller.pause_before_solve()
+        self.results = []
+
+    def test_paused_waiter_blocks_until_step(self):
+        """一時停止中は待機し続け、Stepで即座に1アクションだけ許可される"""
+        thread = _start_waiter(self.controller, self.results)
+        thread.join(0.1)
+        assert thread.is_alive()
+        assert self.results == []
+
+        self.controller.step_execution()
+        thread.join(1.0)
+        assert not thread.is_alive()
+        assert self.results == ["allowed"]
+        assert self.controller.state.mode == ExecutionMode.PAUSED
+        assert self.controller.current_step_actions_allowed == 0
+
+        # 許可を使い切った後の呼び出しは再び待機する
+        thread = _start_waiter(self.controller, self.results)
+        thread.join(0.1)
+        assert thread.is_alive()
+        self.controller.stop_execution()
+        thread.join(1.0)
+        assert self.results == ["allowed", "stopped"]
+
+    def test_stop_wakes_paused_waiter(self):
+        """停止要求で待機中のsolve()スレッドが終了する"""
+        thread = _start_waiter(self.controller, self.results)
+        thread.join(0.05)
+        self.controller.stop_execution()
+        thread.join(1.0)
+        assert not thread.is_alive()
+        assert self.results == ["stopped"]
+
+    def test_pause_interrupts_continuous_sleep(self):
+        """連続実行の待機中に一時停止すると、間隔の満了を待たずに停止状態へ移る"""
+        self.controller.continuous_execution(sleep_interval=5.0)
+        thread = _start_waiter(self.controller, self.results)
+        thread.join(0.05)
+
+        started = time.monotonic()
+        self.controller.pause_execution()
+        thread.join(0.05)
+        assert thread.is_alive()  # 一時停止中なのでアクションは許可されない
+        assert self.results == []
+
+        self.controller.step_execution()
+        thread.join(1.0)
+        assert self.results == ["allowed"]
+        assert time.monotonic() - started < 1.0
+
+    def test_wait_does_not_recurse(self):
+        """待機と再チェックを繰り返しても再帰しない"""
+        thread = _start_waiter(self.controller, self.results)
+        for _ in range(200):
+            self.controller.pause_execution()
+        self.controller.step_execution()
+        thread.join(1.0)
+        assert self.results == ["allowed"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+ヘッドレス一括シミュレーションのテスト
+"""
+
+import pytest
+
+import engine.api as api
+from engine.headless import SimulationJob, run_solve, run_batch, load_solve
+
+STAGE01_SOLUTION = """
+from engine.api import turn_right, move
+
+def solve():
+    print("printed output is discarded")
+    turn_right()
+    for _ in range(4):
+        move()
+    turn_right()
+    for _ in range(4):
+        move()
+"""
+
+SWALLOWING_LOOP = """
+from engine.api import turn_left
+
+def solve():
+    while True:
+        try:
+            turn_left()
+        except Exception:
+            pass
+"""
+
+
+class TestRunSolve:
+    """run_solve()のテスト"""
+
+    def test_source_solution_wins(self):
+        """ソースコードのsolve()を実行してクリアできる"""
+        result = run_solve("stage01", STAGE01_SOLUTION)
+
+        assert result.is_success
+        assert result.error is None
+        assert result.turn_count == 10
+        assert [a["api"] for a in result.actions[:2]] == ["turn_right", "move"]
+        assert result.game_state.player.position.x == 4
+        assert result.game_state.player.position.y == 4
+
+    def test_callable_and_global_api_restored(self):
+        """関数を直接渡せて、実行後にグローバルAPIが元に戻る"""
+        previous = api._global_api
+        result = run_solve("stage01", lambda: api.move())
+
+        assert result.status == "playing"
+        assert len(result.actions) == 1
+        assert api._global_api is previous
+
+    def test_disallowed_api_is_not_executed(self):
+        """ステージで許可されていないAPIは実行されない"""
+        result = run_solve("stage01", lambda: api.attack())
+
+        assert result.actions == []
+        assert result.error is None
+
+    def test_action_budget(self):
+        """例外を握りつぶすループもアクション数上限で停止する"""
+        result = run_solve("stage01", SWALLOWING_LOOP, max_actions=30)
+
+        assert result.budget_exceeded
+        assert result.status == "timeout"  # max_turns=20 到達後も呼び続けた
+
+    def test_time_budget(self):
+        """API呼び出しのないループも時間上限で停止する"""
+        result = run_solve("stage01", "def solve():\n    while True:\n        pass\n", time_limit=0.2)
+
+        assert result.budget_exceeded
+        assert result.elapsed < 5
+
+    def test_solve_errors_are_reported(self):
+        """solve()の例外・未定義は結果のerrorに記録される"""
+        result = run_solve("stage01", "def solve():\n    raise RuntimeError('boom')\n")
+        assert result.error == "RuntimeError: boom"
+
+        with pytest.raises(ValueError):
+            load_solve("x = 1\n")
+
+    def test_engine_errors_do_not_abort_solve(self):
+        """アクション中のエンジンの例外は記録され、solve()の実行は続く"""
+        def solve():
+            player = api._global_api.game_manager.current_state.player
+            position = player.position
+            player.position = None
+            api.move()
+            player.position = position
+            api.turn_right()
+
+        result = run_solve("stage01", solve)
+
+        assert result.error.startswith("move: ")
+        assert result.engine_errors == [result.error]
+        assert [(a["api"], a["success"]) for a in result.actions] == [("move", False), ("turn_right", True)]
+        assert result.turn_count == 1
+
+    def test_unknown_stage(self):
+        """存在しないステージはエラー結果になる"""
+        result = run_solve("stage_missing", STAGE01_SOLUTION)
+
+        assert result.status == "error"
+        assert result.game_state is None
+
+
+def test_run_batch_keeps_order():
+    """プロセスプールでの実行結果が投入順に並ぶ"""
+    jobs = [
+        SimulationJob("stage01", STAGE01_SOLUTION, submission_id="ok"),
+        SimulationJob("stage01", SWALLOWING_LOOP, submission_id="loop"),
+        SimulationJob("stage01", "def solve():\n    pass\n", submission_id="empty"),
+    ]
+    results = run_batch(jobs, workers=2, max_actions=50, time_limit=10, include_state=False)
+
+    assert [r.submission_id for r in results] == ["ok", "loop", "empty"]
+    assert [r.status for r in results] == ["won", "timeout", "playing"]
+    assert results[1].budget_exceeded
+    assert all(r.game_state is None for r in results)
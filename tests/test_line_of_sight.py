@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+視線判定キャッシュのテスト
+"""
+
+import pytest
+from engine import Board, Enemy, Position, Direction
+from engine.line_of_sight import LineOfSightCache, trace_line_of_sight, get_board_cache
+from src.stage_validator import create_standard_enemy_ai
+from src.stage_validator.models import EnemyState
+
+
+WALLS = [Position(2, 1), Position(2, 2), Position(4, 4)]
+
+
+@pytest.fixture
+def board():
+    return Board(width=7, height=7, walls=list(WALLS), forbidden_cells=[])
+
+
+class TestLineOfSightCache:
+    """LineOfSightCacheのテスト"""
+
+    def test_wall_blocks_sight(self):
+        """中間マスの壁は視線を遮り、終点の壁は遮らない"""
+        walls = {(2, 1)}
+        assert not trace_line_of_sight(0, 1, 4, 1, walls)
+        assert trace_line_of_sight(0, 1, 2, 1, walls)
+        assert trace_line_of_sight(0, 0, 4, 0, walls)
+
+    def test_results_are_memoized(self):
+        """同じ (起点, 終点) の2回目はキャッシュから返す"""
+        cache = LineOfSightCache([(2, 1)])
+        assert cache.has_line_of_sight(0, 1, 4, 1) is False
+        assert cache.has_line_of_sight(0, 1, 4, 1) is False
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_cache_is_bounded(self):
+        """上限を超えると古いエントリから破棄される"""
+        cache = LineOfSightCache([], max_entries=2)
+        cache.has_line_of_sight(0, 0, 1, 0)
+        cache.has_line_of_sight(0, 0, 2, 0)
+        cache.has_line_of_sight(0, 0, 3, 0)
+        assert len(cache) == 2
+
+        cache.has_line_of_sight(0, 0, 1, 0)
+        assert cache.misses == 4
+
+
+class TestBoardCache:
+    """ボード単位のキャッシュのテスト"""
+
+    def test_cache_lives_on_board(self, board):
+        """同じボードではキャッシュを共有し、ボードを差し替えると作り直される"""
+        cache = get_board_cache(board)
+        assert get_board_cache(board) is cache
+
+        replaced = Board(width=7, height=7, walls=list(WALLS), forbidden_cells=[])
+        assert get_board_cache(replaced) is not cache
+        assert replaced == board
+
+    def test_enemy_vision_respects_walls(self, board):
+        """敵の視界は壁の向こうを含まない"""
+        enemy = Enemy(position=Position(0, 1), direction=Direction.EAST, vision_range=4)
+        cells = enemy.get_vision_cells(board)
+
+        assert Position(1, 1) in cells
+        assert Position(3, 1) not in cells
+        assert Position(3, 0) in cells
+        assert get_board_cache(board).misses == len(get_board_cache(board))
+
+
+class TestVisionCone:
+    """視野範囲キャッシュのテスト"""
+
+    def test_cone_is_cached_per_pose(self, board):
+        """同じ位置・向き・視野範囲では同じ視野を再利用し、向きが変わると別の視野になる"""
+        enemy = Enemy(position=Position(3, 3), direction=Direction.NORTH, vision_range=2)
+        cone = enemy.get_vision_cone(board)
+        assert enemy.get_vision_cone(board) is cone
+        assert enemy.get_vision_cells(board) == list(cone.cells)
+
+        enemy.direction = Direction.SOUTH
+        assert enemy.get_vision_cone(board) is not cone
+
+    def test_detection_matches_vision_cells(self, board):
+        """can_see_playerはget_vision_cellsと同じ判定になる"""
+        enemy = Enemy(position=Position(0, 1), direction=Direction.EAST, vision_range=4)
+        cells = enemy.get_vision_cells(board)
+        for x in range(board.width):
+            for y in range(board.height):
+                pos = Position(x, y)
+                assert enemy.can_see_player(pos, board) == (pos in cells)
+
+    def test_board_replacement_drops_cones(self, board):
+        """ボードを差し替えると視野も壁に合わせて作り直される"""
+        enemy = Enemy(position=Position(0, 1), direction=Direction.EAST, vision_range=4)
+        assert Position(3, 1) not in enemy.get_vision_cone(board).cell_set
+
+        open_board = Board(width=7, height=7, walls=[], forbidden_cells=[])
+        assert Position(3, 1) in enemy.get_vision_cone(open_board).cell_set
+
+
+class TestStandardEnemyAI:
+    """検証側の敵AIの視線判定テスト"""
+
+    def test_factory_wires_walls_into_detection(self):
+        """ファクトリーに渡した壁がプレイヤー発見判定の視線を遮る"""
+        enemy = EnemyState(enemy_id="guard", position=(0, 1), direction="right", patrol_index=0,
+                           alert_state="patrol", vision_range=4, health=1, enemy_type="static")
+        ai = create_standard_enemy_ai(walls=[[2, 1]])
+
+        assert not ai.check_player_detection(enemy, (4, 1))
+        assert ai.check_player_detection(enemy, (2, 1))
+        assert create_standard_enemy_ai().check_player_detection(enemy, (4, 1))
+
+        shared = LineOfSightCache([(2, 1)])
+        assert create_standard_enemy_ai(line_of_sight=shared).line_of_sight is shared
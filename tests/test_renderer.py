@@ -380,6 +380,95 @@ def test_large_enemy_rendering():
     print("✅ 大型敵レンダリング正常")
 
 
+class _TtyOutput(io.StringIO):
+    """端末として振る舞う出力先"""
+    def isatty(self):
+        return True
+
+
+def test_terminal_diff_output():
+    """端末への出力は2回目以降、変化したセルだけを書き換える"""
+    print("🖥️ 差分出力テスト...")
+    
+    from unittest.mock import patch
+    import os
+    
+    renderer = CuiRenderer()
+    renderer.initialize(3, 3)
+    renderer.display_tick = 0  # 描画ごとに書き込む
+    player = Character(Position(0, 1), Direction.EAST)
+    state = GameState(player=player, enemies=[], items=[], board=Board(3, 3, [Position(0, 0)], []))
+    
+    with patch.dict(os.environ, {"ROGUELIKE_CUI_DIFF": "1"}), \
+            patch("engine.renderer.shutil.get_terminal_size", return_value=os.terminal_size((80, 24))), \
+            redirect_stdout(_TtyOutput()) as f:
+        renderer.render_frame(state)
+        renderer.update_display()
+        first = f.getvalue()
+        
+        # 変化がなければ何も出力しない
+        renderer.render_frame(state)
+        renderer.update_display()
+        assert f.getvalue() == first
+        
+        player.position = Position(1, 1)
+        renderer.render_frame(state)
+        renderer.update_display()
+        diff = f.getvalue()[len(first):]
+    
+    assert "| # . . |" in first
+    assert "\x1b[6;24r" in first  # 盤面の下をスクロール領域にする
+    # 2行目の1・2列目のセルだけを書き換える
+    assert diff == "\x1b7\x1b[3;3H.\x1b[3;5HP\x1b8"
+    
+    print("✅ 差分出力正常")
+
+
+def test_terminal_diff_coalescing():
+    """表示間隔内の複数回の描画は最後のフレームだけを1回で書き込む"""
+    print("⏱️ 差分出力の間引きテスト...")
+    
+    from unittest.mock import patch
+    import os
+    
+    renderer = CuiRenderer()
+    renderer.initialize(3, 3)
+    renderer.display_tick = 60  # テスト中にタイマーが発火しないよう長くする
+    player = Character(Position(0, 1), Direction.EAST)
+    state = GameState(player=player, enemies=[], items=[], board=Board(3, 3, [Position(0, 0)], []))
+    
+    with patch.dict(os.environ, {"ROGUELIKE_CUI_DIFF": "1"}), \
+            patch("engine.renderer.shutil.get_terminal_size", return_value=os.terminal_size((80, 24))), \
+            redirect_stdout(_TtyOutput()) as f:
+        renderer.render_frame(state)
+        renderer.update_display()
+        first = f.getvalue()
+        
+        # 間隔内の描画は書き込まずに保留する
+        player.position = Position(1, 1)
+        renderer.render_frame(state)
+        renderer.update_display()
+        player.position = Position(2, 1)
+        renderer.render_frame(state)
+        renderer.update_display()
+        assert f.getvalue() == first
+        
+        renderer.flush_display()
+        diff = f.getvalue()[len(first):]
+        
+        # 全体出力に切り替えるとスクロール領域を解除する
+        with patch.dict(os.environ, {"ROGUELIKE_CUI_DIFF": "0"}):
+            renderer.update_display()
+        full = f.getvalue()[len(first) + len(diff):]
+    
+    # 中間のフレームは書き込まず、最後のフレームとの差分だけを1回で書き込む
+    assert diff == "\x1b7\x1b[3;3H.\x1b[3;7HP\x1b8"
+    assert full.startswith("\x1b[r\x1b[24;1H")
+    assert renderer._flush_timer is None
+    
+    print("✅ 差分出力の間引き正常")
+
+
 def test_integration():
     """統合テスト"""
     print("🔗 レンダラー統合テスト...")
@@ -453,6 +542,8 @@ def main():
         test_complete_view_rendering()
         test_renderer_factory()
         test_large_enemy_rendering()
+        test_terminal_diff_output()
+        test_terminal_diff_coalescing()
         test_integration()
         
         print("\n🎉 全てのレンダラーテストが完了！")
@@ -10,7 +10,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from unittest.mock import Mock, patch
 from engine import Enemy, EnemyType, EnemyMode, Position, Direction, GameState, Board, Character
-from engine.renderer import GuiRenderer
+from engine.renderer import GuiRenderer, TextSurfaceCache
 
 class TestEnemyModeVisualization:
     """敵モード別視覚化テスト"""
@@ -154,5 +154,158 @@ class TestEnemyInfoPanelExtensions:
                     display_name = renderer._get_enemy_mode_display(enemy)
                     assert display_name == expected_display, f"モード {mode} の表示名が正しくない: {display_name}"
 
+class TestViewport:
+    """大きな盤面のビューポートのテスト"""
+    
+    def test_camera_follows_player_within_board(self):
+        """ビューポートより大きい盤面ではプレイヤーに追従し、盤面外は表示しない"""
+        with patch('engine.renderer.PYGAME_AVAILABLE', True):
+            with patch('engine.renderer.pygame'):
+                renderer = GuiRenderer()
+                renderer.initialize(100, 80)
+        
+        assert renderer.uses_viewport
+        assert (renderer.viewport_width, renderer.viewport_height) == (30, 20)
+        
+        renderer._update_camera(Position(1, 1))
+        assert renderer.camera == (0, 0)
+        
+        renderer._update_camera(Position(50, 40))
+        assert renderer._is_visible(Position(50, 40))
+        assert not renderer._is_visible(Position(0, 0))
+        
+        renderer._update_camera(Position(99, 79))
+        assert renderer.camera == (70, 60)
+    
+    def test_small_board_uses_whole_board(self):
+        """ビューポートに収まる盤面は従来どおり全体を描画"""
+        with patch('engine.renderer.PYGAME_AVAILABLE', True):
+            with patch('engine.renderer.pygame'):
+                renderer = GuiRenderer()
+                renderer.initialize(10, 8)
+        
+        assert not renderer.uses_viewport
+        renderer._update_camera(Position(9, 7))
+        assert renderer.camera == (0, 0)
+
+class TestTextSurfaceCache:
+    """テキストサーフェスキャッシュのテスト"""
+    
+    def test_reuses_and_evicts_surfaces(self):
+        """同じフォント・文字列・色は再描画せず、上限を超えると古いものから破棄される"""
+        font = Mock()
+        font.render.side_effect = lambda text, antialias, color: (text, color)
+        cache = TextSurfaceCache(max_entries=2)
+        
+        assert cache.render(font, "HP: 50", (0, 0, 0)) == ("HP: 50", (0, 0, 0))
+        assert cache.render(font, "HP: 50", (0, 0, 0)) == ("HP: 50", (0, 0, 0))
+        assert font.render.call_count == 1
+        
+        # 色が違えば別のサーフェス
+        cache.render(font, "HP: 50", (255, 0, 0))
+        assert font.render.call_count == 2
+        
+        # 最近使っていない組み合わせから破棄される
+        cache.render(font, "HP: 40", (0, 0, 0))
+        assert len(cache) == 2
+        cache.render(font, "HP: 50", (0, 0, 0))
+        assert font.render.call_count == 4
+
+class TestGameAreaLayerCache:
+    """ゲームエリアのレイヤーキャッシュと部分転送のテスト"""
+    
+    def setup_method(self):
+        """pygameをモックし、矩形計算だけ実物のRectを使う"""
+        real_pygame = pytest.importorskip("pygame")
+        self.pygame_patchers = [patch('engine.renderer.PYGAME_AVAILABLE', True), patch('engine.renderer.pygame')]
+        self.pygame_patchers[0].start()
+        self.pygame = self.pygame_patchers[1].start()
+        self.pygame.Rect = real_pygame.Rect
+        self.expose_event = real_pygame.WINDOWEXPOSED
+        
+        self.renderer = GuiRenderer()
+        self.renderer.initialize(10, 10)
+        self.renderer.screen = Mock()
+        self.renderer.screen.get_rect.return_value = real_pygame.Rect(0, 0, 1000, 800)
+        self.renderer._compose_game_area = Mock(side_effect=lambda game_state: Mock())
+        self.state = GameState(player=Character(Position(0, 0), Direction.EAST), enemies=[], items=[],
+                               board=Board(10, 10, [Position(5, 5)], []))
+    
+    def teardown_method(self):
+        for patcher in reversed(self.pygame_patchers):
+            patcher.stop()
+    
+    def test_layer_reused_until_state_or_toggle_changes(self):
+        """版数・表示設定が変わらない間はゲームエリアを描き直さない"""
+        self.renderer._draw_game_area(self.state)
+        self.renderer._draw_game_area(self.state)
+        assert self.renderer._compose_game_area.call_count == 1
+        
+        self.state.mark_changed()
+        self.renderer._draw_game_area(self.state)
+        assert self.renderer._compose_game_area.call_count == 2
+        
+        self.renderer.show_enemy_vision = not self.renderer.show_enemy_vision
+        self.renderer._draw_game_area(self.state)
+        self.renderer._draw_game_area(self.state)
+        assert self.renderer._compose_game_area.call_count == 3
+    
+    def test_terrain_layer_cached_per_board(self):
+        """地形レイヤーは状態が変わっても同じボード・表示設定なら描き直さない"""
+        with patch.object(self.renderer, '_draw_cell') as draw_cell:
+            self.renderer._get_terrain_layer(self.state)
+            assert draw_cell.call_count == 100
+            
+            self.state.mark_changed()
+            self.renderer._get_terrain_layer(self.state)
+            assert draw_cell.call_count == 100
+            
+            self.renderer.show_grid = not self.renderer.show_grid
+            self.renderer._get_terrain_layer(self.state)
+            assert draw_cell.call_count == 200
+    
+    def test_dirty_rects_skip_clean_game_area(self):
+        """ゲームエリアが変化していなければ周囲のパネルだけを転送する"""
+        screen_rect = self.renderer.screen.get_rect()
+        self.renderer._draw_game_area(self.state)
+        assert self.renderer._collect_dirty_rects() == [screen_rect]
+        self.renderer.update_display()
+        
+        self.renderer._draw_game_area(self.state)
+        strips = self.renderer._collect_dirty_rects()
+        area = self.renderer._game_area_rect
+        assert strips
+        assert not any(rect.colliderect(area) for rect in strips)
+        assert sum(rect.width * rect.height for rect in strips) == \
+            screen_rect.width * screen_rect.height - area.width * area.height
+        
+        self.state.mark_changed()
+        self.renderer._draw_game_area(self.state)
+        assert self.renderer._collect_dirty_rects() == [screen_rect]
+    
+    def test_expose_event_forces_full_flip(self):
+        """ウィンドウ再表示イベントの後は部分転送中でも画面全体を転送する"""
+        self.renderer.update_display()
+        self.renderer._draw_game_area(self.state)
+        self.renderer._dirty_rects = self.renderer._collect_dirty_rects()
+        self.pygame.display.reset_mock()
+        self.renderer.update_display()
+        self.pygame.display.update.assert_called_once()
+        self.pygame.display.flip.assert_not_called()
+        
+        engine = Mock()
+        engine.process_mouse_events.return_value = []
+        engine.handle_keyboard_shortcuts.return_value = []
+        engine.ensure_event_priority.return_value = []
+        self.renderer.event_processing_engine = engine
+        self.pygame.event.get.return_value = [Mock(type=self.expose_event)]
+        self.renderer._handle_events()
+        
+        self.renderer._dirty_rects = self.renderer._collect_dirty_rects()
+        self.pygame.display.reset_mock()
+        self.renderer.update_display()
+        self.pygame.display.flip.assert_called_once()
+        self.pygame.display.update.assert_not_called()
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
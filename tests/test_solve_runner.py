@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+CooperativeSolveRunner（協調スケジューラによるsolve()実行）のテスト
+"""
+
+import threading
+import time
+
+import pytest
+
+from engine import ExecutionMode
+from engine.execution_controller import ExecutionController
+from engine.solve_runner import CooperativeSolveRunner, SolveInterrupted
+
+
+class ScriptedPump:
+    """フレームごとに予定された操作を実行するGUIフレームの代替"""
+
+    def __init__(self, controller, script):
+        self.controller = controller
+        self.script = dict(script)
+        self.frames = 0
+
+    def __call__(self):
+        self.frames += 1
+        action = self.script.pop(self.frames, None)
+        if action:
+            action(self.controller)
+
+
+def _make_solve(controller, actions, log):
+    """API呼び出し相当（wait_for_action）をactions回行うsolve()"""
+    def solve():
+        for i in range(actions):
+            controller.wait_for_action()
+            log.append(i)
+    return solve
+
+
+class TestCooperativeSolveRunner:
+    """協調実行のテスト"""
+
+    def setup_method(self):
+        self.controller = ExecutionController()
+        self.controller.pause_before_solve()
+        self.log = []
+
+    def _runner(self, script, frame_interval=0.0):
+        pump = ScriptedPump(self.controller, script)
+        return CooperativeSolveRunner(self.controller, pump, frame_interval=frame_interval), pump
+
+    def test_steps_run_on_calling_thread(self):
+        """Stepごとに1アクションずつ、スレッドを作らずに実行される"""
+        script = {3: lambda c: c.step_execution(), 6: lambda c: c.step_execution(),
+                  9: lambda c: c.step_execution()}
+        runner, pump = self._runner(script)
+        threads_before = threading.active_count()
+
+        self.controller.step_execution()
+        runner.run(_make_solve(self.controller, 4, self.log))
+
+        assert self.log == [0, 1, 2, 3]
+        assert pump.frames >= 9
+        assert threading.active_count() == threads_before
+        assert not runner.is_running
+
+    def test_reset_unwinds_solve_immediately(self):
+        """Resetで実行中のsolve()がスレッド待機なしに打ち切られる"""
+        reset_times = []
+
+        def reset(controller):
+            reset_times.append(time.perf_counter())
+            controller.full_system_reset()
+
+        runner, _ = self._runner({2: reset})
+        self.controller.step_execution()
+
+        with pytest.raises(SolveInterrupted):
+            runner.run(_make_solve(self.controller, 10, self.log))
+        elapsed = time.perf_counter() - reset_times[0]
+
+        assert self.log == [0]
+        assert elapsed < 0.5
+        assert self.controller.state.mode == ExecutionMode.PAUSED
+        assert not self.controller.stop_requested.is_set()
+
+    def test_continuous_pumps_frames_between_actions(self):
+        """連続実行中もフレーム処理が行われ、一時停止が反映される"""
+        script = {5: lambda c: c.pause_execution(), 8: lambda c: c.stop_execution()}
+        runner, pump = self._runner(script)
+        self.controller.continuous_execution(sleep_interval=0.001)
+        self.controller.set_max_speed_mode(True)
+
+        with pytest.raises(SolveInterrupted):
+            runner.run(_make_solve(self.controller, 10 ** 6, self.log))
+
+        assert 0 < len(self.log) < 10 ** 6
+        assert pump.frames == 8
+
+    def test_solve_context_is_explicit(self):
+        """solve()実行中かどうかはスレッド名ではなく実行コンテキストで判定される"""
+        seen = []
+        runner, _ = self._runner({})
+        assert not self.controller.is_in_solve_context()
+        runner.run(lambda: seen.append(self.controller.is_in_solve_context()))
+        assert seen == [True]
+        assert not self.controller.is_in_solve_context()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+ディスク退避付き履歴バッファのテスト
+"""
+
+import copy
+import pickle
+
+import pytest
+from engine.spilling_history import SpillingHistory, CHECKPOINT_INTERVAL
+
+
+def _entries(count):
+    return [{"api": "move", "success": i % 3 != 0, "message": f"移動 {i}", "turn": i} for i in range(count)]
+
+
+class TestSpillingHistory:
+    """SpillingHistoryのテスト"""
+
+    def test_memory_is_bounded(self):
+        """上限を超えた古い要素はディスクへ退避される"""
+        history = SpillingHistory(capacity=10)
+        history.extend(_entries(25))
+
+        assert len(history) == 25
+        assert history.spilled_count == 15
+        assert len(history._recent) == 10
+
+    def test_reads_across_memory_and_disk(self):
+        """インデックス・スライス・反復はメモリとディスクを透過的に参照する"""
+        entries = _entries(CHECKPOINT_INTERVAL * 2 + 37)
+        history = SpillingHistory(capacity=50, entries=entries)
+
+        assert list(history) == entries
+        assert history.copy() == entries
+        assert history[0] == entries[0]
+        assert history[CHECKPOINT_INTERVAL + 5] == entries[CHECKPOINT_INTERVAL + 5]
+        assert history[-1] == entries[-1]
+        assert history[-60:] == entries[-60:]
+        assert history[3:600:7] == entries[3:600:7]
+        assert history[::-1] == entries[::-1]
+        with pytest.raises(IndexError):
+            history[len(entries)]
+
+    def test_clear_and_reuse(self):
+        """clear後は空になり、再び追加できる"""
+        history = SpillingHistory(capacity=3, entries=_entries(10))
+        history.clear()
+
+        assert len(history) == 0
+        assert not history
+        history.append({"api": "wait"})
+        assert history[-1] == {"api": "wait"}
+
+    def test_copy_and_pickle_keep_entries(self):
+        """deepcopy・pickleでは全要素を持つ履歴として復元される"""
+        entries = [f"move: 成功 {i}" for i in range(20)]
+        history = SpillingHistory(capacity=4, entries=entries)
+
+        for restored in (copy.deepcopy(history), pickle.loads(pickle.dumps(history))):
+            assert isinstance(restored, SpillingHistory)
+            assert restored.capacity == 4
+            assert restored == entries
@@ -11,7 +11,7 @@ from pathlib import Path
 sys.path.append('..')
 
 from engine.stage_loader import StageLoader, StageValidationError
-from engine import Position, Direction, Stage
+from engine import Position, Direction, Stage, CELL_WALL, CELL_FORBIDDEN
 
 
 def test_load_basic_stage():
@@ -59,6 +59,18 @@ def test_load_basic_stage():
     print("✅ Stage03読み込み成功")
 
 
+def test_cell_grid_built_at_load():
+    """ステージ読み込み時のセル種別グリッド構築テスト"""
+    loader = StageLoader("stages")
+    stage = loader.load_stage("stage03")
+    
+    width, height = stage.board_size
+    assert len(stage.cell_grid) == width * height
+    assert stage.cell_grid[2 * width + 2] == CELL_FORBIDDEN
+    for wall in stage.walls:
+        assert stage.cell_grid[wall.y * width + wall.x] == CELL_WALL
+
+
 def test_stage_validation():
     """ステージバリデーションテスト"""
     print("✅ ステージバリデーションテスト...")
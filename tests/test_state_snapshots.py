@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+差分スナップショット（StateTimeline）のテスト
+"""
+
+from engine import (
+    Position, Direction, Character, Enemy, Item, Board, GameState,
+    ItemType, EnemyType, GameStatus
+)
+from engine.state_snapshots import StateTimeline
+from engine.game_state import GameStateManager
+from engine.commands import TurnLeftCommand, MoveCommand
+
+
+def create_test_state():
+    """テスト用のゲーム状態を作成"""
+    player = Character(Position(0, 0), Direction.EAST)
+    enemies = [Enemy(Position(4, 4), Direction.WEST, hp=30), Enemy(Position(1, 3), Direction.NORTH),
+               Enemy(Position(6, 1), Direction.SOUTH, enemy_type=EnemyType.LARGE_2X2)]
+    items = [Item(id="key", item_type=ItemType.KEY, position=Position(2, 0))]
+    return GameState(player=player, enemies=enemies, items=items, board=Board(8, 8, [], []))
+
+
+class TestStateTimeline:
+    """StateTimelineのテスト"""
+
+    def test_record_stores_only_changed_entities(self):
+        """スナップショットには変化したエンティティだけが記録される"""
+        state = create_test_state()
+        timeline = StateTimeline(state)
+        assert len(timeline.snapshots[0].changed) == 5
+
+        state.turn_count = 1
+        state.move_enemy(state.enemies[0], Position(3, 4))
+        snapshot = timeline.record(state)
+        assert snapshot.changed == (state.enemies[0],)
+        # 構成が変わらない敵・アイテムの列は前回と共有される
+        assert snapshot.enemies is timeline.snapshots[0].enemies
+        assert snapshot.items is timeline.snapshots[0].items
+
+        state.turn_count = 2
+        assert timeline.record(state).changed == ()
+
+    def test_record_skips_unmarked_entities(self):
+        """版数が進んでいないエンティティは属性を記録し直さない"""
+        state = create_test_state()
+        timeline = StateTimeline(state)
+        enemy = state.enemies[1]
+
+        state.player.stamina -= 1  # 版数を進めない変更は差分にならない
+        assert timeline.record(state).changed == ()
+
+        state.mark_changed(state.player, enemy)
+        assert timeline.record(state).changed == (state.player, enemy)
+
+    def test_rewind_restores_entities_and_membership(self):
+        """任意の過去ターンへ戻すと属性・敵/アイテムの構成・ターン数が復元される"""
+        state = create_test_state()
+        player, enemy, _, large = state.player, *state.enemies
+        key = state.items[0]
+        timeline = StateTimeline(state)
+
+        # ターン1: 移動してアイテム取得、敵にダメージ
+        state.turn_count = 1
+        player.position = Position(2, 0)
+        player.collected_items.append("key")
+        state.mark_changed(player)
+        state.remove_item(key)
+        enemy.take_damage(20)
+        enemy.stage11_state = "rage_countdown_3"
+        timeline.record(state)
+
+        # ターン2: 敵を倒し、大型敵が怒る
+        state.turn_count = 2
+        state.remove_enemy(enemy)
+        large.rage_state.is_active = True
+        state.mark_changed(large)
+        state.set_status(GameStatus.FAILED)
+        timeline.record(state)
+
+        timeline.rewind_to_turn(state, 1)
+        assert len(timeline) == 2
+        assert state.turn_count == 1
+        assert state.status == GameStatus.PLAYING
+        assert state.enemies[0] is enemy and enemy.hp == 10
+        assert not large.rage_state.is_active
+        assert state.get_enemy_at(Position(4, 4)) is enemy
+
+        timeline.rewind(state, 0)
+        assert player.position == Position(0, 0)
+        assert player.collected_items == []
+        assert state.items == [key]
+        assert state.get_item_at(Position(2, 0)) is key
+        assert enemy.hp == 30
+        assert not hasattr(enemy, "stage11_state")
+
+        # 記録の値は以降の変更から独立している
+        player.collected_items.append("other")
+        state.mark_changed(player)
+        timeline.rewind(state, 0)
+        assert player.collected_items == []
+
+
+def test_manager_undo_and_rewind():
+    """GameStateManagerの取り消し・巻き戻しはスナップショットから状態を復元する"""
+    manager = GameStateManager()
+    enemy = Enemy(Position(4, 0), Direction.WEST, hp=30)
+    state = manager.initialize_game(
+        player_start=Position(1, 4),
+        player_direction=Direction.NORTH,
+        board=Board(5, 5, [], []),
+        enemies=[enemy],
+        player_stamina=10
+    )
+
+    for command in (MoveCommand, TurnLeftCommand, MoveCommand):
+        manager.execute_command(command())
+    assert state.turn_count == 3
+
+    # 最後の記録後に変更された敵の状態も取り消しで直前のターンの値に戻る
+    enemy.take_damage(25)
+    assert manager.undo_last_action()
+    assert state.turn_count == 2
+    assert state.player.position == Position(1, 3)
+    assert state.player.direction == Direction.WEST
+    assert enemy.hp == 30
+
+    assert manager.rewind_to_turn(0)
+    assert state.player.position == Position(1, 4)
+    assert state.player.stamina == 10
+    assert not manager.can_undo_last_action()
+
+    manager.execute_command(MoveCommand())
+    assert manager.reset_game()
+    assert manager.get_current_state() is state
+    assert state.turn_count == 0
+    assert state.player.position == Position(1, 4)
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+ターン処理トレースシステムのテスト
+"""
+
+import pytest
+from engine.trace import TraceRegistry, DEBUG, INFO, WARNING, OFF
+
+
+class _Lazy:
+    """整形されたかどうかを記録する引数"""
+
+    def __init__(self):
+        self.formatted = 0
+
+    def __str__(self):
+        self.formatted += 1
+        return "lazy"
+
+
+@pytest.fixture
+def registry():
+    registry = TraceRegistry()
+    registry.lines = []
+    registry.set_sink(registry.lines.append)
+    return registry
+
+
+class TestTracer:
+    """Tracerのテスト"""
+
+    def test_default_level_is_quiet(self, registry):
+        """既定ではDEBUG/INFOは出力されない"""
+        tracer = registry.get_tracer("engine.game_state")
+        tracer.debug("debug %s", 1)
+        tracer.info("info %s", 2)
+        tracer.warning("warning %s", 3)
+
+        assert registry.lines == ["warning 3"]
+
+    def test_disabled_trace_does_not_format(self, registry):
+        """無効なレベルでは引数が整形されない"""
+        tracer = registry.get_tracer("engine.game_state")
+        arg = _Lazy()
+        tracer.debug("value=%s", arg)
+
+        assert arg.formatted == 0
+        assert not tracer.is_enabled(DEBUG)
+
+    def test_per_module_level(self, registry):
+        """前方一致でモジュール別にレベルを設定できる"""
+        game_state = registry.get_tracer("engine.game_state")
+        enemy = registry.get_tracer("engine.enemy_system")
+        registry.set_level("engine", INFO)
+        registry.set_level("engine.game_state", DEBUG)
+
+        game_state.debug("gs")
+        enemy.debug("enemy-debug")
+        enemy.info("enemy-info")
+
+        assert registry.lines == ["gs", "enemy-info"]
+
+    def test_configure_spec(self, registry):
+        """設定文字列を適用できる"""
+        tracer = registry.get_tracer("stage_validator.pathfinding")
+        registry.configure("stage_validator=debug, engine=off")
+
+        assert tracer.is_enabled(DEBUG)
+        assert not registry.get_tracer("engine.api").is_enabled(WARNING)
+        with pytest.raises(ValueError):
+            registry.configure("engine=verbose")
+
+    def test_capture_ring_buffer(self, registry):
+        """キャプチャは出力せず直近の件数のみ保持する"""
+        tracer = registry.get_tracer("engine.game_state")
+        registry.enable_capture(size=3)
+        arg = _Lazy()
+        for i in range(5):
+            tracer.debug("turn %s %s", i, arg)
+
+        assert registry.lines == []
+        assert arg.formatted == 0
+        assert [record[4][0] for record in registry.get_captured()] == [2, 3, 4]
+        assert registry.dump_capture()[-1] == "[engine.game_state] turn 4 lazy"
+
+        registry.disable_capture()
+        assert registry.get_captured() == []
+        assert not tracer.is_enabled(DEBUG)
+
+    def test_reset(self, registry):
+        """resetで既定値に戻る"""
+        tracer = registry.get_tracer("engine.game_state")
+        registry.set_level(None, DEBUG)
+        registry.enable_capture()
+        registry.reset()
+
+        assert tracer.threshold == WARNING
+        assert registry.get_captured() == []
+        registry.set_level(None, OFF)
+        assert not tracer.is_enabled(WARNING)
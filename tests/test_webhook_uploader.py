@@ -4,9 +4,12 @@ Webhook Uploader テストスイート
 """
 
 import pytest
+import gzip
 import json
 import tempfile
 import shutil
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from datetime import datetime
 from unittest.mock import Mock, patch, MagicMock
@@ -155,26 +158,26 @@ class TestWebhookUploader:
         assert stats['failed_uploads'] == 0
     
     def test_convert_entry_to_webhook_data(self, uploader, sample_log_entries):
-        """ログエントリのWebhookデータ変換テスト"""
+        """ログエントリのWebhookデータ変換テスト（セッション用7項目）"""
         entry = sample_log_entries[0]
         webhook_data = uploader._convert_entry_to_webhook_data(entry, "123456A")
         
-        assert webhook_data['student_id'] == "123456A"
-        assert webhook_data['session_id'] == entry.session_id
-        assert webhook_data['stage'] == "stage01"
-        assert webhook_data['level'] == 1
-        assert webhook_data['hp'] == 100
-        assert webhook_data['position_x'] == 0
-        assert webhook_data['position_y'] == 0
-        assert webhook_data['action_type'] == "move"
-        assert webhook_data['log_level'] == "INFO"
+        assert webhook_data == {
+            'student_id': "123456A",
+            'stage_id': "stage01",
+            'end_time': entry.timestamp.isoformat(),
+            'solve_code': '',
+            'completed_successfully': '',
+            'action_count': '',
+            'code_lines': ''
+        }
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_upload_session_logs_success(self, mock_post, uploader, sample_log_entries):
         """セッションログアップロード成功テスト"""
         # モックレスポンス設定
-        mock_response = Mock()
-        mock_response.status_code = 200
+        mock_response = Mock(status_code=200, headers={})
+        mock_response.json.return_value = {"success": True}
         mock_post.return_value = mock_response
         
         result = uploader.upload_session_logs(sample_log_entries)
@@ -185,11 +188,14 @@ class TestWebhookUploader:
         assert result['total_count'] == 5
         assert mock_post.call_count == 5
     
-    @patch('requests.post')
-    def test_upload_session_logs_partial_failure(self, mock_post, uploader, sample_log_entries):
+    @patch('requests.Session.post')
+    def test_upload_session_logs_partial_failure(self, mock_post, mock_config_manager, sample_log_entries):
         """セッションログアップロード部分失敗テスト"""
-        # 3回目の呼び出しで失敗させる
-        mock_responses = [Mock(status_code=200) for _ in range(5)]
+        # 送信順を固定し、再試行せずに3回目の呼び出しで失敗させる
+        uploader = WebhookUploader(mock_config_manager, upload_options={'max_workers': 1, 'max_retries': 0})
+        mock_responses = [Mock(status_code=200, headers={}) for _ in range(5)]
+        for mock_response in mock_responses:
+            mock_response.json.return_value = {"success": True}
         mock_responses[2].status_code = 500  # 3回目を失敗に
         mock_post.side_effect = mock_responses
         
@@ -201,6 +207,19 @@ class TestWebhookUploader:
         assert result['total_count'] == 5
         assert 'error' in result
     
+    @patch('requests.Session.post')
+    def test_rejected_entry_is_not_resent(self, mock_post, uploader, sample_log_entries):
+        """失敗箇所を示さないerror応答は拒否として扱い、再送しない"""
+        mock_response = Mock(status_code=200, headers={})
+        mock_response.json.return_value = {"error": "無効なログデータです"}
+        mock_post.return_value = mock_response
+        
+        result = uploader.upload_session_logs(sample_log_entries[:1])
+        
+        assert result['success'] is False
+        assert result['failed_count'] == 1
+        mock_post.assert_called_once()
+    
     def test_upload_empty_entries(self, uploader):
         """空のエントリリストのアップロードテスト"""
         result = uploader.upload_session_logs([])
@@ -220,11 +239,11 @@ class TestWebhookUploader:
         with pytest.raises(WebhookUploadError):
             uploader.upload_session_logs([Mock()])
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_webhook_connection_test_success(self, mock_post, uploader):
         """Webhook接続テスト成功"""
-        mock_response = Mock()
-        mock_response.status_code = 200
+        mock_response = Mock(status_code=200, headers={})
+        mock_response.json.return_value = {"success": True}
         mock_post.return_value = mock_response
         
         success, message = uploader.test_webhook_connection()
@@ -233,11 +252,11 @@ class TestWebhookUploader:
         assert "成功" in message
         mock_post.assert_called_once()
     
-    @patch('requests.post')
+    @patch('requests.Session.post')
     def test_webhook_connection_test_failure(self, mock_post, uploader):
         """Webhook接続テスト失敗"""
-        mock_response = Mock()
-        mock_response.status_code = 500
+        mock_response = Mock(status_code=500, headers={})
+        mock_response.json.return_value = {"success": False, "error": "Internal Server Error"}
         mock_post.return_value = mock_response
         
         success, message = uploader.test_webhook_connection()
@@ -257,6 +276,202 @@ class TestWebhookUploader:
         assert stats['successful_uploads'] == 0
 
 
+class StandInWebhookServer:
+    """Webhookエンドポイントの代替となるローカルHTTPサーバー"""
+    
+    def __init__(self, fail_first: int = 0, fail_status: int = 503, reject=None):
+        self.requests = []
+        self.fail_first = fail_first
+        self.fail_status = fail_status
+        # action_count -> 記録に失敗させる残り回数（Code.gsと同じくHTTP 200で失敗を返す）
+        self.reject = dict(reject or {})
+        self.lock = threading.Lock()
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'  # Keep-Alive
+            
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers['Content-Length']))
+                if self.headers.get('Content-Encoding') == 'gzip':
+                    body = gzip.decompress(body)
+                payload = json.loads(body.decode('utf-8'))
+                with server.lock:
+                    server.requests.append({
+                        'payload': payload,
+                        'gzip': self.headers.get('Content-Encoding') == 'gzip',
+                        'client_port': self.client_address[1]
+                    })
+                    failing = len(server.requests) <= server.fail_first
+                    errors = []
+                    if not failing:
+                        for index, entry in enumerate(payload.get('entries', [payload])):
+                            if server.reject.get(entry['action_count'], 0) > 0:
+                                server.reject[entry['action_count']] -= 1
+                                errors.append({'index': index, 'error': 'シートがロックされています'})
+                status = server.fail_status if failing else 200
+                if not errors:
+                    data = {'success': True}
+                elif 'entries' in payload:
+                    data = {'success': False, 'recorded': len(payload['entries']) - len(errors),
+                            'failed_indices': [error['index'] for error in errors], 'errors': errors}
+                else:
+                    data = {'success': False, 'error': errors[0]['error']}
+                response = json.dumps(data).encode('utf-8')
+                self.send_response(status)
+                if failing:
+                    self.send_header('Retry-After', '0')
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(response)))
+                self.end_headers()
+                self.wfile.write(response)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/macros/s/TEST/exec"
+    
+    def entries(self):
+        """受信したエントリ（一括送信を展開）"""
+        result = []
+        for request in self.requests:
+            result.extend(request['payload'].get('entries', [request['payload']]))
+        return result
+    
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class TestWebhookUploaderLocalServer:
+    """ローカル代替サーバーに対するWebhookUploaderテスト"""
+    
+    @pytest.fixture
+    def sample_log_entries(self):
+        """サンプルログエントリ"""
+        session_id = str(uuid.uuid4())
+        return [
+            StudentLogEntry(
+                student_id="123456A",
+                session_id=session_id,
+                stage="stage01",
+                timestamp=datetime.now(),
+                level=1,
+                hp=100,
+                max_hp=100,
+                position=(i, 0),
+                score=0,
+                action_type="session_end",
+                solve_code="# ログ\nturn_right()",
+                completed_successfully=i % 2 == 0,
+                action_count=i,
+                code_lines=2
+            )
+            for i in range(8)
+        ]
+    
+    def _make_uploader(self, server, **options):
+        config = Mock()
+        config.get_webhook_url.return_value = server.url
+        config.get_student_id.return_value = "123456A"
+        config.is_configured.return_value = True
+        options.setdefault('backoff_base_seconds', 0.01)
+        return WebhookUploader(config, upload_options=options)
+    
+    def test_pooled_connections_are_reused(self, sample_log_entries):
+        """逐次送信では1本の接続が使い回される"""
+        server = StandInWebhookServer()
+        try:
+            with self._make_uploader(server, max_workers=1) as uploader:
+                result = uploader.upload_session_logs(sample_log_entries)
+        finally:
+            server.close()
+        
+        assert result['success'] is True
+        assert result['uploaded_count'] == 8
+        assert len(server.requests) == 8
+        assert len({request['client_port'] for request in server.requests}) == 1
+        assert [entry['action_count'] for entry in server.entries()] == list(range(8))
+    
+    def test_concurrent_batched_gzip_upload(self, sample_log_entries):
+        """並行・一括・gzip送信で全エントリが1回ずつ届く"""
+        server = StandInWebhookServer()
+        progress = []
+        try:
+            with self._make_uploader(server, max_workers=3, batch_size=3, gzip=True) as uploader:
+                result = uploader.upload_session_logs(
+                    sample_log_entries, progress_callback=lambda p, msg: progress.append(p))
+        finally:
+            server.close()
+        
+        assert result['success'] is True
+        assert result['uploaded_count'] == 8
+        assert len(server.requests) == 3  # 3 + 3 + 2
+        assert all(request['gzip'] for request in server.requests)
+        assert sorted(entry['action_count'] for entry in server.entries()) == list(range(8))
+        assert progress[-1] == 100.0
+        assert progress == sorted(progress)
+    
+    def test_retry_with_backoff_on_throttling(self, sample_log_entries):
+        """429応答は再試行され、再試行回数を超えたものだけが失敗になる"""
+        server = StandInWebhookServer(fail_first=2, fail_status=429)
+        try:
+            with self._make_uploader(server, max_workers=1) as uploader:
+                result = uploader.upload_session_logs(sample_log_entries[:3])
+        finally:
+            server.close()
+        assert result['success'] is True
+        assert len(server.requests) == 5
+        
+        server = StandInWebhookServer(fail_first=100, fail_status=503)
+        try:
+            with self._make_uploader(server, max_workers=1, max_retries=2) as uploader:
+                result = uploader.upload_session_logs(sample_log_entries[:1])
+                stats = uploader.get_statistics()
+        finally:
+            server.close()
+        assert result['success'] is False
+        assert result['failed_count'] == 1
+        assert len(server.requests) == 3
+        assert stats['failed_uploads'] == 1
+    
+    def test_only_failed_entries_are_resent(self, sample_log_entries):
+        """HTTP 200でも記録に失敗したエントリは失敗として数え、そのエントリだけを再送する"""
+        server = StandInWebhookServer(reject={1: 1, 6: 100})
+        try:
+            with self._make_uploader(server, max_workers=2, batch_size=4, max_retries=2) as uploader:
+                result = uploader.upload_session_logs(sample_log_entries)
+        finally:
+            server.close()
+        
+        assert result['success'] is False
+        assert result['uploaded_count'] == 7
+        assert result['failed_count'] == 1
+        sent = [entry['action_count'] for entry in server.entries()]
+        # 再送は失敗したエントリだけ（1件送信のerror応答は拒否として再送しない）
+        assert sorted(sent) == [0, 1, 1, 2, 3, 4, 5, 6, 6, 7]
+        assert sorted(len(request['payload'].get('entries', [None])) for request in server.requests) == [1, 1, 4, 4]
+    
+    def test_upload_options_from_config(self):
+        """設定ファイルのupload_optionsが反映される"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config_file = Path(temp_dir) / "webhook_config.json"
+            config_file.write_text(json.dumps({
+                'upload_options': {'max_workers': 2, 'batch_size': 5, 'unknown': 1}
+            }), encoding='utf-8')
+            
+            config_manager = WebhookConfigManager(str(config_file))
+            assert config_manager.get_upload_options() == {'max_workers': 2, 'batch_size': 5}
+            
+            with WebhookUploader(config_manager) as uploader:
+                assert uploader.options['max_workers'] == 2
+                assert uploader.options['batch_size'] == 5
+                assert uploader.options['gzip'] is False
+
+
 class TestWebhookIntegration:
     """Webhook統合テスト"""
     
@@ -0,0 +1,96 @@
+"""
+Unit tests for StagePathfinder successor generation
+
+敵状態のコピーオンライトと1ステップ後続状態キャッシュをテストする。
+"""
+
+import pytest
+
+# プロジェクトルートをパスに追加
+import sys
+import os
+project_root = os.path.join(os.path.dirname(__file__), '..', '..')
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+import yaml
+
+from src.stage_generator.data_models import StageConfiguration
+from src.stage_validator.pathfinding import StagePathfinder, GameState, EnemyState, ActionType
+
+
+@pytest.fixture
+def patrol_pathfinder():
+    """巡回敵を含むstage12のPathfinder"""
+    stage_path = os.path.join(project_root, 'stages', 'stage12.yml')
+    with open(stage_path, 'r', encoding='utf-8') as f:
+        stage_config = StageConfiguration.from_dict(yaml.safe_load(f))
+    return StagePathfinder(stage_config)
+
+
+def _start_state(pathfinder):
+    stage = pathfinder.stage
+    return GameState(
+        player_pos=tuple(stage.player.start),
+        player_dir=stage.player.direction,
+        player_hp=stage.player.hp,
+        enemies={
+            enemy.id: EnemyState(
+                position=tuple(enemy.position),
+                direction=enemy.direction,
+                hp=enemy.hp,
+                max_hp=enemy.max_hp,
+                attack_power=enemy.attack_power,
+                behavior=enemy.behavior,
+                enemy_type=getattr(enemy, 'type', 'normal'),
+                patrol_path=[tuple(pos) for pos in enemy.patrol_path] if enemy.patrol_path else None,
+                patrol_index=pathfinder._calculate_initial_patrol_index(enemy),
+                vision_range=enemy.vision_range
+            )
+            for enemy in stage.enemies
+        },
+        collected_items=set(),
+        turn_count=0
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.validator
+class TestPathfinderSuccessors:
+    """後続状態生成テスト"""
+
+    def test_apply_action_does_not_mutate_parent(self, patrol_pathfinder):
+        """Given a parent state, when actions are applied, then parent enemies are untouched"""
+        state = _start_state(patrol_pathfinder)
+        before = {enemy_id: (e.position, e.direction, e.patrol_index, e.is_alert)
+                  for enemy_id, e in state.enemies.items()}
+
+        for action in patrol_pathfinder._get_valid_actions(state):
+            patrol_pathfinder._apply_action(state, action)
+
+        after = {enemy_id: (e.position, e.direction, e.patrol_index, e.is_alert)
+                 for enemy_id, e in state.enemies.items()}
+        assert after == before
+
+    def test_unchanged_enemies_are_shared(self, patrol_pathfinder):
+        """Given an enemy the AI leaves untouched, when an action is applied, then the object is shared"""
+        state = _start_state(patrol_pathfinder)
+        new_state = patrol_pathfinder._apply_action(state, ActionType.WAIT)
+
+        assert new_state is not None
+        for enemy_id, enemy in new_state.enemies.items():
+            if enemy == state.enemies[enemy_id]:
+                assert enemy is state.enemies[enemy_id]
+            else:
+                assert enemy is not state.enemies[enemy_id]
+
+    def test_successors_are_cached_per_state(self, patrol_pathfinder):
+        """Given the same state object, when successors are requested twice, then they are computed once"""
+        state = _start_state(patrol_pathfinder)
+
+        first = patrol_pathfinder._get_successors(state)
+        assert patrol_pathfinder._get_successors(state) is first
+        assert [action for action, _ in first] == patrol_pathfinder._get_valid_actions(state)
+
+        other = _start_state(patrol_pathfinder)
+        assert patrol_pathfinder._get_successors(other) is not first
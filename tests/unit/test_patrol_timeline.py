@@ -0,0 +1,86 @@
+"""
+Unit tests for PatrolTimeline and vision bitmaps
+
+巡回スケジュール表と視界ビットマップが逐次シミュレーションと一致することをテストする。
+"""
+
+import pytest
+
+# プロジェクトルートをパスに追加
+import sys
+import os
+project_root = os.path.join(os.path.dirname(__file__), '..', '..')
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+import yaml
+
+from src.stage_generator.data_models import StageConfiguration
+from src.stage_validator.pathfinding import StagePathfinder, PatrolTimeline
+
+
+@pytest.fixture
+def patrol_pathfinder():
+    """巡回敵を含むstage12のPathfinder"""
+    stage_path = os.path.join(project_root, 'stages', 'stage12.yml')
+    with open(stage_path, 'r', encoding='utf-8') as f:
+        stage_config = StageConfiguration.from_dict(yaml.safe_load(f))
+    return StagePathfinder(stage_config)
+
+
+def _open_5x5(pos):
+    return 0 <= pos[0] < 5 and 0 <= pos[1] < 5 and pos != (2, 2)
+
+
+@pytest.mark.unit
+@pytest.mark.validator
+class TestPatrolTimeline:
+    """巡回スケジュール表テスト"""
+
+    def test_cycle_returns_to_start(self):
+        """Given a square patrol path, when precomputed, then the cycle closes on the start pose"""
+        timeline = PatrolTimeline(((0, 0), (3, 0), (3, 3), (0, 3)), _open_5x5)
+        cycle = timeline.precompute(((0, 0), "E", 0))
+
+        assert cycle[0] == ((0, 0), "E", 0)
+        assert timeline.step(cycle[-1])[0] == cycle[0]
+        # 3 moves per side + 1 turn at each corner
+        assert len(cycle) == 16
+
+    def test_blocked_step(self):
+        """Given the player on the next cell, when stepping, then the enemy keeps its pose"""
+        timeline = PatrolTimeline(((0, 0), (3, 0)), _open_5x5)
+
+        moved, blocked, target = timeline.step(((0, 0), "E", 0))
+        assert moved == ((1, 0), "E", 0)
+        assert blocked == ((0, 0), "E", 0)
+        assert target == (1, 0)
+
+        turned, turned_blocked, target = timeline.step(((0, 0), "N", 0))
+        assert turned == turned_blocked == ((0, 0), "E", 0)
+        assert target is None
+
+    def test_precomputed_for_stage_enemies(self, patrol_pathfinder):
+        """Given a patrol stage, when the pathfinder is built, then the calm cycle is already tabulated"""
+        patrol_enemies = [e for e in patrol_pathfinder.stage.enemies if e.behavior == "patrol"]
+        assert patrol_enemies
+        for enemy in patrol_enemies:
+            timeline = patrol_pathfinder._patrol_timeline(enemy.patrol_path)
+            assert (tuple(enemy.position), enemy.direction,
+                    patrol_pathfinder._calculate_initial_patrol_index(enemy)) in timeline.steps
+
+    def test_vision_bitmap_matches_line_of_sight(self, patrol_pathfinder):
+        """Given any pose, when the bitmap is built, then it equals the cone filtered by line of sight"""
+        pf = patrol_pathfinder
+        offsets = {"N": (0, -1), "S": (0, 1), "E": (1, 0), "W": (-1, 0)}
+        for position in [(0, 0), (3, 3), (pf.width - 1, 1)]:
+            for direction, (fx, fy) in offsets.items():
+                bitmap = pf._vision_bitmap(position, direction, 3)
+                for y in range(pf.height):
+                    for x in range(pf.width):
+                        # Distance along facing direction and sideways offset
+                        forward = (x - position[0]) * fx + (y - position[1]) * fy
+                        side = abs((x - position[0]) * fy) + abs((y - position[1]) * fx)
+                        expected = (1 <= forward <= 3 and side <= forward
+                                    and pf._has_line_of_sight(position, (x, y)))
+                        assert bool(bitmap >> (y * pf.width + x) & 1) == expected
@@ -0,0 +1,89 @@
+"""
+Unit tests for PortfolioRunner
+
+複数戦略の並列実行（最初の解が採用され、他は打ち切られる）をテストする。
+"""
+
+import pytest
+
+# プロジェクトルートをパスに追加
+import sys
+import os
+project_root = os.path.join(os.path.dirname(__file__), '..', '..')
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+import time
+
+import yaml
+
+from src.stage_generator.data_models import StageConfiguration
+from stage_validator.pathfinding import StagePathfinder
+from stage_validator.portfolio import PortfolioRunner, STRATEGIES
+
+
+def _load_stage(stage_id, grid=None):
+    stage_path = os.path.join(project_root, 'stages', f'{stage_id}.yml')
+    with open(stage_path, 'r', encoding='utf-8') as f:
+        data = yaml.safe_load(f)
+    if grid is not None:
+        data['board']['grid'] = grid
+    return StageConfiguration.from_dict(data)
+
+
+def _never_finishes(stage, max_nodes):
+    """A strategy that only ends when the runner terminates it"""
+    time.sleep(600)
+
+
+@pytest.mark.unit
+@pytest.mark.validator
+class TestPortfolioRunner:
+    """ポートフォリオ探索テスト"""
+
+    def test_first_solution_wins(self):
+        """Given all strategies, when racing a simple stage, then a verified solution is returned"""
+        stage = _load_stage('stage01')
+        result = PortfolioRunner(timeout_seconds=60).run(stage)
+
+        assert result.success
+        assert result.winner in STRATEGIES
+        assert result.outcomes[result.winner] == "solved"
+        assert set(result.outcomes) == set(STRATEGIES)
+        assert StagePathfinder(stage).test_specific_solution(result.solution_path)
+
+    def test_weighted_astar_path_is_valid(self):
+        """Given a combat stage, when weighted A* runs alone, then its path replays to the goal"""
+        stage = _load_stage('stage06')
+        result = PortfolioRunner(strategies=["weighted_astar"], timeout_seconds=60).run(stage)
+
+        assert result.winner == "weighted_astar"
+        assert StagePathfinder(stage).test_specific_solution(result.solution_path)
+
+    def test_timeout_cancels_workers(self):
+        """Given a tiny budget, when racing a hard stage, then every strategy is reported as timed out"""
+        result = PortfolioRunner(strategies=["astar", "iterative_deepening"], timeout_seconds=0.5).run(
+            _load_stage('stage11'))
+
+        assert result.timed_out
+        assert not result.success
+        assert result.outcomes == {"astar": "timeout", "iterative_deepening": "timeout"}
+
+    def test_exhausted_astar_settles_unsolvable_stage(self, monkeypatch):
+        """Given a walled-off goal, when A* exhausts the search, then the stage is reported unsolvable and the rest are cancelled"""
+        monkeypatch.setitem(STRATEGIES, "never_finishes", _never_finishes)
+        stage = _load_stage('stage01', grid=[".....", ".....", "..#..", "....#", "...#."])
+
+        result = PortfolioRunner(strategies=["astar", "never_finishes"], timeout_seconds=60).run(stage)
+
+        assert result.unsolvable
+        assert not result.success
+        assert not result.timed_out
+        assert result.winner == "astar"
+        assert result.outcomes == {"astar": "unsolvable", "never_finishes": "cancelled"}
+        assert result.elapsed < 30
+
+    def test_unknown_strategy(self):
+        """Given an unknown strategy name, when constructing the runner, then raises ValueError"""
+        with pytest.raises(ValueError):
+            PortfolioRunner(strategies=["astar", "dfs"])
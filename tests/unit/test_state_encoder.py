@@ -0,0 +1,97 @@
+"""
+Unit tests for StateEncoder
+
+A*探索の状態キー（整数エンコード）の往復変換と一意性をテストする。
+"""
+
+import pytest
+
+# プロジェクトルートをパスに追加
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+
+from src.stage_validator.pathfinding import StateEncoder, GameState, EnemyState
+
+
+def _make_state(**overrides):
+    enemies = {
+        "guard": EnemyState(
+            position=(3, 1), direction="W", hp=50, max_hp=50, attack_power=20,
+            behavior="patrol", enemy_type="normal",
+            patrol_path=[(3, 1), (3, 3), (1, 3)], patrol_index=0, vision_range=3
+        ),
+        "boss": EnemyState(
+            position=(0, 4), direction="N", hp=200, max_hp=200, attack_power=40,
+            behavior="static", enemy_type="large_2x2", vision_range=2
+        ),
+    }
+    values = dict(
+        player_pos=(1, 1), player_dir="E", player_hp=100, enemies=enemies,
+        collected_items=set(), turn_count=0, disposed_items=set()
+    )
+    values.update(overrides)
+    return GameState(**values)
+
+
+@pytest.mark.unit
+@pytest.mark.validator
+class TestStateEncoder:
+    """StateEncoder テスト"""
+
+    def test_round_trip(self):
+        """Given a state, when encoded and decoded, then all fields are restored"""
+        start = _make_state()
+        encoder = StateEncoder(6, 6, start, ["key", "bomb"])
+
+        state = _make_state(player_pos=(5, 5), player_dir="S", player_hp=37,
+                            collected_items={"key"}, disposed_items={"bomb"}, turn_count=123)
+        guard = state.enemies["guard"]
+        guard.position = (2, 3)
+        guard.hp = 10
+        guard.is_alert = True
+        guard.alert_cooldown = 7
+        guard.last_seen_player = (5, 4)
+        guard.patrol_index = 2
+        guard.target_direction = "E"
+        state.enemies["boss"].is_alive = False
+        state.enemies["boss"].hp = 0
+
+        decoded = encoder.decode(encoder.encode(state))
+
+        assert decoded == state
+        assert list(decoded.enemies.keys()) == ["guard", "boss"]
+
+    def test_keys_distinguish_states(self):
+        """Given states differing in one field, when encoded, then keys differ"""
+        start = _make_state()
+        encoder = StateEncoder(6, 6, start, ["key"])
+
+        base_key = encoder.encode(start)
+        assert encoder.encode(_make_state()) == base_key
+        assert encoder.encode(_make_state(turn_count=1)) != base_key
+        assert encoder.encode(_make_state(player_hp=99)) != base_key
+        assert encoder.encode(_make_state(collected_items={"key"})) != base_key
+
+        alerted = _make_state()
+        alerted.enemies["guard"].is_alert = True
+        assert encoder.encode(alerted) != base_key
+
+    def test_attacked_enemy_type_is_encodable(self):
+        """Given an enemy rebuilt with the default type, when encoded, then type is kept"""
+        start = _make_state()
+        encoder = StateEncoder(6, 6, start, [])
+
+        state = _make_state()
+        state.enemies["boss"].enemy_type = "normal"
+
+        assert encoder.decode(encoder.encode(state)).enemies["boss"].enemy_type == "normal"
+
+    def test_out_of_range_value_raises(self):
+        """Given a value wider than its field, when encoded, then raises ValueError"""
+        start = _make_state()
+        encoder = StateEncoder(6, 6, start, [])
+
+        with pytest.raises(ValueError):
+            encoder.encode(_make_state(player_hp=-1))
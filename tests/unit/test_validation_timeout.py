@@ -0,0 +1,55 @@
+"""
+Unit tests for validation timeout enforcement
+
+StageValidator の timeout_seconds が A* 探索に適用されることをテストする。
+"""
+
+import pytest
+
+# プロジェクトルートをパスに追加
+import sys
+import os
+project_root = os.path.join(os.path.dirname(__file__), '..', '..')
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, 'src'))
+
+import yaml
+
+from src.stage_generator.data_models import StageConfiguration
+from src.stage_validator.pathfinding import StagePathfinder
+from src.stage_validator.validator import StageValidator
+# pathfinding は stage_validator パッケージとして例外を import している
+from stage_validator.validation_models import PathfindingTimeoutError
+
+
+def _load_stage(stage_id):
+    stage_path = os.path.join(project_root, 'stages', f'{stage_id}.yml')
+    with open(stage_path, 'r', encoding='utf-8') as f:
+        return StageConfiguration.from_dict(yaml.safe_load(f))
+
+
+@pytest.mark.unit
+@pytest.mark.validator
+class TestValidationTimeout:
+    """探索タイムアウトテスト"""
+
+    def test_find_path_raises_after_deadline(self):
+        """Given an exhausted budget, when searching a large stage, then PathfindingTimeoutError is raised"""
+        pathfinder = StagePathfinder(_load_stage('stage11'))
+
+        with pytest.raises(PathfindingTimeoutError):
+            pathfinder.find_path(timeout_seconds=0)
+
+    def test_validator_reports_timeout(self):
+        """Given a zero timeout, when validating, then the result reports the timeout"""
+        result = StageValidator(timeout_seconds=0).validate_stage(_load_stage('stage11'))
+
+        assert not result.success
+        assert result.error_details.startswith("Validation timed out")
+
+    def test_small_stage_within_timeout(self):
+        """Given a generous timeout, when validating a small stage, then a path is found"""
+        result = StageValidator(timeout_seconds=30).validate_stage(_load_stage('stage01'))
+
+        assert result.success
+        assert result.solution_length == 10